@@ -6,6 +6,7 @@ Provides both web interface and MCP server for LLM integration.
 """
 
 import logging
+import os
 import sys
 
 __version__ = "1.0.0"
@@ -19,9 +20,19 @@ def configure_logging():
 
     Ensures all logging.getLogger(__name__) calls also use stderr,
     maintaining backward compatibility with existing logging code.
+
+    Idempotent: when every root handler already writes to stderr there is
+    nothing to fix, so repeated calls (e.g. re-imports in worker processes)
+    leave the handlers untouched.
     """
-    # Remove any existing handlers
     root = logging.getLogger()
+    if root.handlers and all(
+        isinstance(handler, logging.StreamHandler) and handler.stream is sys.stderr
+        for handler in root.handlers
+    ):
+        return
+
+    # Remove any existing handlers
     for handler in root.handlers[:]:
         root.removeHandler(handler)
 
@@ -34,5 +45,6 @@ def configure_logging():
     root.setLevel(logging.INFO)
 
 
-# Configure on module import
-configure_logging()
+# Configure on module import; child processes may opt out with APP_CONFIGURE_LOGGING=0
+if os.environ.get("APP_CONFIGURE_LOGGING", "1") == "1":
+    configure_logging()
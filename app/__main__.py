@@ -0,0 +1,87 @@
+"""
+AI: Console entry point for ``logminer`` and ``python -m app``.
+
+A plain ``--mcp-stdio`` launch (as configured in .vscode/mcp.json) only needs
+the database name, so it is served without Click, pydantic-settings and
+configuration validation. Every other command line goes through app.main.cli.
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Same default as the --db-name Click option
+DEFAULT_DB_NAME = "log_analysis.db"
+
+
+def _stdio_db_name(argv: List[str]) -> Optional[str]:
+    """
+    AI: Return the database name when argv is a plain stdio launch.
+
+    Args:
+        argv: Command line arguments without the program name
+
+    Returns:
+        Database name for ``--mcp-stdio [--db-name NAME]``, or None when any
+        other option is present and the full CLI has to handle the call
+    """
+    if "--mcp-stdio" not in argv:
+        return None
+
+    db_name = DEFAULT_DB_NAME
+    args = iter(argv)
+    for arg in args:
+        if arg == "--mcp-stdio":
+            continue
+        if arg == "--db-name":
+            value = next(args, None)
+            if value is None:
+                return None  # Let Click report the missing value
+            db_name = value
+        elif arg.startswith("--db-name="):
+            db_name = arg[len("--db-name="):]
+        else:
+            return None
+    return db_name
+
+
+def run_stdio_server(db_name: str) -> None:
+    """
+    AI: Serve MCP over stdio for an existing database.
+
+    Args:
+        db_name: SQLite database filename
+    """
+    from .utils.logger import logger
+
+    if not Path(db_name).exists():
+        logger.error("❌ Database not found: %s", db_name)
+        logger.info("💡 Run with --process-logs first to create and populate the database")
+        sys.exit(1)
+
+    from .database.connection import DatabaseConnection
+    from .database.operations import DatabaseOperations
+    from .mcp.server import create_stdio_server
+
+    try:
+        db_connection = DatabaseConnection(db_name, fresh_start=False)
+    except RuntimeError as e:  # Outdated schema
+        logger.error("❌ %s", e)
+        sys.exit(1)
+    db_ops = DatabaseOperations(db_connection)
+    create_stdio_server(db_ops).start()
+
+
+def main() -> None:
+    """AI: Run the stdio fast path when possible, otherwise the Click CLI."""
+    db_name = _stdio_db_name(sys.argv[1:])
+    if db_name is not None:
+        run_stdio_server(db_name)
+        return
+
+    from .main import cli
+    cli()
+
+
+if __name__ == "__main__":
+    main()
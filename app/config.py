@@ -3,22 +3,52 @@ AI: Configuration management with CLI arguments and environment variable support
 
 This module provides comprehensive configuration management following the ADR decisions:
 - Pydantic-based settings with validation
-- CLI argument parsing with Click
-- Environment file support with python-dotenv
+- Environment file support with python-dotenv (loaded by pydantic-settings)
 - Configuration validation with meaningful error messages
 """
 
 import os
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
-import click
 from pydantic import Field, field_validator, ConfigDict
 from pydantic_settings import BaseSettings
 
 from .utils.logger import logger
 
 
+@lru_cache(maxsize=32)
+def _split_patterns(pattern: str) -> List[str]:
+    """
+    AI: Split a comma-separated pattern string into a list of glob patterns.
+
+    Cached on the string itself, so reassigning a pattern field on Settings
+    is picked up on the next access. The returned list is shared; do not
+    modify it.
+    """
+    return [p.strip() for p in pattern.split(',') if p.strip()]
+
+
+def _check_directory(v: str) -> str:
+    """
+    AI: Validate that a directory exists and is readable.
+
+    Existence and type come from a single os.stat call.
+    """
+    path = Path(v)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise ValueError(f"Directory does not exist: {v}")
+    if not stat.S_ISDIR(st.st_mode):
+        raise ValueError(f"Path is not a directory: {v}")
+    if not os.access(path, os.R_OK):
+        raise ValueError(f"Directory is not readable: {v}")
+    return str(path.absolute())
+
+
 class Settings(BaseSettings):
     """
     AI: Application configuration with validation and environment support.
@@ -60,6 +90,20 @@ class Settings(BaseSettings):
     # Processing mode
     process_only: bool = Field(default=False, description="Process logs and exit without starting web server")
     
+    # Optional Parquet archive for analytics (requires the 'analytics' extra)
+    parquet_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for a Parquet copy of ingested nginx logs used by DuckDB analytics"
+    )
+    capture_raw_log: bool = Field(
+        default=True,
+        description="Store the original log line (raw_log) with every ingested row"
+    )
+    archive_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory keeping archive extractions so unchanged archives are not re-extracted"
+    )
+    
     model_config = ConfigDict(
         env_file=".env",
         case_sensitive=False,
@@ -70,14 +114,7 @@ class Settings(BaseSettings):
     @classmethod
     def validate_directories(cls, v: str) -> str:
         """AI: Validate that directories exist and are readable."""
-        path = Path(v)
-        if not path.exists():
-            raise ValueError(f"Directory does not exist: {v}")
-        if not path.is_dir():
-            raise ValueError(f"Path is not a directory: {v}")
-        if not os.access(path, os.R_OK):
-            raise ValueError(f"Directory is not readable: {v}")
-        return str(path.absolute())
+        return _check_directory(v)
 
     @field_validator('db_name')
     @classmethod
@@ -86,7 +123,9 @@ class Settings(BaseSettings):
         db_path = Path(v)
         parent_dir = db_path.parent if db_path.parent != Path('.') else Path.cwd()
         
-        if not parent_dir.exists():
+        try:
+            os.stat(parent_dir)
+        except FileNotFoundError:
             raise ValueError(f"Database directory does not exist: {parent_dir}")
         if not os.access(parent_dir, os.W_OK):
             raise ValueError(f"Database directory is not writable: {parent_dir}")
@@ -110,13 +149,33 @@ class Settings(BaseSettings):
 
     @property
     def nexus_patterns(self) -> List[str]:
-        """AI: Convert nexus pattern string to list for processing."""
-        return [p.strip() for p in self.nexus_pattern.split(',') if p.strip()]
+        """AI: Convert nexus pattern string to list for processing (parsed once per distinct string)."""
+        return _split_patterns(self.nexus_pattern)
 
     @property
     def nginx_patterns(self) -> List[str]:
-        """AI: Convert nginx pattern string to list for processing."""
-        return [p.strip() for p in self.nginx_pattern.split(',') if p.strip()]
+        """AI: Convert nginx pattern string to list for processing (parsed once per distinct string)."""
+        return _split_patterns(self.nginx_pattern)
+
+
+@lru_cache(maxsize=32)
+def _validated_settings(frozen_kwargs: Tuple[Tuple[str, Any], ...]) -> Settings:
+    """
+    AI: Build and validate Settings once per distinct set of CLI arguments.
+
+    The cache key is the sorted tuple of explicit arguments, so repeated
+    load_settings() calls with identical arguments reuse one validated
+    instance; load_settings() hands out copies, never this instance.
+    Failed validations raise and are therefore never cached. Environment
+    and .env values are frozen at the first call; use clear_settings_cache()
+    after changing them.
+    """
+    return Settings(**dict(frozen_kwargs))
+
+
+def clear_settings_cache() -> None:
+    """AI: Drop cached Settings instances so the next load revalidates."""
+    _validated_settings.cache_clear()
 
 
 def load_settings(
@@ -132,6 +191,7 @@ def load_settings(
     line_buffer_size: Optional[int] = None,
     max_archive_depth: Optional[int] = None,
     process_only: Optional[bool] = None,
+    bypass_validators: bool = False,
 ) -> Settings:
     """
     AI: Load configuration from CLI arguments, environment, and .env file.
@@ -144,44 +204,33 @@ def load_settings(
     
     Args:
         All CLI arguments as optional parameters
+        bypass_validators: Skip Pydantic validation and environment loading via
+            Settings.model_construct(). Only for trusted, already-validated
+            values (e.g. reloading a configuration that passed validation before);
+            omitted fields fall back to their declared defaults.
         
     Returns:
-        Validated Settings instance
+        Validated Settings instance, a private copy the caller may modify.
+        Environment and .env values are read once per distinct set of
+        arguments until clear_settings_cache() is called.
         
     Raises:
         ValueError: When configuration validation fails
     """
-    # Build kwargs from non-None CLI arguments
-    kwargs = {}
-    if nexus_dir is not None:
-        kwargs['nexus_dir'] = nexus_dir
-    if nginx_dir is not None:
-        kwargs['nginx_dir'] = nginx_dir
-    if db_name is not None:
-        kwargs['db_name'] = db_name
-    if nexus_pattern is not None:
-        kwargs['nexus_pattern'] = nexus_pattern
-    if nginx_pattern is not None:
-        kwargs['nginx_pattern'] = nginx_pattern
-    if enable_mcp_server is not None:
-        kwargs['enable_mcp_server'] = enable_mcp_server
-    if mcp_port is not None:
-        kwargs['mcp_port'] = mcp_port
-    if web_port is not None:
-        kwargs['web_port'] = web_port
-    if chunk_size is not None:
-        kwargs['chunk_size'] = chunk_size
-    if line_buffer_size is not None:
-        kwargs['line_buffer_size'] = line_buffer_size
-    if max_archive_depth is not None:
-        kwargs['max_archive_depth'] = max_archive_depth
-    if process_only is not None:
-        kwargs['process_only'] = process_only
+    # Build kwargs from non-None CLI arguments; locals() must be read first so
+    # that only the parameters are captured
+    kwargs = {k: v for k, v in locals().items() if v is not None}
+    del kwargs['bypass_validators']
+
+    if bypass_validators:
+        return Settings.model_construct(**kwargs)
     
     try:
-        return Settings(**kwargs)
+        settings = _validated_settings(tuple(sorted(kwargs.items())))
     except Exception as e:
         raise ValueError(f"Configuration validation failed: {e}")
+    # Callers attach runtime state (e.g. main's MCP server handle); keep the cached instance clean
+    return settings.model_copy()
 
 
 def validate_configuration(settings: Settings) -> None:
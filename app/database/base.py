@@ -6,22 +6,120 @@ across all log format-specific database handlers. It handles connection
 management, common queries, and schema operations.
 
 Architecture:
-- BaseLogDatabase: Abstract base for format-specific operations
+- _SessionMixin: Connection holder and the single get_session implementation
+- BaseLogDatabase: Generic base implementing format-specific operations from
+  per-format MODEL/field declarations
 - CommonLogDatabase: Shared functionality (schema, queries, stats)
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+import zlib
+from datetime import datetime
+from itertools import islice
+from typing import List, Dict, Any, Generator, Generic, Iterable, Optional, Sequence, Tuple, Type, TypeVar
+from sqlalchemy import (
+    DateTime, Integer, String, bindparam, case, func, insert, select, text, type_coerce
+)
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy.sql import Executable
 from contextlib import contextmanager
 
 from app.database.connection import DatabaseConnection
+from app.database.models import Base, decompress_raw_log
+from app.database.parquet_sink import ParquetSink
 from ..utils.logger import logger
 
 
-class BaseLogDatabase(ABC):
-    """AI: Abstract base class for format-specific database operations."""
+# SQLAlchemy model handled by a BaseLogDatabase subclass (declarative models
+# are untyped, so their columns are Any to the type checker)
+ModelT = TypeVar('ModelT', bound=Any)
+
+# Tables exposed to schema inspection and sampling
+LOG_TABLES = ('nginx_logs', 'nexus_logs')
+
+# Statements built once at import; table names come from LOG_TABLES only
+_TABLE_INFO_STMTS = {name: text(f"PRAGMA table_info({name})") for name in LOG_TABLES}
+_TABLE_SQL_STMT = text("SELECT sql FROM sqlite_master WHERE type='table' AND name = :name")
+_TABLE_SAMPLE_STMTS = {
+    name: text(f"SELECT * FROM {name} ORDER BY id DESC LIMIT :lim").bindparams(
+        bindparam('lim', type_=Integer)
+    )
+    for name in LOG_TABLES
+}
+
+# Upper bound on groups returned by otherwise unbounded distribution queries
+DISTRIBUTION_ROW_LIMIT = 1000
+
+# Per-table aggregates for get_processing_stats, fused into one statement
+_PROCESSING_STATS_QUERY = """
+    SELECT
+        'nginx' as src,
+        COUNT(*) as total_entries,
+        COUNT(DISTINCT ip_address) as unique_ips,
+        COUNT(DISTINCT DATE(timestamp)) as unique_days,
+        MIN(timestamp) as earliest_log,
+        MAX(timestamp) as latest_log
+    FROM nginx_logs
+    UNION ALL
+    SELECT
+        'nexus' as src,
+        COUNT(*) as total_entries,
+        COUNT(DISTINCT ip_address) as unique_ips,
+        COUNT(DISTINCT DATE(timestamp)) as unique_days,
+        MIN(timestamp) as earliest_log,
+        MAX(timestamp) as latest_log
+    FROM nexus_logs
+"""
+
+
+def iso_datetime(column: Any) -> Any:
+    """
+    AI: SQL expression rendering a DateTime column the way datetime.isoformat() does.
+
+    SQLAlchemy stores SQLite datetimes as 'YYYY-MM-DD HH:MM:SS[.ffffff]' text.
+    Formatting inside SQLite skips parsing every value into a Python datetime
+    only to turn it back into a string for the JSON response.
+    """
+    raw = type_coerce(column, String)
+    return case(
+        (func.substr(raw, 20) == '.000000', func.replace(func.substr(raw, 1, 19), ' ', 'T')),
+        else_=func.replace(raw, ' ', 'T'),
+    ).label(column.key)
+
+
+def _decode_blob(value: bytes) -> str:
+    """
+    AI: JSON-safe text for a BLOB value in a raw SQL result.
+
+    Compressed log lines (nginx_logs.raw_log, whatever the column is called
+    in the query) are decompressed; any other BLOB is returned as hex.
+    """
+    try:
+        return decompress_raw_log(value)
+    except (zlib.error, UnicodeDecodeError):
+        return value.hex()
+
+
+def _decode_blobs(data: Dict[str, Any]) -> Dict[str, Any]:
+    """AI: Replace every bytes value of a result row with _decode_blob text, in place."""
+    for key, value in data.items():
+        if type(value) is bytes:
+            data[key] = _decode_blob(value)
+    return data
+
+
+def _columnar_rows(result: Any) -> Tuple[List[str], List[List[Any]]]:
+    """AI: Fetch a result as (column names, value lists), decoding bytes values."""
+    columns = list(result.keys())
+    rows = [
+        [_decode_blob(value) if type(value) is bytes else value for value in row]
+        for row in result
+    ]
+    return columns, rows
+
+
+class _SessionMixin:
+    """AI: Connection holder and session handling shared by all database handlers."""
     
     def __init__(self, db_connection: DatabaseConnection):
         """AI: Initialize with database connection."""
@@ -40,45 +138,258 @@ class BaseLogDatabase(ABC):
             raise
         finally:
             session.close()
+
+
+class BaseLogDatabase(_SessionMixin, Generic[ModelT]):
+    """
+    AI: Generic base class for format-specific database operations.
+
+    Subclasses declare the model and field lists; batch insert, preview and
+    time-range queries are implemented once here so every log format shares
+    the same optimized code path.
+    """
     
-    @abstractmethod
-    def batch_insert(self, log_data: List[Dict]) -> int:
-        """AI: Insert batch of log entries. Must be implemented by subclasses."""
-        pass
+    # Declared by subclasses
+    MODEL: Type[ModelT]
+    LOG_FORMAT: str  # Lower-case name used in log messages, e.g. 'nginx'
+    # Inserted columns and the value used when a parsed entry omits them; every
+    # row gets the same keys so each chunk executes as one multi-row INSERT
+    INSERT_FIELDS: Tuple[Tuple[str, Any], ...]
+    PREVIEW_FIELDS: Tuple[str, ...]
+    TIMERANGE_FIELDS: Tuple[str, ...] = (
+        'timestamp', 'method', 'path', 'status_code', 'ip_address', 'user_agent'
+    )
+    # Derived by __init_subclass__: INSERT_FIELDS without raw_log, and
+    # select() columns for the field lists above
+    _insert_fields_without_raw: Tuple[Tuple[str, Any], ...]
+    _preview_columns: Tuple[Any, ...]
+    _timerange_columns: Tuple[Any, ...]
     
-    @abstractmethod
-    def get_preview(self, limit: int = 10) -> List[Dict]:
-        """AI: Get preview of log entries. Must be implemented by subclasses."""
-        pass
+    # Rows per INSERT executemany; at most one chunk is held in memory at a time
+    BATCH_SIZE = 1000
     
-    @abstractmethod
-    def get_model_class(self):
-        """AI: Return the SQLAlchemy model class for this log format."""
-        pass
-
-
-class CommonLogDatabase:
-    """AI: Common database operations shared across all log formats."""
+    # Optional columnar archive fed after each committed batch_insert
+    parquet_sink: Optional[ParquetSink] = None
+    # SELECT of the committed row count compared against the archive
+    _row_count_stmt: Executable
     
-    def __init__(self, db_connection: DatabaseConnection):
-        """AI: Initialize with database connection."""
-        self.db_connection = db_connection
+    # Store the original log line; when False raw_log is left NULL, which
+    # roughly halves the bytes marshalled and written per row
+    capture_raw_log = True
     
-    @contextmanager
-    def get_session(self):
-        """AI: Context manager for database sessions with proper error handling."""
-        session = self.db_connection.SessionLocal()
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """AI: Resolve field names to select() columns once per subclass."""
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, 'MODEL', None) is not None:
+            cls._insert_fields_without_raw = tuple(
+                field for field in cls.INSERT_FIELDS if field[0] != 'raw_log'
+            )
+            cls._preview_columns = tuple(cls._select_column(name) for name in cls.PREVIEW_FIELDS)
+            cls._timerange_columns = tuple(cls._select_column(name) for name in cls.TIMERANGE_FIELDS)
+            # Ids are assigned sequentially to append-only rows, so MAX(id) is the row count
+            cls._row_count_stmt = select(func.coalesce(func.max(cls.MODEL.id), 0))
+    
+    @classmethod
+    def _select_column(cls, name: str) -> Any:
+        """AI: Model column for select(); DateTime columns are formatted by SQLite."""
+        column = getattr(cls.MODEL, name)
+        if isinstance(column.type, DateTime):
+            return iso_datetime(column)
+        return column
+    
+    def get_model_class(self) -> Type[ModelT]:
+        """AI: Return the SQLAlchemy model class for this log format."""
+        return self.MODEL
+    
+    def batch_insert(self, log_data: Iterable[Dict]) -> int:
+        """
+        AI: Insert log entries into the database in BATCH_SIZE chunks.
+        
+        raw_log is only inserted when capture_raw_log is enabled.
+        
+        Args:
+            log_data: Iterable (list or generator) of parsed log dictionaries
+            
+        Returns:
+            Number of entries successfully inserted
+        """
+        fields = self.INSERT_FIELDS if self.capture_raw_log else self._insert_fields_without_raw
         try:
-            yield session
-            session.commit()
+            return self._insert_chunks(self.MODEL, fields, log_data)
         except Exception as e:
-            session.rollback()
-            logger.error("DATABASE_ERROR: Transaction rolled back - %s", e)
+            logger.error("%s_BATCH_INSERT_ERROR: Failed to insert %s logs - %s",
+                         self.LOG_FORMAT.upper(), self.LOG_FORMAT, e)
             raise
-        finally:
-            session.close()
     
-    def execute_query(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_preview(self, limit: int = 10) -> List[Dict]:
+        """
+        AI: Get a preview of the most recently inserted log entries.
+        
+        Args:
+            limit: Maximum number of entries to return
+            
+        Returns:
+            List of dictionaries with PREVIEW_FIELDS
+        """
+        try:
+            stmt = select(*self._preview_columns).order_by(self.MODEL.id.desc()).limit(limit)
+            return self._fetch_dicts(stmt)
+        except Exception as e:
+            logger.error("%s_PREVIEW_ERROR: Failed to get %s preview - %s",
+                         self.LOG_FORMAT.upper(), self.LOG_FORMAT, e)
+            return []
+    
+    def get_logs_by_timerange(
+        self, 
+        start_time: datetime, 
+        end_time: datetime, 
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """AI: Get log entries within a time range, newest first."""
+        try:
+            timestamp = self.MODEL.timestamp
+            stmt = (
+                select(*self._timerange_columns)
+                .where(timestamp >= start_time, timestamp <= end_time)
+                .order_by(timestamp.desc())
+                .limit(limit)
+            )
+            return self._fetch_dicts(stmt)
+        except Exception as e:
+            logger.error("%s_TIMERANGE_ERROR: Failed to get logs by timerange - %s",
+                         self.LOG_FORMAT.upper(), e)
+            return []
+    
+    def _fetch_dicts(self, stmt: Executable, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        AI: Run a Core SELECT on the read-only connection and return plain dicts.
+
+        Rows are read as mappings rather than hydrated ORM objects. Datetime
+        columns should be selected through iso_datetime() so the rows are
+        JSON-ready without per-cell conversion in Python.
+        """
+        with self.db_connection.readonly_connection() as connection:
+            return [dict(row) for row in connection.execute(stmt, params or {}).mappings()]
+    
+    def _insert_chunks(
+        self, model: Type[Any], fields: Sequence[Tuple[str, Any]], log_data: Iterable[Dict]
+    ) -> int:
+        """
+        AI: Bulk INSERT parsed entries in chunks of BATCH_SIZE rows.
+
+        Entries are consumed lazily, so log_data may be a generator. Each entry
+        is normalized to the same keys (missing fields take the default from
+        fields) as required for a single executemany; entries that already
+        carry exactly those keys, as the processors produce them, are passed
+        through without copying. All chunks share one transaction (a SAVEPOINT
+        inside an active DatabaseConnection.bulk_ingest() block); rows are
+        handed to parquet_sink only after it commits.
+
+        Args:
+            model: SQLAlchemy model class to insert into
+            fields: (column name, default) pairs for every inserted column
+            log_data: Iterable of parsed log entry dictionaries
+
+        Returns:
+            Number of rows inserted
+        """
+        names = frozenset(name for name, _ in fields)
+        rows = (
+            entry if entry.keys() == names
+            else {name: entry.get(name, default) for name, default in fields}
+            for entry in log_data
+        )
+        bulk_session = self.db_connection.bulk_session()
+        if bulk_session is None:
+            with self.get_session() as session:
+                total, written = self._execute_chunks(session, insert(model), rows)
+            if written:
+                self._archive(written)
+            return total
+
+        # Inside DatabaseConnection.bulk_ingest(): the shared transaction commits later
+        with bulk_session.begin_nested():
+            total, written = self._execute_chunks(bulk_session, insert(model), rows)
+        if written:
+            # Queued per commit: all batches of a commit are archived and flushed together
+            self.db_connection.call_after_bulk_commit(self._archive, written)
+        self.db_connection.bulk_rows_written(total)
+        return total
+    
+    def _execute_chunks(
+        self, session: Session, stmt: Executable, rows: Iterable[Dict]
+    ) -> Tuple[int, List[List[Dict]]]:
+        """AI: Execute stmt per BATCH_SIZE chunk; returns (row count, chunks to archive)."""
+        total = 0
+        written = []  # Kept only when a Parquet sink must receive them after commit
+        while chunk := list(islice(rows, self.BATCH_SIZE)):
+            session.execute(stmt, chunk)
+            total += len(chunk)
+            if self.parquet_sink is not None:
+                written.append(chunk)
+        return total, written
+    
+    def _archive(self, chunks: List[List[Dict]]) -> None:
+        """
+        AI: Hand committed chunks to the Parquet sink and flush them.
+
+        Called once per commit, with every chunk of a bulk_ingest() commit.
+        Flushing on every commit keeps the dataset complete for readers in
+        other processes (the web interface builds its own sink).
+        """
+        sink = self.parquet_sink
+        if sink is None:
+            return  # Archive disabled after the rows were written
+        for chunk in chunks:
+            sink.append(chunk)
+        sink.flush()
+    
+    def _parquet_complete(self) -> bool:
+        """
+        AI: True when analytics can be answered from the Parquet archive.
+
+        The archive must hold every committed row; otherwise (no archive, rows
+        ingested without it, or a crash between commit and flush) callers
+        query SQLite instead of returning partial results. The table row count
+        is taken as MAX(id), which assumes log tables are append-only: rows
+        are never deleted except by recreating the database, which also
+        discards the archive (fresh_start).
+        """
+        if self.parquet_sink is None:
+            return False
+        with self.db_connection.readonly_connection() as connection:
+            table_rows = connection.execute(self._row_count_stmt).scalar_one()
+        return self.parquet_sink.can_query(table_rows)
+    
+    def enable_parquet_archive(self, root_dir: str) -> None:
+        """
+        AI: Archive inserted rows to Parquet below root_dir/<table name>.
+
+        The surrogate id, created_at and the raw log line are not archived.
+        An existing dataset is discarded when the database was freshly created.
+
+        Raises:
+            ImportError: When the optional analytics dependencies are missing
+        """
+        model = self.get_model_class()
+        columns = [
+            column.name for column in model.__table__.columns
+            if column.name not in ('id', 'created_at', 'raw_log')
+        ]
+        self.parquet_sink = ParquetSink(
+            root_dir, model.__tablename__, columns, fresh_start=self.db_connection.fresh_start
+        )
+
+
+class CommonLogDatabase(_SessionMixin):
+    """AI: Common database operations shared across all log formats."""
+    
+    def execute_query(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         AI: Execute a raw SQL query and return results as dictionaries.
         
@@ -86,29 +397,61 @@ class CommonLogDatabase:
         - Only SELECT statements allowed
         - Automatic LIMIT enforcement  
         - Query validation and sanitization
+
+        Rows are fetched on a pooled read-only connection, so concurrent
+        queries do not wait for each other or for ingestion.
+
+        Values passed as params bind to :name placeholders, so callers issuing
+        the same query with different values reuse one prepared statement.
+        """
+        with self._select(query, limit, params) as result:
+            return [_decode_blobs(dict(row._mapping)) for row in result]
+    
+    def execute_query_columnar(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[str], List[List[Any]]]:
         """
+        AI: Execute a raw SQL query and return (column names, rows).
+
+        Same checks as execute_query, but each row is a list of values in
+        column order: no per-row dict is built, and the column names are
+        known even when no row matches.
+        """
+        with self._select(query, limit, params) as result:
+            return _columnar_rows(result)
+    
+    @contextmanager
+    def _select(
+        self, query: str, limit: Optional[int], params: Optional[Dict[str, Any]]
+    ) -> Generator[CursorResult, None, None]:
+        """AI: Validate a SELECT, apply limit and yield its result on a read-only connection."""
         # Validate query is SELECT only (security requirement)
-        query_stripped = query.strip().upper()
-        if not query_stripped.startswith("SELECT"):
+        query_lower = query.lstrip().lower()
+        if not query_lower.startswith("select"):
             raise ValueError("Only SELECT queries are allowed for security")
         
+        # Apply limit if specified and not already present
+        if limit and 'limit' not in query_lower:
+            query = f"{query.rstrip(';')} LIMIT {limit}"
+        
         try:
-            with self.get_session() as session:
-                # Apply limit if specified and not already present
-                if limit and 'LIMIT' not in query_stripped:
-                    query = f"{query.rstrip(';')} LIMIT {limit}"
-                
-                result = session.execute(text(query))
-                columns = result.keys()
-                rows = result.fetchall()
-                
-                return [dict(zip(columns, row)) for row in rows]
+            with self.db_connection.readonly_connection() as connection:
+                yield connection.execute(text(query), params)
         except Exception as e:
             logger.error("QUERY_ERROR: Failed to execute query - %s", e)
             raise
     
-    def get_database_schema(self) -> Dict[str, Any]:
-        """AI: Get database schema information for all tables."""
+    def get_database_schema(self, include_statistics: bool = True) -> Dict[str, Any]:
+        """
+        AI: Get database schema information for all tables.
+
+        Args:
+            include_statistics: Also aggregate processing statistics, which
+                scans every table; pass False when only the structure is needed
+        """
         schema_info = {
             'database': str(self.db_connection.db_path),
             'tables': {},
@@ -116,26 +459,27 @@ class CommonLogDatabase:
         }
         
         try:
-            with self.get_session() as session:
+            with self.db_connection.readonly_connection() as connection:
                 # Get table information for both nginx_logs and nexus_logs
-                for table_name in ['nginx_logs', 'nexus_logs']:
+                for table_name in LOG_TABLES:
                     # Get column information
-                    columns_query = f"PRAGMA table_info({table_name})"
-                    columns_result = session.execute(text(columns_query))
+                    columns_result = connection.execute(_TABLE_INFO_STMTS[table_name])
                     
+                    model_columns = Base.metadata.tables[table_name].columns
                     columns = []
                     for col_info in columns_result.fetchall():
+                        model_column = model_columns.get(col_info[1])
                         columns.append({
                             'name': col_info[1],
                             'type': col_info[2],
                             'not_null': bool(col_info[3]),
                             'default': col_info[4],
-                            'primary_key': bool(col_info[5])
+                            'primary_key': bool(col_info[5]),
+                            'description': model_column.doc if model_column is not None else None
                         })
                     
                     # Get table create SQL
-                    table_sql_query = f"SELECT sql FROM sqlite_master WHERE type='table' AND name='{table_name}'"
-                    table_sql_result = session.execute(text(table_sql_query))
+                    table_sql_result = connection.execute(_TABLE_SQL_STMT, {'name': table_name})
                     table_sql_row = table_sql_result.fetchone()
                     table_sql = table_sql_row[0] if table_sql_row else None
                     
@@ -145,8 +489,9 @@ class CommonLogDatabase:
                         'columns': columns,
                         'create_sql': table_sql
                     }
-                
-                # Add basic statistics
+            
+            # Add basic statistics (outside the block: it takes the connection itself)
+            if include_statistics:
                 schema_info['statistics'] = self.get_processing_stats()
                 
         except Exception as e:
@@ -155,41 +500,25 @@ class CommonLogDatabase:
         return schema_info
     
     def get_processing_stats(self) -> Dict[str, Any]:
-        """AI: Get processing statistics across all log tables."""
+        """
+        AI: Get processing statistics across all log tables.
+
+        Both tables are aggregated by a single UNION ALL query so the
+        statistics cost one session and one round-trip instead of one per table.
+        """
         try:
-            # Get nginx stats using execute_query
-            nginx_stats = self.execute_query("""
-                SELECT 
-                    COUNT(*) as total_entries,
-                    COUNT(DISTINCT ip_address) as unique_ips,
-                    COUNT(DISTINCT DATE(timestamp)) as unique_days,
-                    MIN(timestamp) as earliest_log,
-                    MAX(timestamp) as latest_log
-                FROM nginx_logs
-            """)
-            nginx_stats = nginx_stats[0] if nginx_stats else {
-                'total_entries': 0, 'unique_ips': 0, 'unique_days': 0,
-                'earliest_log': None, 'latest_log': None
-            }
-            
-            # Get nexus stats using execute_query  
-            nexus_stats = self.execute_query("""
-                SELECT 
-                    COUNT(*) as total_entries,
-                    COUNT(DISTINCT ip_address) as unique_ips,
-                    COUNT(DISTINCT DATE(timestamp)) as unique_days,
-                    MIN(timestamp) as earliest_log,
-                    MAX(timestamp) as latest_log
-                FROM nexus_logs
-            """)
-            nexus_stats = nexus_stats[0] if nexus_stats else {
+            rows = self.execute_query(_PROCESSING_STATS_QUERY)
+            empty_stats = {
                 'total_entries': 0, 'unique_ips': 0, 'unique_days': 0,
                 'earliest_log': None, 'latest_log': None
             }
+            stats_by_source = {row.pop('src'): row for row in rows}
+            nginx_stats = stats_by_source.get('nginx', dict(empty_stats))
+            nexus_stats = stats_by_source.get('nexus', dict(empty_stats))
             
             # Database stats - use a simple placeholder since we don't have get_database_stats
             database_stats = {
-                'size_bytes': self.db_connection.db_path.stat().st_size if self.db_connection.db_path.exists() else 0,
+                'size_bytes': self.db_connection.get_size_bytes(),
                 'total_tables': 2,
                 'total_entries': nginx_stats['total_entries'] + nexus_stats['total_entries']
             }
@@ -207,13 +536,14 @@ class CommonLogDatabase:
     def get_table_sample(self, table_name: str, limit: int = 10) -> List[Dict[str, Any]]:
         """AI: Get sample data from specified table."""
         # Validate table name for security
-        valid_tables = ['nginx_logs', 'nexus_logs']
+        valid_tables = list(LOG_TABLES)
         if table_name not in valid_tables:
             raise ValueError(f"Invalid table name. Must be one of: {valid_tables}")
             
         try:
-            query = f"SELECT * FROM {table_name} ORDER BY id DESC LIMIT {limit}"
-            return self.execute_query(query)
+            with self.db_connection.readonly_connection() as connection:
+                result = connection.execute(_TABLE_SAMPLE_STMTS[table_name], {'lim': limit})
+                return [_decode_blobs(dict(row._mapping)) for row in result]
         except Exception as e:
             logger.error("SAMPLE_ERROR: Failed to get table sample - %s", e)
             return []
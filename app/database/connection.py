@@ -6,19 +6,128 @@ Implements:
 - Connection management with context managers
 - Schema creation with proper indexes
 - Transaction management for batch operations
+- Per-connection PRAGMA tuning (WAL journal, mmap, synchronous=NORMAL)
 """
 
+import hashlib
 import os
+import queue
+import threading
+import time
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator
+from typing import Any, Callable, Generator, Iterable, List, Optional, Tuple
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
-from .models import Base
-from ..utils.logger import logger
+from .models import RAW_LOG_SQL_FUNCTION, Base, decompress_raw_log
+from ..utils.logger import LogLevel, logger
+
+
+# Seconds a measured database file size is reused before stat'ing again
+SIZE_CACHE_TTL = 1.0
+
+# Default rows per multi-row VALUES statement when batch INSERTs are rendered.
+# SQLAlchemy additionally splits pages that would exceed SQLite's bound
+# parameter limit (32766 since SQLite 3.32), so wide tables stay safe.
+INSERTMANYVALUES_PAGE_SIZE = 1000
+
+# Pooled connections kept open (QueuePool) plus temporary extra connections;
+# sized for parallel ingest so concurrent batch_insert calls never wait for a
+# checkout. SQLite still serializes the writes themselves (WAL + busy timeout)
+POOL_SIZE = 8
+POOL_MAX_OVERFLOW = 8
+
+# Read-only analytics connections kept open; queries from web and MCP worker
+# threads run in parallel up to this count (WAL lets readers overlap)
+READONLY_POOL_SIZE = 4
+
+# Rows written inside bulk_ingest() before its transaction is committed
+BULK_COMMIT_EVERY = 50_000
+
+# Prepared statements kept per sqlite3 connection (driver default: 128); the
+# app issues a fixed set of module-level statements, so all stay prepared
+SQLITE_STATEMENT_CACHE_SIZE = 256
+
+# Per-connection SQLite tuning for bulk ingest followed by read-only analytics
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",  # Readers don't block the writer
+    "PRAGMA synchronous=NORMAL",  # fsync at checkpoints only (safe with WAL)
+    "PRAGMA temp_store=MEMORY",  # Sorts and temp indexes stay in RAM
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped reads
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache (negative = KiB)
+    "PRAGMA journal_size_limit=67108864",  # Truncate the WAL to 64 MiB after checkpoints
+)
+
+# Indexes created by earlier releases and since superseded by composite
+# indexes in the models (timestamp -> (timestamp DESC, id DESC), file_source ->
+# (file_source, timestamp)); indexes created by users are never touched
+RETIRED_INDEXES = (
+    "idx_nginx_timestamp",
+    "idx_nginx_file_source",
+    "idx_nexus_timestamp",
+    "idx_nexus_file_source",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """AI: Apply SQLITE_PRAGMAS to every new DBAPI connection in the pool."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _register_sql_functions(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    AI: Register raw_log_text(raw_log), which decodes compressed log lines.
+
+    A query helper for raw SQL only; the schema never references it.
+    """
+    dbapi_connection.create_function(RAW_LOG_SQL_FUNCTION, 1, decompress_raw_log, deterministic=True)
+
+
+def _begin_explicitly(session: Session, transaction: Any, connection: Connection) -> None:
+    """
+    AI: Emit BEGIN when a bulk_ingest() session starts a transaction.
+
+    pysqlite only opens a transaction implicitly before DML, so a SAVEPOINT
+    issued first would start (and its RELEASE commit) the transaction itself.
+    """
+    dbapi_connection = connection.connection.dbapi_connection
+    if dbapi_connection is not None and not dbapi_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN")
+
+
+@lru_cache(maxsize=1)
+def schema_checksum() -> int:
+    """
+    AI: Checksum of the DDL generated from the SQLAlchemy models.
+
+    Stored in the database header (PRAGMA user_version) after the schema is
+    created, so reopening a database whose schema already matches the models
+    can skip create_all() and its per-table introspection queries.
+
+    Returns:
+        Positive 31-bit integer suitable for PRAGMA user_version
+    """
+    dialect = sqlite.dialect()
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            ddl.append(str(CreateIndex(index).compile(dialect=dialect)))
+    digest = hashlib.blake2b("\n".join(ddl).encode(), digest_size=4).digest()
+    return int.from_bytes(digest, "big") & 0x7FFFFFFF
 
 
 class DatabaseConnection:
@@ -36,7 +145,14 @@ class DatabaseConnection:
             db.execute_raw_sql("SELECT * FROM nginx_logs")
     """
 
-    def __init__(self, db_path: str, fresh_start: bool = True):
+    def __init__(
+        self,
+        db_path: str,
+        fresh_start: bool = True,
+        insertmanyvalues_page_size: int = INSERTMANYVALUES_PAGE_SIZE,
+        pool_size: int = POOL_SIZE,
+        readonly_pool_size: int = READONLY_POOL_SIZE,
+    ):
         """
         AI: Initialize database connection with optional fresh database creation.
 
@@ -44,11 +160,27 @@ class DatabaseConnection:
             db_path: Path to SQLite database file
             fresh_start: If True, drop/recreate database on start (per ADR)
                         If False, use existing database if available
+            insertmanyvalues_page_size: Rows per multi-row INSERT batch
+            pool_size: Persistent pooled connections (expected ingest concurrency)
+            readonly_pool_size: Read-only connections for concurrent analytic queries
         """
         self.db_path = Path(db_path)
         self.fresh_start = fresh_start
+        self.insertmanyvalues_page_size = insertmanyvalues_page_size
+        self.pool_size = pool_size
         self.engine: Engine = None
         self.SessionLocal: sessionmaker = None
+        self._size_cache: Optional[Tuple[float, int]] = None  # (measured_at, size_bytes)
+        # Idle read-only connections; the semaphore caps how many are checked out
+        self._readonly_idle: "queue.LifoQueue[Connection]" = queue.LifoQueue()
+        self._readonly_slots = threading.BoundedSemaphore(readonly_pool_size)
+        self._readonly_held = threading.local()  # Connection checked out by this thread
+        self._readonly_conns: List[Connection] = []  # Every one opened, for close()
+        self._readonly_lock = threading.Lock()
+        # data_version() must ask the same connection every time
+        self._version_conn: Optional[Connection] = None
+        self._version_lock = threading.Lock()
+        self._bulk = threading.local()  # Per-thread bulk_ingest() state
         self._initialize_database()
 
     def __enter__(self):
@@ -67,9 +199,18 @@ class DatabaseConnection:
         Creates new database file and applies schema with indexes.
         """
         # Remove existing database for fresh start (per ADR) only if fresh_start=True
-        if self.fresh_start and self.db_path.exists():
-            os.remove(self.db_path)
-            logger.info("Removed existing database: %s", self.db_path)
+        if self.fresh_start:
+            try:
+                os.remove(self.db_path)
+                logger.info("Removed existing database: %s", self.db_path)
+            except FileNotFoundError:
+                pass
+            # Stale WAL files would otherwise be replayed into the new database
+            for suffix in ("-wal", "-shm"):
+                try:
+                    os.remove(f"{self.db_path}{suffix}")
+                except FileNotFoundError:
+                    pass
         
         # Create SQLite engine with optimizations
         self.engine = create_engine(
@@ -78,9 +219,16 @@ class DatabaseConnection:
             connect_args={
                 "check_same_thread": False,  # Allow multi-threading
                 "timeout": 30,  # 30-second timeout for database locks
+                "cached_statements": SQLITE_STATEMENT_CACHE_SIZE,
             },
+            poolclass=QueuePool,  # One connection per concurrent session
+            pool_size=self.pool_size,
+            max_overflow=POOL_MAX_OVERFLOW,
             pool_pre_ping=True,  # Verify connections before use
+            insertmanyvalues_page_size=self.insertmanyvalues_page_size,
         )
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
+        event.listen(self.engine, "connect", _register_sql_functions)
         
         # Create session factory
         self.SessionLocal = sessionmaker(
@@ -89,15 +237,95 @@ class DatabaseConnection:
             autoflush=False
         )
         
-        # Create all tables with indexes (this is safe if tables already exist)
-        Base.metadata.create_all(self.engine)
+        try:
+            self._ensure_schema()
+        except Exception:
+            self.engine.dispose()
+            raise
         
         if self.fresh_start:
             logger.info("Created fresh database with schema: %s", self.db_path)
         else:
             logger.info("Connected to existing database: %s", self.db_path)
-        logger.info("Database size: {self.db_path.stat().st_size} bytes")
+        if logger.is_enabled(LogLevel.DEBUG):
+            logger.debug("Database size: %d bytes", self.get_size_bytes())
     
+    def _ensure_schema(self) -> None:
+        """
+        AI: Create tables and indexes unless the stored schema checksum matches.
+
+        A fresh database is known to be empty, so tables are created without
+        existence checks. An existing database is only inspected when its
+        PRAGMA user_version differs from schema_checksum(), and is only
+        stamped with the new checksum once its tables match the models.
+
+        Raises:
+            RuntimeError: When an existing table's columns differ from the models
+        """
+        checksum = schema_checksum()
+        with self.engine.begin() as connection:
+            if self.fresh_start:
+                Base.metadata.create_all(connection, checkfirst=False)
+            else:
+                stored = connection.exec_driver_sql("PRAGMA user_version").scalar()
+                if stored == checksum:
+                    return
+                # Columns cannot be migrated in place; only tables and indexes are added
+                self._check_table_columns(connection)
+                Base.metadata.create_all(connection)
+                self._drop_obsolete_indexes(connection)
+
+        try:
+            with self.engine.begin() as connection:
+                connection.exec_driver_sql(f"PRAGMA user_version = {checksum}")
+        except OperationalError as e:
+            # Read-only databases keep working; the check simply repeats next time
+            logger.warn("WARNING: Could not record schema checksum in %s: %s", self.db_path, e)
+
+    def _check_table_columns(self, connection: Connection) -> None:
+        """
+        AI: Refuse existing tables whose columns differ from the models.
+
+        create_all() skips tables that already exist, so a table from an older
+        release would otherwise keep its old column definitions (e.g. a plain
+        TEXT raw_log) while being stamped as current. Tables that do not exist
+        yet are left to create_all().
+
+        Raises:
+            RuntimeError: When a table has to be recreated
+        """
+        dialect = connection.dialect
+        for table in Base.metadata.sorted_tables:
+            existing = {
+                (row[1], row[2].upper(), bool(row[3]))
+                for row in connection.exec_driver_sql(f"PRAGMA table_info({table.name})")
+            }
+            if not existing:
+                continue
+            expected = {
+                (column.name, column.type.compile(dialect=dialect).upper(), not column.nullable)
+                for column in table.columns
+            }
+            if existing != expected:
+                raise RuntimeError(
+                    f"Database {self.db_path} has an outdated {table.name} table; "
+                    "recreate it with --process-logs (fresh start)"
+                )
+
+    def _drop_obsolete_indexes(self, connection: Connection) -> None:
+        """
+        AI: Drop the RETIRED_INDEXES left behind by databases from older releases.
+
+        create_all() only adds missing indexes; superseded ones would otherwise
+        keep costing a B-tree update on every insert.
+        """
+        for name in RETIRED_INDEXES:
+            if connection.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+            ).first():
+                connection.exec_driver_sql(f'DROP INDEX "{name}"')
+                logger.info("Dropped obsolete index: %s", name)
+
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """
@@ -123,6 +351,140 @@ class DatabaseConnection:
         finally:
             session.close()
     
+    @contextmanager
+    def bulk_ingest(self, commit_every: int = BULK_COMMIT_EVERY) -> Generator[Session, None, None]:
+        """
+        AI: Share one long-lived transaction across many batch inserts.
+
+        While the block is active, BaseLogDatabase.batch_insert calls from the
+        same thread write through this session instead of committing their own
+        transaction. The transaction is committed every commit_every rows and
+        on exit, amortizing BEGIN/COMMIT over a whole ingest run. Each
+        batch_insert runs in a SAVEPOINT, so a failing batch only discards its
+        own rows. Nested calls join the outer block.
+
+        Args:
+            commit_every: Rows written before an intermediate commit
+
+        Yields:
+            The shared session
+        """
+        if getattr(self._bulk, 'session', None) is not None:
+            yield self._bulk.session
+            return
+
+        session = self.SessionLocal()
+        event.listen(session, "after_begin", _begin_explicitly)
+        self._bulk.session = session
+        self._bulk.commit_every = commit_every
+        self._bulk.pending_rows = 0
+        self._bulk.after_commit = {}
+        try:
+            yield session
+            self._commit_bulk()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+            self._bulk.session = None
+            self._bulk.after_commit = {}
+
+    def bulk_session(self) -> Optional[Session]:
+        """AI: Session of the calling thread's active bulk_ingest() block, if any."""
+        return getattr(self._bulk, 'session', None)
+
+    def call_after_bulk_commit(self, callback: Callable[[List[Any]], None], items: Iterable[Any]) -> None:
+        """
+        AI: Queue items for callback until the current bulk_ingest() transaction commits.
+
+        Items queued for the same callback are collected, and each callback
+        runs once per commit with all of them; a rollback discards them.
+
+        Args:
+            callback: Called with the list of queued items after commit
+            items: Items written in the current transaction
+        """
+        self._bulk.after_commit.setdefault(callback, []).extend(items)
+
+    def bulk_rows_written(self, count: int) -> None:
+        """AI: Account rows written in bulk_ingest(); commits every commit_every rows."""
+        self._bulk.pending_rows += count
+        if self._bulk.pending_rows >= self._bulk.commit_every:
+            self._commit_bulk()
+
+    def _commit_bulk(self) -> None:
+        """AI: Commit the bulk_ingest() transaction and run its after-commit callbacks."""
+        self._bulk.session.commit()
+        self._bulk.pending_rows = 0
+        self._size_cache = None  # File grew; re-measure on next request
+        callbacks, self._bulk.after_commit = self._bulk.after_commit, {}
+        for callback, items in callbacks.items():
+            callback(items)
+
+    def _open_readonly_connection(self) -> Connection:
+        """AI: Check out an autocommit, query_only connection from the engine pool."""
+        connection = self.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        connection.exec_driver_sql("PRAGMA query_only=ON")
+        with self._readonly_lock:
+            self._readonly_conns.append(connection)
+        return connection
+
+    @contextmanager
+    def readonly_connection(self) -> Generator[Connection, None, None]:
+        """
+        AI: Long-lived connection for analytic SELECT queries.
+
+        Avoids the Session create/commit/close cycle per query. Connections
+        run in autocommit mode so every statement sees the latest committed
+        data (no snapshot is held open between calls), and PRAGMA query_only
+        makes SQLite reject writes on them. Up to readonly_pool_size threads
+        (web and MCP handlers) hold one each at the same time; further
+        callers wait for one to be returned. Nested use in a thread reuses
+        the connection it already holds.
+
+        Yields:
+            SQLAlchemy Connection; results must be fetched inside the block
+        """
+        held = getattr(self._readonly_held, 'connection', None)
+        if held is not None:
+            yield held
+            return
+
+        with self._readonly_slots:
+            try:
+                connection = self._readonly_idle.get_nowait()
+            except queue.Empty:
+                connection = self._open_readonly_connection()
+            self._readonly_held.connection = connection
+            try:
+                yield connection
+            finally:
+                self._readonly_held.connection = None
+                if connection.closed or connection.invalidated:
+                    with self._readonly_lock:
+                        if connection in self._readonly_conns:
+                            self._readonly_conns.remove(connection)
+                else:
+                    self._readonly_idle.put(connection)
+
+    def data_version(self) -> int:
+        """
+        AI: Change counter of the database file.
+
+        SQLite's PRAGMA data_version changes whenever any other connection,
+        in this or another process, commits. The counter is per connection,
+        so it is always read from one dedicated read-only connection.
+        Callers can key cached query results on it instead of expiring them.
+
+        Returns:
+            Opaque counter; only equality between calls is meaningful
+        """
+        with self._version_lock:
+            if self._version_conn is None or self._version_conn.closed:
+                self._version_conn = self._open_readonly_connection()
+            return int(self._version_conn.exec_driver_sql("PRAGMA data_version").scalar_one())
+    
     def execute_raw_sql(self, sql: str, params: dict = None) -> list:
         """
         AI: Execute raw SQL with proper connection management.
@@ -157,6 +519,27 @@ class DatabaseConnection:
             result = connection.execute(text(sql), params)
             return [dict(row._mapping) for row in result]
     
+    def get_size_bytes(self) -> int:
+        """
+        AI: Get database file size, reusing a recent measurement.
+
+        Stats endpoints may ask for the size several times per request; the
+        value is cached for SIZE_CACHE_TTL seconds to avoid repeated stat calls.
+
+        Returns:
+            Size of the database file in bytes (0 if it does not exist)
+        """
+        now = time.monotonic()
+        if self._size_cache is not None and now - self._size_cache[0] < SIZE_CACHE_TTL:
+            return self._size_cache[1]
+
+        try:
+            size = os.stat(self.db_path).st_size
+        except FileNotFoundError:
+            size = 0
+        self._size_cache = (now, size)
+        return size
+    
     def get_table_info(self, table_name: str) -> dict:
         """
         AI: Get table schema information for MCP server.
@@ -198,7 +581,7 @@ class DatabaseConnection:
         """
         stats = {
             "database_path": str(self.db_path),
-            "database_size_bytes": self.db_path.stat().st_size if self.db_path.exists() else 0,
+            "database_size_bytes": self.get_size_bytes(),
             "tables": {}
         }
         
@@ -218,6 +601,15 @@ class DatabaseConnection:
     
     def close(self) -> None:
         """AI: Close database connections and cleanup resources."""
+        with self._readonly_lock:
+            connections, self._readonly_conns = self._readonly_conns, []
+        for connection in connections:
+            # Invalidate so query_only connections never return to the engine pool
+            connection.invalidate()
+            connection.close()
+        while not self._readonly_idle.empty():
+            self._readonly_idle.get_nowait()
+        self._version_conn = None
         if self.engine:
             self.engine.dispose()
             logger.info("Database connections closed")
@@ -5,17 +5,104 @@ Implements separate models per ADR decision:
 - NginxLog and NexusLog as distinct models
 - Optimized schemas for each log format
 - Performance indexes for common query patterns
+- Compressed storage for the rarely read nginx raw log line
 """
 
-from datetime import datetime
-from typing import Optional
+import zlib
+from typing import Optional, Union, overload
 
-from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, Index, Integer, LargeBinary, String, Text, func
+from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
 
+# Preset deflate dictionary of fragments common to nginx/Nexus access log lines,
+# so that even a single short line compresses. Stored values can only be
+# decompressed with the same bytes: treat any change as a schema change.
+RAW_LOG_ZDICT = (
+    b'" "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+    b'Chrome/ Safari/537.36" "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+    b'(X11; Linux x86_64) Firefox/" "curl/7." "Apache-Maven/3. (Java 11.0; Linux)" [qtp'
+    b' - - [/Jan/Feb/Mar/Apr/May/Jun/Jul/Aug/Sep/Oct/Nov/Dec/2025:00:00:00 +0000] '
+    b'"GET /repository/ HTTP/1.1" 200 "-" "POST /api/ HTTP/1.0" 304 404 "https://'
+)
+
+# Raw deflate stream (no zlib header/checksum); level 1 keeps ingest cheap
+_RAW_LOG_WBITS = -15
+_RAW_LOG_LEVEL = 1
+
+
+# Compressor already primed with RAW_LOG_ZDICT; never fed data itself, only
+# copied, so the dictionary is loaded once rather than once per row
+_RAW_LOG_COMPRESSOR = zlib.compressobj(_RAW_LOG_LEVEL, zlib.DEFLATED, _RAW_LOG_WBITS, zdict=RAW_LOG_ZDICT)
+
+
+def compress_raw_log(line: str) -> bytes:
+    """AI: Deflate a raw log line with RAW_LOG_ZDICT."""
+    compressor = _RAW_LOG_COMPRESSOR.copy()
+    return compressor.compress(line.encode('utf-8')) + compressor.flush()
+
+
+@overload
+def decompress_raw_log(value: Union[bytes, str]) -> str: ...
+
+
+@overload
+def decompress_raw_log(value: None) -> None: ...
+
+
+def decompress_raw_log(value: Union[bytes, str, None]) -> Optional[str]:
+    """
+    AI: Inverse of compress_raw_log.
+
+    Text values (rows written before compression was introduced, or inserted
+    through raw SQL) are returned unchanged.
+
+    Raises:
+        zlib.error: When bytes are not a complete compressed line
+    """
+    if value is None or isinstance(value, str):
+        return value
+    decompressor = zlib.decompressobj(_RAW_LOG_WBITS, zdict=RAW_LOG_ZDICT)
+    line = decompressor.decompress(value) + decompressor.flush()
+    if not decompressor.eof or decompressor.unused_data:
+        raise zlib.error("not a compressed raw log line")
+    return line.decode('utf-8')
+
+
+# SQL function registered on this application's connections so raw SQL can
+# decode compressed values, e.g. WHERE raw_log_text(raw_log) LIKE '%GET%'. It
+# is not referenced by the schema, so other SQLite clients can read the tables
+RAW_LOG_SQL_FUNCTION = "raw_log_text"
+
+
+class CompressedText(TypeDecorator[str]):
+    """
+    AI: Text column stored as a compressed BLOB.
+
+    Compression happens on bind and decompression on result processing, so
+    ORM and Core statements (including bulk insert()) see plain strings. Raw
+    SQL reads the BLOB; CommonLogDatabase.execute_query decodes it in results
+    and the RAW_LOG_SQL_FUNCTION SQL function decodes it inside a query.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Union[str, bytes, None], dialect: Dialect) -> Optional[bytes]:
+        """AI: Compress str values; pass bytes and None through."""
+        if isinstance(value, str):
+            return compress_raw_log(value)
+        return value
+
+    def process_result_value(self, value: Union[bytes, str, None], dialect: Dialect) -> Optional[str]:
+        """AI: Decompress stored values back to str."""
+        return decompress_raw_log(value)
+
+
 class NginxLog(Base):
     """
     AI: SQLAlchemy model for nginx access logs.
@@ -41,19 +128,25 @@ class NginxLog(Base):
     user_agent = Column(Text, doc="User agent string")
     
     # Metadata fields
-    raw_log = Column(Text, nullable=False, doc="Original log line for debugging")
+    raw_log = Column(
+        CompressedText,
+        doc="Original log line for debugging, deflate-compressed; decode with raw_log_text(raw_log) "
+            "(NULL when not captured)"
+    )
     file_source = Column(String, nullable=False, doc="Source file path")
     created_at = Column(DateTime, default=func.now(), doc="Record creation timestamp")
     
     # Performance indexes as table arguments
     __table_args__ = (
-        Index('idx_nginx_timestamp', 'timestamp'),
+        # Newest-first time-range scans read in index order (no sort step for ORDER BY ... LIMIT)
+        Index('idx_nginx_timestamp_id', timestamp.desc(), id.desc()),
         Index('idx_nginx_ip', 'ip_address'),
         Index('idx_nginx_method', 'method'),
         Index('idx_nginx_path', 'path'),
         Index('idx_nginx_status', 'status_code'),
         Index('idx_nginx_method_path', 'method', 'path'),
-        Index('idx_nginx_file_source', 'file_source'),
+        # Per-file lookups; the file_source prefix also serves plain equality filters
+        Index('idx_nginx_file_source_timestamp', 'file_source', 'timestamp'),
     )
     
     def __repr__(self) -> str:
@@ -94,19 +187,21 @@ class NexusLog(Base):
     thread_info = Column(String, doc="Thread pool information [qtp...]")
     
     # Metadata fields
-    raw_log = Column(Text, nullable=False, doc="Original log line for debugging")
+    raw_log = Column(Text, doc="Original log line for debugging (NULL when not captured)")
     file_source = Column(String, nullable=False, doc="Source file path")
     created_at = Column(DateTime, default=func.now(), doc="Record creation timestamp")
     
     # Performance indexes as table arguments
     __table_args__ = (
-        Index('idx_nexus_timestamp', 'timestamp'),
+        # Newest-first time-range scans read in index order (no sort step for ORDER BY ... LIMIT)
+        Index('idx_nexus_timestamp_id', timestamp.desc(), id.desc()),
         Index('idx_nexus_ip', 'ip_address'),
         Index('idx_nexus_method', 'method'),
         Index('idx_nexus_path', 'path'),
         Index('idx_nexus_status', 'status_code'),
         Index('idx_nexus_method_path', 'method', 'path'),
-        Index('idx_nexus_file_source', 'file_source'),
+        # Per-file lookups; the file_source prefix also serves plain equality filters
+        Index('idx_nexus_file_source_timestamp', 'file_source', 'timestamp'),
         Index('idx_nexus_thread', 'thread_info'),
     )
     
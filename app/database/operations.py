@@ -9,10 +9,11 @@ This replaces the monolithic DatabaseOperations class with a composition-based
 approach that maintains clean separation between different log format operations.
 """
 
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from typing import List, Dict, Any, Generator, Iterable, Optional, Tuple
 from datetime import datetime
 
-from app.database.connection import DatabaseConnection
+from app.database.connection import BULK_COMMIT_EVERY, DatabaseConnection
 from app.database.base import CommonLogDatabase
 from app.database.nginx_database import NginxLogDatabase
 from app.database.nexus_database import NexusLogDatabase
@@ -27,8 +28,20 @@ class DatabaseOperations:
     allows for easy extension when adding new log formats.
     """
     
-    def __init__(self, db_connection: DatabaseConnection):
-        """AI: Initialize with database connection and create specialized operation handlers."""
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        parquet_dir: Optional[str] = None,
+        capture_raw_log: bool = True,
+    ):
+        """
+        AI: Initialize with database connection and create specialized operation handlers.
+        
+        Args:
+            db_connection: Database connection manager
+            parquet_dir: Optional directory for the Parquet archive of nginx logs
+            capture_raw_log: Store the original log line with every inserted row
+        """
         self.db_connection = db_connection
         
         # Common operations (schema, stats, queries)
@@ -37,19 +50,31 @@ class DatabaseOperations:
         # Format-specific operations
         self.nginx = NginxLogDatabase(db_connection)
         self.nexus = NexusLogDatabase(db_connection)
+        self.nginx.capture_raw_log = capture_raw_log
+        self.nexus.capture_raw_log = capture_raw_log
+        
+        if parquet_dir:
+            # Only nginx aggregations read the archive; nexus rows are not copied
+            self.nginx.enable_parquet_archive(parquet_dir)
     
     # =============================================================================
     # Backward Compatibility Methods (delegate to appropriate specialized classes)
     # =============================================================================
     
-    def batch_insert_nginx_logs(self, log_data: List[Dict]) -> int:
+    def batch_insert_nginx_logs(self, log_data: Iterable[Dict]) -> int:
         """AI: Insert batch of nginx log entries. Delegates to nginx operations."""
         return self.nginx.batch_insert(log_data)
     
-    def batch_insert_nexus_logs(self, log_data: List[Dict]) -> int:
+    def batch_insert_nexus_logs(self, log_data: Iterable[Dict]) -> int:
         """AI: Insert batch of nexus log entries. Delegates to nexus operations."""
         return self.nexus.batch_insert(log_data)
     
+    @contextmanager
+    def bulk_ingest(self, commit_every: int = BULK_COMMIT_EVERY) -> Generator['DatabaseOperations', None, None]:
+        """AI: Run batch inserts in one transaction committed every commit_every rows."""
+        with self.db_connection.bulk_ingest(commit_every):
+            yield self
+    
     def get_nginx_preview(self, limit: int = 10) -> List[Dict]:
         """AI: Get nginx log preview. Delegates to nginx operations."""
         return self.nginx.get_preview(limit)
@@ -58,13 +83,31 @@ class DatabaseOperations:
         """AI: Get nexus log preview. Delegates to nexus operations."""
         return self.nexus.get_preview(limit)
     
-    def execute_query(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def execute_query(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
         """AI: Execute raw SQL query. Delegates to common operations."""
-        return self.common.execute_query(query, limit)
-    
-    def get_database_schema(self) -> Dict[str, Any]:
+        return self.common.execute_query(query, limit, params=params)
+    
+    def execute_query_columnar(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[str], List[List[Any]]]:
+        """AI: Execute raw SQL query returning (columns, rows). Delegates to common operations."""
+        return self.common.execute_query_columnar(query, limit, params=params)
+    
+    def get_database_schema(self, include_statistics: bool = True) -> Dict[str, Any]:
         """AI: Get database schema information. Delegates to common operations."""
-        return self.common.get_database_schema()
+        return self.common.get_database_schema(include_statistics)
+    
+    def data_version(self) -> int:
+        """AI: Database change counter for cache validation. Delegates to the connection."""
+        return self.db_connection.data_version()
     
     def get_processing_stats(self) -> Dict[str, Any]:
         """AI: Get processing statistics. Delegates to common operations."""
@@ -134,5 +177,8 @@ class DatabaseOperations:
     
     def close(self):
         """AI: Close database connection and cleanup resources."""
+        for handler in (self.nginx, self.nexus):
+            if handler.parquet_sink is not None:
+                handler.parquet_sink.close()
         if hasattr(self.db_connection, 'close'):
             self.db_connection.close()
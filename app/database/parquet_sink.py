@@ -0,0 +1,179 @@
+"""
+AI: Optional columnar (Parquet) archive of ingested log rows.
+
+Analytical GROUP BY queries over append-only logs only need one or two
+columns. When enabled, every committed batch_insert chunk is also appended to
+a Parquet dataset (zstd, hive-partitioned by day and file_source) and
+selected aggregations are answered by DuckDB over those files instead of
+scanning the SQLite row store. Rows are flushed when their transaction
+commits, and the dataset records how many rows it holds, so readers in any
+process only use it while it matches the SQLite table.
+
+Requires the optional 'analytics' extra (pyarrow, duckdb); both are imported
+lazily so the application runs without them when the sink is not configured.
+"""
+
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from ..utils.logger import logger
+
+
+class ParquetSink:
+    """
+    AI: Buffered Parquet writer and DuckDB query helper for one log table.
+
+    Rows are buffered in memory and written as one file per flush, so each
+    file holds at most one row group of ROW_GROUP_SIZE rows per partition.
+    """
+
+    ROW_GROUP_SIZE = 128_000
+    PARTITION_COLUMNS = ('day', 'file_source')
+    # File in the dataset directory holding the number of archived rows
+    ROW_COUNT_FILE = '_archived_rows'
+
+    def __init__(self, root_dir: str, table_name: str, columns: Sequence[str],
+                 fresh_start: bool = False, row_group_size: int = ROW_GROUP_SIZE):
+        """
+        AI: Initialize sink writing below root_dir/table_name.
+
+        Args:
+            root_dir: Base directory for Parquet datasets
+            table_name: Dataset (sub-directory) name, e.g. 'nginx_logs'
+            columns: Row keys to archive (file_source and timestamp required)
+            fresh_start: Remove an existing dataset, mirroring the fresh database
+            row_group_size: Buffered rows that trigger a flush
+
+        Raises:
+            ImportError: When pyarrow or duckdb is not installed
+        """
+        try:
+            # Fail at configuration time rather than on the first flush/query
+            import duckdb  # noqa: F401
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "Parquet archive requires the 'analytics' extra (pyarrow, duckdb): "
+                "pip install 'logminer[analytics]'"
+            ) from e
+
+        self.path = Path(root_dir) / table_name
+        if fresh_start:
+            shutil.rmtree(self.path, ignore_errors=True)
+        self.columns = tuple(columns)
+        self.row_group_size = row_group_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def source(self) -> str:
+        """AI: DuckDB table expression reading the whole dataset."""
+        glob = os.path.join(self.path, '**', '*.parquet').replace("'", "''")
+        return f"read_parquet('{glob}', hive_partitioning = true)"
+
+    def append(self, rows: List[Dict[str, Any]]) -> None:
+        """AI: Buffer committed rows; flush once a full row group is pending."""
+        with self._lock:
+            self._buffer.extend({name: row.get(name) for name in self.columns} for row in rows)
+            if len(self._buffer) >= self.row_group_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """AI: Write any buffered rows to a new Parquet file set."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """AI: Flush implementation; caller holds self._lock."""
+        if not self._buffer:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        rows, self._buffer = self._buffer, []
+        # Batches are clustered in time: format each distinct day only once
+        days: Dict[Any, str] = {}
+        for row in rows:
+            timestamp = row.get('timestamp')
+            if timestamp is None:
+                row['day'] = 'unknown'
+                continue
+            date = timestamp.date()
+            day = days.get(date)
+            if day is None:
+                day = days[date] = date.isoformat()
+            row['day'] = day
+
+        archived = self.archived_rows()
+        table = pa.Table.from_pylist(rows)
+        pq.write_to_dataset(
+            table,
+            root_path=str(self.path),
+            partition_cols=list(self.PARTITION_COLUMNS),
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            compression='zstd',
+            row_group_size=self.row_group_size,
+        )
+        # Count recorded only after the files exist (atomic replace)
+        count_file = self.path / self.ROW_COUNT_FILE
+        temp_file = count_file.with_name(f"{self.ROW_COUNT_FILE}.{uuid.uuid4().hex}")
+        temp_file.write_text(str(archived + len(rows)))
+        os.replace(temp_file, count_file)
+        logger.debug("Flushed %d rows to Parquet dataset %s", len(rows), self.path)
+
+    def archived_rows(self) -> int:
+        """
+        AI: Number of rows written to the dataset, possibly by another process.
+
+        Returns:
+            Recorded row count (0 for a missing or unreadable count file)
+        """
+        try:
+            return int((self.path / self.ROW_COUNT_FILE).read_text())
+        except (OSError, ValueError):
+            return 0
+
+    def can_query(self, table_rows: int) -> bool:
+        """
+        AI: True when the dataset holds exactly the rows of the SQLite table.
+
+        Rows are matched by count only, so the table must be append-only:
+        deleting rows and ingesting the same number again would pass the
+        check with a stale dataset. Pending rows are flushed first. A dataset that is behind (rows not
+        flushed by another process, or lost in a crash) is not used, so
+        analytics never return partial results.
+
+        Args:
+            table_rows: Committed row count of the archived table
+
+        Returns:
+            True when queries can be answered from the dataset
+        """
+        self.flush()
+        return table_rows > 0 and self.archived_rows() == table_rows
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """
+        AI: Run a DuckDB query; '{source}' in sql is replaced by the dataset scan.
+
+        Args:
+            sql: SQL with ? placeholders and a {source} table placeholder
+            params: Positional parameters
+
+        Returns:
+            List of result rows as dictionaries
+        """
+        import duckdb
+
+        with duckdb.connect() as connection:
+            cursor = connection.execute(sql.format(source=self.source), list(params))
+            names = [column[0] for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def close(self) -> None:
+        """AI: Flush remaining rows."""
+        self.flush()
@@ -10,17 +10,210 @@ Implements file finding with pattern matching and archive support:
 """
 
 import fnmatch
+import hashlib
+import itertools
 import os
+import re
+import shutil
 import tarfile
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, List, Set, Tuple, TextIO
+from types import TracebackType
+from typing import IO, Any, Dict, FrozenSet, Iterator, List, Literal, NamedTuple, Optional, Pattern, Sequence, Set, Tuple, TextIO, Type
 import tempfile
 
+try:
+    # Optional SIMD-accelerated inflate (pip install 'logminer[compression]')
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
 from ..config import Settings
 from ..utils.logger import logger
 
 
+# Read buffer for archive files (sequential access, few large reads)
+ARCHIVE_READ_BUFFER = 1 << 20
+
+# Read buffer for log files handed to processors
+LOG_READ_BUFFER = 1 << 20
+
+# Discovered files handed out per generator resume
+DISCOVERY_BATCH_SIZE = 512
+
+# Cached archive extractions (cache_dir) not reused for this many seconds are
+# removed by cleanup_temp_dirs(); every reuse refreshes an entry's age
+ARCHIVE_CACHE_MAX_AGE = 7 * 24 * 3600
+
+# Bytes read from each end of an archive for its extraction cache key
+ARCHIVE_CACHE_KEY_SAMPLE = 1 << 20
+
+# Nested sibling archives extracted concurrently per parent archive
+MAX_EXTRACTION_WORKERS = min(4, os.cpu_count() or 1)
+
+_GLOB_MAGIC = frozenset("*?[")
+
+
+class _CompiledPatterns(NamedTuple):
+    """AI: Glob patterns bucketed by how cheaply they can be tested."""
+    exacts: FrozenSet[str]  # No wildcard: equality
+    prefixes: Tuple[str, ...]  # "prefix*": str.startswith
+    suffixes: Tuple[str, ...]  # "*suffix": str.endswith
+    regex: Optional[Pattern[str]]  # Everything else, combined into one regex
+    key: int  # Unique id of this pattern set for _match_cached
+
+
+# Compiled pattern sets by key; pattern sets come from configuration, so few
+_PATTERN_SETS: Dict[int, _CompiledPatterns] = {}
+_pattern_set_keys = itertools.count()
+
+
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...]) -> _CompiledPatterns:
+    """
+    AI: Classify and compile glob patterns once for case-insensitive matching.
+
+    Literal patterns and single leading/trailing "*" globs (access.log,
+    access.log*, *.tar) are tested with ==/startswith/endswith; only patterns
+    with ?, [ or an inner * are translated, combined into one alternation.
+
+    Args:
+        patterns: Glob patterns
+
+    Returns:
+        _CompiledPatterns for lowercased filenames
+    """
+    exacts, prefixes, suffixes, complex_patterns = set(), [], [], []
+    for pattern in patterns:
+        pattern = pattern.lower()
+        body = pattern.strip("*")
+        if _GLOB_MAGIC.isdisjoint(body) and len(pattern) - len(body) <= 1:
+            if pattern.endswith("*"):
+                prefixes.append(body)
+            elif pattern.startswith("*"):
+                suffixes.append(body)
+            else:
+                exacts.add(pattern)
+        else:
+            complex_patterns.append(pattern)
+    regex = None
+    if complex_patterns:
+        regex = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in complex_patterns))
+    compiled = _CompiledPatterns(
+        frozenset(exacts), tuple(prefixes), tuple(suffixes), regex, next(_pattern_set_keys)
+    )
+    _PATTERN_SETS[compiled.key] = compiled
+    return compiled
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern_setting(pattern_setting: str) -> _CompiledPatterns:
+    """
+    AI: Compile a comma-separated pattern setting (e.g. "access.log*,*.log").
+
+    Cached on the raw string, so the split happens once per distinct setting.
+    """
+    return _compile_patterns(tuple(p.strip() for p in pattern_setting.split(',')))
+
+
+@lru_cache(maxsize=10_000)
+def _match_cached(name: str, key: int) -> bool:
+    """
+    AI: Match a lowercased filename against the pattern set with the given key.
+
+    Rotated log names (access.log.1, request.log.2.gz) recur across scans and
+    archive levels; repeats cost one dict lookup. Keys are never reused, so
+    entries cannot go stale.
+    """
+    compiled = _PATTERN_SETS[key]
+    return (
+        name in compiled.exacts
+        or name.startswith(compiled.prefixes)
+        or name.endswith(compiled.suffixes)
+        or (compiled.regex is not None and compiled.regex.match(name) is not None)
+    )
+
+
+_COMPOUND_ARCHIVE_EXTENSIONS = ('.tar.gz', '.tar.bz2')
+_ARCHIVE_EXTENSIONS = frozenset({'.tar', '.zip', '.gz'})
+_TAR_EXTENSIONS = frozenset({'.tar', '.tar.gz', '.tar.bz2'})
+
+# Absolute paths (POSIX or drive letter) and ".." components, matched after
+# backslashes are normalized to "/"
+_UNSAFE_MEMBER_PATH = re.compile(r'^/|^[A-Za-z]:|(?:^|/)\.\.(?:/|$)')
+
+
+# posix_fadvise hints (None where unsupported, e.g. macOS/Windows): files are
+# read once front to back, so readahead more and drop the pages afterwards
+_FADV_SEQUENTIAL = getattr(os, 'POSIX_FADV_SEQUENTIAL', None)
+_FADV_DONTNEED = getattr(os, 'POSIX_FADV_DONTNEED', None)
+
+
+def _advise(file_obj: IO[Any], advice: Optional[int]) -> None:
+    """AI: Give the kernel an access-pattern hint for a whole open file, if supported."""
+    if advice is None:
+        return
+    try:
+        os.posix_fadvise(file_obj.fileno(), 0, 0, advice)
+    except OSError:
+        pass  # Advisory only (e.g. pipes or filesystems without support)
+
+
+def _archive_extension(filename: str) -> Optional[str]:
+    """
+    AI: Classify a filename by its (lowercased) archive extension.
+
+    Compound extensions win over the last suffix, so logs.tar.gz is '.tar.gz'
+    rather than '.gz', also for dotted names such as logs.2025.05.tar.gz.
+
+    Args:
+        filename: File name (not a full path)
+
+    Returns:
+        One of _COMPOUND_ARCHIVE_EXTENSIONS or _ARCHIVE_EXTENSIONS, or None
+    """
+    name = filename.lower()
+    for extension in _COMPOUND_ARCHIVE_EXTENSIONS:
+        if name.endswith(extension):
+            return extension
+    dot = name.rfind('.')
+    if dot > 0 and name[dot:] in _ARCHIVE_EXTENSIONS:
+        return name[dot:]
+    return None
+
+
+def _iter_scandir(base_dir: Path) -> Iterator[os.DirEntry]:
+    """
+    AI: Yield DirEntry objects for all files below base_dir.
+
+    Depth-first traversal with an explicit stack of os.scandir() iterators.
+    Entry type checks reuse the data returned while listing the directory,
+    so no per-file stat() is issued. Like os.walk, symlinked directories are
+    not descended into; symlinks to files are yielded.
+
+    Args:
+        base_dir: Directory to traverse
+
+    Yields:
+        DirEntry for each regular file (or symlink to one)
+    """
+    stack = [os.fspath(base_dir)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError as e:
+            logger.warn("WARNING: Cannot scan directory %s: %s", directory, e)
+
+
 class LogFileDiscovery:
     """
     AI: Discovers log files matching configured patterns in directories and archives.
@@ -31,18 +224,26 @@ class LogFileDiscovery:
     - Archive extraction (tar, tar.gz, zip)
     - Nested archive processing with depth limits
     - Memory-efficient file iteration
+    
+    Extracted archives live in temp dirs until cleanup_temp_dirs() is called,
+    either explicitly or by using the instance as a context manager:
+        with LogFileDiscovery(settings) as discovery:
+            files = list(discovery.discover_nginx_files())
     """
     
-    def __init__(self, settings: Settings, max_archive_depth: int = 3):
+    def __init__(self, settings: Settings, max_archive_depth: int = 3, cache_dir: Optional[str] = None):
         """
         AI: Initialize file discovery with configuration.
         
         Args:
             settings: Application settings with directories and patterns
             max_archive_depth: Maximum depth for nested archive extraction
+            cache_dir: Optional directory keeping archive extractions between
+                      runs; unchanged archives are not extracted again
         """
         self.settings = settings
         self.max_archive_depth = max_archive_depth
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self._temp_dirs: List[str] = []  # Track temp dirs for cleanup
     
     def discover_nginx_files(self) -> Iterator[Tuple[Path, str]]:
@@ -52,12 +253,11 @@ class LogFileDiscovery:
         Yields:
             Tuple of (file_path, source_description) for each nginx log file
         """
-        nginx_patterns = self._get_nginx_patterns()
-        yield from self._discover_files_by_patterns(
+        return itertools.chain.from_iterable(self._discover_files_by_patterns(
             Path(self.settings.nginx_dir),
-            nginx_patterns,
+            self._nginx_matcher(),
             "nginx"
-        )
+        ))
     
     def discover_nexus_files(self) -> Iterator[Tuple[Path, str]]:
         """
@@ -66,32 +266,38 @@ class LogFileDiscovery:
         Yields:
             Tuple of (file_path, source_description) for each Nexus log file
         """
-        nexus_patterns = self._get_nexus_patterns()
-        yield from self._discover_files_by_patterns(
+        return itertools.chain.from_iterable(self._discover_files_by_patterns(
             Path(self.settings.nexus_dir),
-            nexus_patterns,
+            self._nexus_matcher(),
             "nexus"
-        )
+        ))
     
-    def _get_nginx_patterns(self) -> List[str]:
-        """AI: Get nginx filename patterns from configuration."""
-        return [p.strip() for p in self.settings.nginx_pattern.split(',')]
+    def _nginx_matcher(self) -> _CompiledPatterns:
+        """AI: Get compiled nginx filename patterns from configuration."""
+        return _compile_pattern_setting(self.settings.nginx_pattern)
     
-    def _get_nexus_patterns(self) -> List[str]:
-        """AI: Get Nexus filename patterns from configuration."""
-        return [p.strip() for p in self.settings.nexus_pattern.split(',')]
+    def _nexus_matcher(self) -> _CompiledPatterns:
+        """AI: Get compiled Nexus filename patterns from configuration."""
+        return _compile_pattern_setting(self.settings.nexus_pattern)
     
-    def _discover_files_by_patterns(self, base_dir: Path, patterns: List[str], log_type: str) -> Iterator[Tuple[Path, str]]:
+    def _discover_files_by_patterns(self, base_dir: Path, patterns: _CompiledPatterns, log_type: str) -> Iterator[List[Tuple[Path, str]]]:
         """
         AI: Discover files matching patterns in directory tree.
         
+        Plain file matches are emitted in lists of up to DISCOVERY_BATCH_SIZE,
+        so the generator resumes once per batch rather than once per file;
+        the discover_* methods flatten them with chain.from_iterable. Archive
+        members are emitted as soon as their archive is extracted (pending
+        plain files first, keeping directory order), so processing starts
+        without waiting for further archives to be extracted.
+        
         Args:
             base_dir: Base directory to search
-            patterns: List of glob patterns to match
+            patterns: Compiled glob patterns to match
             log_type: Type of logs for source tracking
             
         Yields:
-            Tuple of (file_path, source_description) for matching files
+            Lists of (file_path, source_description) for matching files
         """
         if not base_dir.exists():
             logger.warn("WARNING: %s directory does not exist: %s", log_type, base_dir)
@@ -103,37 +309,72 @@ class LogFileDiscovery:
 
         logger.info("Scanning %s directory: %s", log_type, base_dir)
         
-        # Track processed files to avoid duplicates
-        processed_files: Set[str] = set()
+        batch: List[Tuple[Path, str]] = []
         
-        # Walk directory tree
-        for root, dirs, files in os.walk(base_dir):
-            root_path = Path(root)
+        for entry in self._iter_matches(base_dir, patterns):
+            file_path = Path(entry.path)
+            if self._is_archive_file(file_path):
+                if batch:
+                    yield batch
+                    batch = []
+                # Process archive contents
+                for member in self._process_archive_recursive(
+                    file_path, patterns, log_type, depth=0
+                ):
+                    yield [member]
+                continue
             
-            # Check each file against patterns
-            for filename in files:
-                file_path = root_path / filename
-                
-                # Avoid processing same file multiple times
-                file_key = str(file_path.resolve())
-                if file_key in processed_files:
+            # Direct file match
+            source_desc = f"{log_type}:{entry.name}"
+            batch.append((file_path, source_desc))
+            if len(batch) >= DISCOVERY_BATCH_SIZE:
+                yield batch
+                batch = []
+        
+        if batch:
+            yield batch
+    
+    def _iter_matches(self, base_dir: Path, compiled: _CompiledPatterns) -> Iterator[os.DirEntry]:
+        """
+        AI: Yield files below base_dir whose names match compiled, once each.
+        
+        Shared traversal for configured log directories and extracted
+        archives. Directories are not followed, so only file symlinks can
+        repeat a match; regular files need no stat() or bookkeeping.
+        
+        Args:
+            base_dir: Directory to traverse
+            compiled: Patterns from _compile_patterns()
+            
+        Yields:
+            DirEntry for each matching file
+        """
+        base_real = os.path.realpath(base_dir)
+        linked_files: Set[Tuple[int, int]] = set()
+        
+        for entry in _iter_scandir(base_dir):
+            # Check if file matches any pattern
+            if not self._matches_compiled(entry.name, compiled):
+                continue
+            
+            if entry.is_symlink():
+                # Skip links to a file matched directly in this tree or
+                # already reached through another link
+                target = os.path.realpath(entry.path)
+                if (
+                    os.path.commonpath((base_real, target)) == base_real
+                    and self._matches_compiled(os.path.basename(target), compiled)
+                ):
                     continue
-                
-                # Check if file matches any pattern
-                if self._matches_patterns(filename, patterns):
-                    processed_files.add(file_key)
-                    
-                    if self._is_archive_file(file_path):
-                        # Process archive contents
-                        yield from self._process_archive_recursive(
-                            file_path, patterns, log_type, depth=0
-                        )
-                    else:
-                        # Direct file match
-                        source_desc = f"{log_type}:{file_path.name}"
-                        yield (file_path, source_desc)
+                stat_result = entry.stat()
+                link_key = (stat_result.st_dev, stat_result.st_ino)
+                if link_key in linked_files:
+                    continue
+                linked_files.add(link_key)
+            
+            yield entry
     
-    def _matches_patterns(self, filename: str, patterns: List[str]) -> bool:
+    def _matches_patterns(self, filename: str, patterns: Sequence[str]) -> bool:
         """
         AI: Check if filename matches any of the provided patterns.
         
@@ -144,7 +385,11 @@ class LogFileDiscovery:
         Returns:
             True if filename matches at least one pattern
         """
-        return any(fnmatch.fnmatch(filename.lower(), pattern.lower()) for pattern in patterns)
+        return self._matches_compiled(filename, _compile_patterns(tuple(patterns)))
+    
+    def _matches_compiled(self, filename: str, compiled: _CompiledPatterns) -> bool:
+        """AI: Check filename (case-insensitively) against _compile_patterns() output."""
+        return _match_cached(filename.lower(), compiled.key)
     
     def _is_archive_file(self, file_path: Path) -> bool:
         """
@@ -156,21 +401,15 @@ class LogFileDiscovery:
         Returns:
             True if file is a supported archive
         """
-        suffix = file_path.suffix.lower()
-        suffixes = ''.join(file_path.suffixes).lower()
-        
-        return (
-            suffix in ['.tar', '.zip', '.gz'] or
-            suffixes in ['.tar.gz', '.tar.bz2']
-        )
+        return _archive_extension(file_path.name) is not None
     
-    def _process_archive_recursive(self, archive_path: Path, patterns: List[str], log_type: str, depth: int) -> Iterator[Tuple[Path, str]]:
+    def _process_archive_recursive(self, archive_path: Path, patterns: _CompiledPatterns, log_type: str, depth: int) -> Iterator[Tuple[Path, str]]:
         """
         AI: Process archive recursively with depth limits.
         
         Args:
             archive_path: Path to archive file
-            patterns: Patterns to match within archive
+            patterns: Compiled patterns to match within archive
             log_type: Type of logs for source tracking
             depth: Current nesting depth
             
@@ -184,21 +423,90 @@ class LogFileDiscovery:
         logger.info("Processing archive (depth %d): %s", depth, archive_path)
         
         try:
-            # Create temporary directory for extraction
-            temp_dir = tempfile.mkdtemp(prefix=f"logminer_archive_{depth}_")
-            self._temp_dirs.append(temp_dir)
-            temp_path = Path(temp_dir)
+            if self.cache_dir is not None:
+                extract_path = self._cached_extraction(archive_path, self.cache_dir)
+            else:
+                # Create temporary directory for extraction
+                temp_dir = tempfile.mkdtemp(prefix=f"logminer_archive_{depth}_")
+                self._temp_dirs.append(temp_dir)
+                extract_path = Path(temp_dir)
+                
+                # Extract archive based on type
+                if not self._extract_archive(archive_path, extract_path):
+                    extract_path = None
             
-            # Extract archive based on type
-            if self._extract_archive(archive_path, temp_path):
+            if extract_path is not None:
                 # Process extracted contents
                 yield from self._process_extracted_contents(
-                    temp_path, patterns, log_type, archive_path.name, depth
+                    extract_path, patterns, log_type, archive_path.name, depth
                 )
             
         except Exception as e:
             logger.error("ERROR: Failed to process archive %s: %s", archive_path, e)
     
+    def _cached_extraction(self, archive_path: Path, cache_dir: Path) -> Optional[Path]:
+        """
+        AI: Extract archive into cache_dir, reusing a previous extraction.
+        
+        The cache key covers the archive's resolved path, size and mtime and a
+        hash of its first and last ARCHIVE_CACHE_KEY_SAMPLE bytes (the whole
+        file when smaller), so same-named copies from different directories
+        or with preserved timestamps never share an entry. Extraction goes to
+        a staging directory renamed into place on success; an existing key
+        directory is therefore always complete. Cached directories outlive
+        cleanup_temp_dirs() until unused for ARCHIVE_CACHE_MAX_AGE.
+        
+        Args:
+            archive_path: Path to archive file
+            cache_dir: Directory holding cached extractions (self.cache_dir)
+            
+        Returns:
+            Directory holding the extracted contents, or None if extraction failed
+        """
+        key = self._archive_cache_key(archive_path)
+        extract_path = cache_dir / key
+        
+        if extract_path.is_dir():
+            logger.info("Reusing cached extraction of %s", archive_path)
+            os.utime(extract_path)  # Mark as recently used for eviction
+            return extract_path
+        
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        staging_path = Path(tempfile.mkdtemp(prefix=f".{key}_", dir=cache_dir))
+        if not self._extract_archive(archive_path, staging_path):
+            shutil.rmtree(staging_path, ignore_errors=True)
+            return None
+        
+        try:
+            staging_path.rename(extract_path)
+        except OSError:
+            # Extracted concurrently by another run; keep the existing copy
+            shutil.rmtree(staging_path, ignore_errors=True)
+        return extract_path
+    
+    @staticmethod
+    def _archive_cache_key(archive_path: Path) -> str:
+        """
+        AI: Cache directory name identifying one archive's exact contents.
+        
+        Args:
+            archive_path: Path to archive file
+            
+        Returns:
+            Hex digest of the resolved path, size, mtime and sampled content
+        """
+        stat_result = archive_path.stat()
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{archive_path.resolve()}\0{stat_result.st_size}\0{stat_result.st_mtime_ns}\0".encode()
+        )
+        with open(archive_path, 'rb') as archive:
+            digest.update(archive.read(ARCHIVE_CACHE_KEY_SAMPLE))
+            if stat_result.st_size > 2 * ARCHIVE_CACHE_KEY_SAMPLE:
+                archive.seek(-ARCHIVE_CACHE_KEY_SAMPLE, os.SEEK_END)
+            digest.update(archive.read(ARCHIVE_CACHE_KEY_SAMPLE))
+        return digest.hexdigest()
+    
     def _extract_archive(self, archive_path: Path, extract_to: Path) -> bool:
         """
         AI: Extract archive to temporary directory.
@@ -211,43 +519,48 @@ class LogFileDiscovery:
             True if extraction succeeded, False otherwise
         """
         try:
-            suffixes = ''.join(archive_path.suffixes).lower()
+            extension = _archive_extension(archive_path.name)
             
-            if suffixes in ['.tar.gz', '.tar.bz2'] or archive_path.suffix == '.tar':
-                # Handle tar archives
-                with tarfile.open(archive_path, 'r:*') as tar:
-                    # Extract safely, checking for path traversal
-                    for member in tar.getmembers():
-                        if self._is_safe_path(member.name):
-                            # Use filter='data' to comply with Python 3.14+ security requirements
-                            # Path traversal protection is already handled by _is_safe_path()
-                            tar.extract(member, extract_to, filter='data')
-                        else:
-                            logger.warn("WARNING: Unsafe path in archive: %s", member.name)
+            if extension in _TAR_EXTENSIONS:
+                # Handle tar archives in stream mode: members are extracted as
+                # they are read, in one sequential pass with a large buffer
+                with open(archive_path, 'rb', buffering=ARCHIVE_READ_BUFFER) as raw:
+                    _advise(raw, _FADV_SEQUENTIAL)
+                    mode: Literal['r|', 'r|*']
+                    if extension == '.tar.gz':
+                        # Inflate with the (possibly accelerated) gzip module
+                        stream, mode = gzip.open(raw, 'rb'), 'r|'
+                    else:
+                        stream, mode = raw, 'r|*'
+                    with stream, tarfile.open(fileobj=stream, mode=mode) as tar:
+                        # Extract safely, checking for path traversal
+                        for member in tar:
+                            if self._is_safe_path(member.name):
+                                # Use filter='data' to comply with Python 3.14+ security requirements
+                                # Path traversal protection is already handled by _is_safe_path()
+                                tar.extract(member, extract_to, filter='data')
+                            else:
+                                logger.warn("WARNING: Unsafe path in archive: %s", member.name)
+                        _advise(raw, _FADV_DONTNEED)
                 return True
                 
-            elif archive_path.suffix == '.zip':
+            elif extension == '.zip':
                 # Handle zip archives
                 with zipfile.ZipFile(archive_path, 'r') as zip_file:
-                    for member in zip_file.namelist():
-                        if self._is_safe_path(member):
-                            zip_file.extract(member, extract_to)
-                        else:
-                            logger.warn("WARNING: Unsafe path in archive: %s", member)
+                    self._extract_zip_members(zip_file, extract_to)
                 return True
                 
-            elif archive_path.suffix == '.gz' and not archive_path.name.endswith('.tar.gz'):
+            elif extension == '.gz':
                 # Handle single gzip files
-                import gzip
-                import shutil
-                
                 # Create output filename by removing .gz extension
                 output_name = archive_path.stem
                 output_path = extract_to / output_name
                 
-                with gzip.open(archive_path, 'rb') as gz_file:
-                    with open(output_path, 'wb') as out_file:
-                        shutil.copyfileobj(gz_file, out_file)
+                with open(archive_path, 'rb', buffering=ARCHIVE_READ_BUFFER) as raw:
+                    _advise(raw, _FADV_SEQUENTIAL)
+                    with gzip.open(raw, 'rb') as gz_file, open(output_path, 'wb') as out_file:
+                        shutil.copyfileobj(gz_file, out_file, ARCHIVE_READ_BUFFER)
+                    _advise(raw, _FADV_DONTNEED)
                 return True
                 
             else:
@@ -258,6 +571,48 @@ class LogFileDiscovery:
             logger.error("ERROR: Failed to extract %s: %s", archive_path, e)
             return False
     
+    def _extract_zip_members(self, zip_file: zipfile.ZipFile, extract_to: Path) -> None:
+        """
+        AI: Extract all safe members of an open zip archive.
+        
+        Directories are created up front; compressed members are then inflated
+        concurrently (zlib releases the GIL and ZipFile serializes the shared
+        file reads), stored members are copied sequentially.
+        
+        Args:
+            zip_file: Open zip archive
+            extract_to: Directory to extract to
+        """
+        # (member, target path) pairs
+        compressed: List[Tuple[zipfile.ZipInfo, Path]] = []
+        stored: List[Tuple[zipfile.ZipInfo, Path]] = []
+        for info in zip_file.infolist():
+            if not self._is_safe_path(info.filename):
+                logger.warn("WARNING: Unsafe path in archive: %s", info.filename)
+                continue
+            target = extract_to / info.filename
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            (stored if info.compress_type == zipfile.ZIP_STORED else compressed).append((info, target))
+        
+        def extract(member: Tuple[zipfile.ZipInfo, Path]) -> None:
+            info, target = member
+            with zip_file.open(info) as source, open(target, 'wb') as out_file:
+                shutil.copyfileobj(source, out_file, ARCHIVE_READ_BUFFER)
+        
+        for member in stored:
+            extract(member)
+        if len(compressed) > 1:
+            with ThreadPoolExecutor(max_workers=MAX_EXTRACTION_WORKERS, thread_name_prefix="unzip") as executor:
+                # Consume results so member errors propagate
+                for _ in executor.map(extract, compressed):
+                    pass
+        else:
+            for member in compressed:
+                extract(member)
+    
     def _is_safe_path(self, path: str) -> bool:
         """
         AI: Check if extracted path is safe (no directory traversal).
@@ -268,20 +623,15 @@ class LogFileDiscovery:
         Returns:
             True if path is safe to extract
         """
-        return not (
-            os.path.isabs(path) or
-            '..' in path or
-            path.startswith('/') or
-            '\\' in path.replace('\\\\', '')  # Allow escaped backslashes
-        )
+        return _UNSAFE_MEMBER_PATH.search(path.replace('\\', '/')) is None
     
-    def _process_extracted_contents(self, extract_path: Path, patterns: List[str], log_type: str, archive_name: str, depth: int) -> Iterator[Tuple[Path, str]]:
+    def _process_extracted_contents(self, extract_path: Path, patterns: _CompiledPatterns, log_type: str, archive_name: str, depth: int) -> Iterator[Tuple[Path, str]]:
         """
         AI: Process contents of extracted archive.
         
         Args:
             extract_path: Path where archive was extracted
-            patterns: Patterns to match
+            patterns: Compiled patterns to match
             log_type: Type of logs for source tracking
             archive_name: Original archive filename
             depth: Current nesting depth
@@ -289,25 +639,34 @@ class LogFileDiscovery:
         Yields:
             Tuple of (file_path, source_description) for matching files
         """
+        nested_archives: List[Path] = []
+        
         # Walk extracted directory
-        for root, dirs, files in os.walk(extract_path):
-            root_path = Path(root)
+        for entry in self._iter_matches(extract_path, patterns):
+            file_path = Path(entry.path)
+            if self._is_archive_file(file_path):
+                # Nested archive - extracted after the walk
+                nested_archives.append(file_path)
+            else:
+                # Direct file match
+                relative_path = file_path.relative_to(extract_path)
+                source_desc = f"{log_type}:{archive_name}->{relative_path}"
+                yield (file_path, source_desc)
+        
+        if len(nested_archives) == 1:
+            yield from self._process_archive_recursive(
+                nested_archives[0], patterns, log_type, depth + 1
+            )
+        elif nested_archives:
+            # Sibling archives are independent: extract them concurrently
+            # (decompression releases the GIL), yielding in archive order
+            def process(nested_path: Path) -> List[Tuple[Path, str]]:
+                return list(self._process_archive_recursive(nested_path, patterns, log_type, depth + 1))
             
-            for filename in files:
-                file_path = root_path / filename
-                
-                if self._matches_patterns(filename, patterns):
-                    if self._is_archive_file(file_path):
-                        # Nested archive - process recursively
-                        nested_source = f"{archive_name}->{filename}"
-                        yield from self._process_archive_recursive(
-                            file_path, patterns, log_type, depth + 1
-                        )
-                    else:
-                        # Direct file match
-                        relative_path = file_path.relative_to(extract_path)
-                        source_desc = f"{log_type}:{archive_name}->{relative_path}"
-                        yield (file_path, source_desc)
+            workers = min(len(nested_archives), MAX_EXTRACTION_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="archive") as executor:
+                for results in executor.map(process, nested_archives):
+                    yield from results
     
     def cleanup_temp_dirs(self):
         """
@@ -315,8 +674,6 @@ class LogFileDiscovery:
 
         Should be called when file discovery is complete to free disk space.
         """
-        import shutil
-
         for temp_dir in self._temp_dirs:
             try:
                 if os.path.exists(temp_dir):
@@ -326,9 +683,45 @@ class LogFileDiscovery:
                 logger.warn("WARNING: Failed to cleanup temp directory %s: %s", temp_dir, e)
 
         self._temp_dirs.clear()
+        
+        if self.cache_dir is not None:
+            self._evict_cached_extractions(self.cache_dir)
     
-    def __del__(self):
-        """AI: Ensure cleanup on object destruction."""
+    def _evict_cached_extractions(self, cache_dir: Path, max_age: float = ARCHIVE_CACHE_MAX_AGE) -> None:
+        """
+        AI: Remove cache_dir entries not used within max_age seconds.
+        
+        Covers extractions of archives that changed or disappeared (their key
+        is never looked up again) and staging directories left by aborted runs.
+        
+        Args:
+            cache_dir: Directory holding cached extractions (self.cache_dir)
+            max_age: Seconds since last use after which an entry is removed
+        """
+        cutoff = time.time() - max_age
+        try:
+            entries = list(cache_dir.iterdir())
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                    shutil.rmtree(entry)
+                    logger.info("Evicted cached extraction: %s", entry)
+            except OSError as e:
+                logger.warn("WARNING: Failed to evict cached extraction %s: %s", entry, e)
+    
+    def __enter__(self) -> 'LogFileDiscovery':
+        """AI: Context manager entry; temp dirs are removed on exit."""
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """AI: Context manager exit with deterministic temp dir cleanup."""
         self.cleanup_temp_dirs()
 
 
@@ -343,11 +736,19 @@ def create_file_iterator_from_path(file_path: Path, source_description: str) ->
         file_path: Path to file to process
         source_description: Description for tracking file source
 
+    Lines keep their original endings (newline=''), skipping newline
+    translation; processors strip them anyway.
+
     Yields:
         Tuple of (source_description, file_handle) for processing
     """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as file_handle:
+        with open(
+            file_path, 'r', encoding='utf-8', errors='replace',
+            newline='', buffering=LOG_READ_BUFFER
+        ) as file_handle:
+            _advise(file_handle, _FADV_SEQUENTIAL)
             yield (source_description, file_handle)
+            _advise(file_handle, _FADV_DONTNEED)
     except Exception as e:
         logger.error("ERROR: Failed to open file %s: %s", file_path, e)
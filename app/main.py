@@ -26,20 +26,28 @@ Implements Phase 1-3 requirements:
 - Web interface with FastAPI
 """
 
+import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import threading
 import time
+from types import FrameType
+from typing import Optional
 
 import click
-import uvicorn
 
-from .config import Settings, load_settings, validate_configuration
+from .config import Settings, clear_settings_cache, load_settings, validate_configuration
 from .database.connection import DatabaseConnection
 from .database.operations import DatabaseOperations
-from .processing import LogProcessingOrchestrator
-from .utils.logger import logger
-from .web.routes import create_web_app
+from .utils.logger import LogLevel, logger
+
+# uvicorn/FastAPI (web) and the processing pipeline are imported where they
+# are used, so --mcp-stdio and --process-only launches skip loading them
+
+# Web server startup: readiness is polled at this interval up to the timeout
+WEB_STARTUP_TIMEOUT = 10.0
+WEB_STARTUP_POLL_INTERVAL = 0.05
 
 
 @click.command()
@@ -175,6 +183,8 @@ def cli(
         if mcp_stdio and not nginx_dir:
             nginx_dir = "/tmp"
         
+        # Read the environment and .env as they are now, not as first cached
+        clear_settings_cache()
         settings = load_settings(
             nexus_dir=nexus_dir,
             nginx_dir=nginx_dir,
@@ -207,7 +217,7 @@ def cli(
             # Phase 2: Database Setup for stdio mode
             logger.info("📁 Setting up database connection...")
             db_connection = DatabaseConnection(settings.db_name, fresh_start=False)
-            db_ops = DatabaseOperations(db_connection)
+            db_ops = DatabaseOperations(db_connection, parquet_dir=settings.parquet_dir)
             logger.info("📁 Using database: %s", settings.db_name)
 
             # Import and start stdio server
@@ -220,19 +230,26 @@ def cli(
         # Phase 2: Database Setup
         logger.info("\n\nPhase 2: Setting up database...")
         db_connection = DatabaseConnection(settings.db_name)
-        db_ops = DatabaseOperations(db_connection)
+        db_ops = DatabaseOperations(
+            db_connection,
+            parquet_dir=settings.parquet_dir,
+            capture_raw_log=settings.capture_raw_log,
+        )
         logger.info("✓ Database initialized successfully")
 
-        # Phase 3: Application Ready State
-        logger.info("\n\nPhase 3: Application startup complete")
-        logger.info("✓ Ready to process logs from:")
-        logger.info("  - Nexus: %s (patterns: %s)", settings.nexus_dir, settings.nexus_patterns)
-        logger.info("  - nginx: %s (patterns: %s)", settings.nginx_dir, settings.nginx_patterns)
-        logger.info("✓ Database: %s", settings.db_name)
-        logger.info("✓ Web server will start on port %d", settings.web_port)
-
-        if settings.enable_mcp_server:
-            logger.info("✓ MCP server will start on port %d", settings.mcp_port)
+        # Phase 3: Application Ready State (lines only built when INFO is shown)
+        if logger.is_enabled(LogLevel.INFO):
+            ready_lines = [
+                "\n\nPhase 3: Application startup complete",
+                "✓ Ready to process logs from:",
+                f"  - Nexus: {settings.nexus_dir} (patterns: {settings.nexus_patterns})",
+                f"  - nginx: {settings.nginx_dir} (patterns: {settings.nginx_patterns})",
+                f"✓ Database: {settings.db_name}",
+                f"✓ Web server will start on port {settings.web_port}",
+            ]
+            if settings.enable_mcp_server:
+                ready_lines.append(f"✓ MCP server will start on port {settings.mcp_port}")
+            logger.info_lines(*ready_lines)
 
         # Phase 4: Server Startup (placeholder for future phases)
         logger.info("\n\n=== Phase 1 Complete: Foundation Ready ===")
@@ -240,8 +257,11 @@ def cli(
         # Phase 2: Log Processing (if requested)
         if process_logs:
             logger.info("\n\n=== Starting Phase 2: Log Processing ===")
+            from .processing import LogProcessingOrchestrator
             orchestrator = LogProcessingOrchestrator(settings, db_ops)
-            processing_stats = orchestrator.process_all_logs()
+            # One transaction for the whole run instead of one per batch
+            with db_ops.bulk_ingest():
+                processing_stats = orchestrator.process_all_logs()
             logger.info("=== Phase 2 Complete: Log Processing Finished ===")
         else:
             logger.info("Skipping log processing (use --process-logs to process logs)")
@@ -252,33 +272,62 @@ def cli(
             db_ops.close()
             return
 
-        # Phase 3: Web Server Startup
-        logger.info("\n\n=== Starting Phase 3: Web Interface ===")
-        start_web_server(settings, db_ops)
+        # Phase 3/4: Web and MCP server startup, run concurrently
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp-startup") as startup:
+            mcp_started = None
+            if settings.enable_mcp_server:
+                logger.info("\n\n=== Starting Phase 4: MCP Server ===")
+                mcp_started = startup.submit(start_mcp_server, settings, db_ops)
+
+            logger.info("\n\n=== Starting Phase 3: Web Interface ===")
+            start_web_server(settings, db_ops)
 
-        if settings.enable_mcp_server:
-            logger.info("\n\n=== Starting Phase 4: MCP Server ===")
-            start_mcp_server(settings, db_ops)
+            if mcp_started is not None:
+                mcp_started.result()  # Re-raises MCP startup errors
 
         # Keep application running for testing
-        logger.info("\n✓ Application running:")
-        logger.info("  - Web interface: http://localhost:%d", settings.web_port)
-        if settings.enable_mcp_server:
-            logger.info("  - MCP server: http://localhost:%d", settings.mcp_port)
-        logger.info("\nPress Ctrl+C to exit...")
-
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("\nShutting down...")
-            db_ops.close()
+        if logger.is_enabled(LogLevel.INFO):
+            running_lines = [
+                "\n✓ Application running:",
+                f"  - Web interface: http://localhost:{settings.web_port}",
+            ]
+            if settings.enable_mcp_server:
+                running_lines.append(f"  - MCP server: http://localhost:{settings.mcp_port}")
+            running_lines.append("\nPress Ctrl+C to exit...")
+            logger.info_lines(*running_lines)
+
+        wait_for_shutdown()
+        logger.info("\nShutting down...")
+        db_ops.close()
 
     except Exception as e:
         logger.error("ERROR: Application startup failed: %s", e)
         sys.exit(1)
 
 
+def wait_for_shutdown() -> None:
+    """
+    AI: Block the main thread until SIGINT (Ctrl+C) or SIGTERM arrives.
+
+    Waits on an Event set by the signal handler, so the idle process is not
+    woken periodically. Previous signal handlers are restored on return.
+    """
+    stop = threading.Event()
+
+    def request_stop(signum: int, frame: Optional[FrameType]) -> None:
+        stop.set()
+
+    previous_handlers = {
+        signum: signal.signal(signum, request_stop)
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    try:
+        stop.wait()
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+
 def start_web_server(settings: Settings, db_ops: DatabaseOperations) -> None:
     """
     AI: Start FastAPI web server with background thread.
@@ -290,30 +339,36 @@ def start_web_server(settings: Settings, db_ops: DatabaseOperations) -> None:
     try:
         logger.info("Starting web server on port %d...", settings.web_port)
 
+        import uvicorn
+        from .web.routes import create_web_app
+
         # Create FastAPI app
         app = create_web_app(settings)
 
-        # Configure uvicorn
+        # Configure uvicorn; "auto" selects uvloop and httptools, which
+        # uvicorn[standard] installs, and falls back to asyncio/h11
         config = uvicorn.Config(
             app=app,
             host="0.0.0.0",
             port=settings.web_port,
+            loop="auto",
+            http="auto",
             log_level="info",
             access_log=True
         )
 
-        # Start server in background thread
+        # Start server in background thread; Server.run() creates the event
+        # loop from config (asyncio.run(server.serve()) would bypass uvloop)
         server = uvicorn.Server(config)
-
-        def run_server():
-            import asyncio
-            asyncio.run(server.serve())
-
-        server_thread = threading.Thread(target=run_server, daemon=True)
+        server_thread = threading.Thread(target=server.run, daemon=True)
         server_thread.start()
 
-        # Give server time to start
-        time.sleep(2)
+        # Wait until uvicorn reports startup complete (sockets bound)
+        deadline = time.monotonic() + WEB_STARTUP_TIMEOUT
+        while not server.started:
+            if not server_thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError(f"Web server did not start on port {settings.web_port}")
+            time.sleep(WEB_STARTUP_POLL_INTERVAL)
         logger.info("✓ Web server started on http://localhost:%d", settings.web_port)
 
     except Exception as e:
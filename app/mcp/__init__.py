@@ -15,6 +15,7 @@ from .schemas import (
     DatabaseSchemaResponse,
     ExecuteSQLRequest,
     ExecuteSQLResponse, 
+    ExecuteSQLColumnarResponse,
     TableSampleRequest,
     TableSampleResponse,
     MCPErrorResponse
@@ -26,6 +27,7 @@ __all__ = [
     "DatabaseSchemaResponse",
     "ExecuteSQLRequest",
     "ExecuteSQLResponse",
+    "ExecuteSQLColumnarResponse",
     "TableSampleRequest", 
     "TableSampleResponse",
     "MCPErrorResponse"
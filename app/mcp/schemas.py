@@ -3,40 +3,89 @@ AI: MCP request/response schemas for log analysis tools.
 
 Defines the JSON schema structures for MCP tool inputs and outputs,
 ensuring proper validation and type safety for LLM interactions.
+
+Requests carry LLM-supplied input and are validated with pydantic.
+Responses are built by the tools from trusted values only, so they are
+plain slotted dataclasses: no per-field validation and no copying of
+result rows on construction.
 """
 
-from typing import Any, Dict, List, Optional
+import dataclasses
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
-class TableSchema(BaseModel):
+class _Response:
+    """AI: Base for response dataclasses; model_dump() matches the pydantic API."""
+    __slots__ = ()
+    # Set by @dataclass on every subclass
+    __dataclass_fields__: ClassVar[Dict[str, 'dataclasses.Field[Any]']]
+
+    def model_dump(self) -> Dict[str, Any]:
+        """
+        AI: Convert the response to a dict for JSON serialization.
+
+        Nested responses are converted recursively; lists and dicts of
+        plain values (e.g. result rows) are passed through without copying.
+
+        Returns:
+            Dictionary with one key per field
+        """
+        return {field.name: _dump_value(getattr(self, field.name)) for field in fields(self)}
+
+
+def _dump_value(value: Any) -> Any:
+    """AI: Dump nested responses (directly or in a list); return other values as-is."""
+    if isinstance(value, _Response):
+        return value.model_dump()
+    if isinstance(value, list) and value and isinstance(value[0], _Response):
+        return [item.model_dump() for item in value]
+    return value
+
+
+@dataclass(slots=True)
+class TableSchema(_Response):
     """AI: Database table schema information for MCP responses."""
-    table_name: str = Field(..., description="Name of the database table")
-    columns: List[Dict[str, Any]] = Field(..., description="Column definitions with types")
-    indexes: List[str] = Field(..., description="List of index names on the table")
-    row_count: int = Field(..., description="Approximate number of rows in table")
+    table_name: str  # Name of the database table
+    columns: List[Dict[str, Any]]  # Column definitions with types
+    indexes: List[str]  # List of index names on the table
+    row_count: int  # Number of rows (highest rowid unless counted exactly)
 
 
-class DatabaseSchemaResponse(BaseModel):
+@dataclass(slots=True)
+class DatabaseSchemaResponse(_Response):
     """AI: Response for list_database_schema MCP tool."""
-    tables: List[TableSchema] = Field(..., description="List of database tables and schemas")
-    database_file: str = Field(..., description="SQLite database file path")
-    total_tables: int = Field(..., description="Total number of tables in database")
+    tables: List[TableSchema]  # List of database tables and schemas
+    database_file: str  # SQLite database file path
+    total_tables: int  # Total number of tables in database
 
 
 class ExecuteSQLRequest(BaseModel):
     """AI: Request for execute_sql_query MCP tool."""
     query: str = Field(..., description="SQL SELECT query to execute")
     limit: Optional[int] = Field(100, description="Maximum number of rows to return")
+    columnar: bool = Field(False, description="Return rows as value lists instead of objects")
 
 
-class ExecuteSQLResponse(BaseModel):
+@dataclass(slots=True)
+class ExecuteSQLResponse(_Response):
     """AI: Response for execute_sql_query MCP tool."""
-    results: List[Dict[str, Any]] = Field(..., description="Query result rows")
-    columns: List[str] = Field(..., description="Column names in result set")
-    row_count: int = Field(..., description="Number of rows returned")
-    execution_time: float = Field(..., description="Query execution time in seconds")
-    query_text: str = Field(..., description="Original query that was executed")
+    results: List[Dict[str, Any]]  # Query result rows
+    columns: List[str]  # Column names in result set
+    row_count: int  # Number of rows returned
+    execution_time: float  # Query execution time in seconds
+    query_text: str  # Original query that was executed
+
+
+@dataclass(slots=True)
+class ExecuteSQLColumnarResponse(_Response):
+    """AI: Columnar response for execute_sql_query (one value list per row)."""
+    columns: List[str]  # Column names, in row value order
+    rows: List[List[Any]]  # Query result rows as value lists
+    row_count: int  # Number of rows returned
+    execution_time: float  # Query execution time in seconds
+    query_text: str  # Original query that was executed
 
 
 class TableSampleRequest(BaseModel):
@@ -45,17 +94,19 @@ class TableSampleRequest(BaseModel):
     limit: Optional[int] = Field(10, description="Number of sample rows to return")
 
 
-class TableSampleResponse(BaseModel):
+@dataclass(slots=True)
+class TableSampleResponse(_Response):
     """AI: Response for get_table_sample MCP tool."""
-    table_name: str = Field(..., description="Name of the sampled table")
-    sample_data: List[Dict[str, Any]] = Field(..., description="Sample rows from table")
-    columns: List[str] = Field(..., description="Column names in sample data")
-    total_rows: int = Field(..., description="Total number of rows in table")
-    sample_size: int = Field(..., description="Number of rows in sample")
+    table_name: str  # Name of the sampled table
+    sample_data: List[Dict[str, Any]]  # Sample rows from table
+    columns: List[str]  # Column names in sample data
+    total_rows: int  # Total number of rows in table
+    sample_size: int  # Number of rows in sample
 
 
-class MCPErrorResponse(BaseModel):
+@dataclass(slots=True)
+class MCPErrorResponse(_Response):
     """AI: Error response structure for MCP tool failures."""
-    error: str = Field(..., description="Error type or category")
-    message: str = Field(..., description="Human-readable error message")
-    details: Optional[Dict[str, Any]] = Field(None, description="Additional error context")
+    error: str  # Error type or category
+    message: str  # Human-readable error message
+    details: Optional[Dict[str, Any]] = None  # Additional error context
@@ -19,20 +19,109 @@ Security Features:
 """
 
 import asyncio
+import json
 import threading
-import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
 from enum import Enum
 
+import orjson
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 from mcp.server.stdio import stdio_server
 
+# Installed with uvicorn[standard]; the web server already runs on it
+uvloop: Optional[ModuleType]
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from ..database.operations import DatabaseOperations
 from ..utils.logger import logger
 from .tools import MCPTools
 
 
+# Tool calls run concurrently off the event loop, each query on its own
+# read-only connection (DatabaseConnection keeps READONLY_POOL_SIZE of them)
+MCP_DB_WORKERS = 4
+
+# Upper bound on waiting for the network server thread to report readiness
+MCP_STARTUP_TIMEOUT = 5.0
+
+# Tool descriptors are static: built once and returned for every tools/list
+_TOOLS: List[Tool] = [
+    Tool(
+        name="list_database_schema",
+        description="Get the structure and schema of the log analysis database including tables, columns (with descriptions), and relationships",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False
+        }
+    ),
+    Tool(
+        name="execute_sql_query", 
+        description=(
+            "Execute a SELECT SQL query against the log database. Only SELECT queries are allowed for security. "
+            "nginx_logs.raw_log stores the original log line as a compressed BLOB: selected values are "
+            "returned as text, but to filter or compare it inside the query use raw_log_text(raw_log), "
+            "e.g. WHERE raw_log_text(raw_log) LIKE '%GET%'. nexus_logs.raw_log is plain text."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "SQL SELECT query to execute against the log database"
+                },
+                "columnar": {
+                    "type": "boolean",
+                    "description": "Return column names once and each row as a list of values (more compact for many rows)",
+                    "default": False
+                }
+            },
+            "required": ["query"],
+            "additionalProperties": False
+        }
+    ),
+    Tool(
+        name="get_table_sample",
+        description="Get a sample of data from a specific table in the log database",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table to sample (nginx_logs or nexus_logs)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of rows to return (default: 10, max: 100)",
+                    "minimum": 1,
+                    "maximum": 100,
+                    "default": 10
+                }
+            },
+            "required": ["table_name"],
+            "additionalProperties": False
+        }
+    )
+]
+
+# Tool names reported by get_status()
+_TOOL_NAMES: List[str] = [tool.name for tool in _TOOLS]
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """AI: Event loop for the network server thread: uvloop when installed, else asyncio."""
+    if uvloop is not None:
+        loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+        return loop
+    return asyncio.new_event_loop()
+
+
 class TransportMode(Enum):
     """AI: MCP server transport modes."""
     STDIO = "stdio"  # For VS Code Copilot
@@ -71,11 +160,22 @@ class LogAnalysisMCPServer:
         self.port = port
         self.server = Server("log-analysis")
         self.tools = MCPTools(db_ops)
+        # Worker threads for tool calls (threads start on first use)
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=MCP_DB_WORKERS, thread_name_prefix="mcp-db"
+        )
         self._running = False
         self._server_thread: Optional[threading.Thread] = None
+        # Network mode: loop of the server thread and the Event stop() sets
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        # Set by the server thread once listening (or once it has failed)
+        self._started = threading.Event()
         
         # Register MCP tools
         self._register_tools()
+        # Capabilities depend on the registered handlers: build them once
+        self._init_opts = self.server.create_initialization_options()
     
     def _register_tools(self) -> None:
         """AI: Register all MCP tools with proper schemas and handlers."""
@@ -83,54 +183,9 @@ class LogAnalysisMCPServer:
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """AI: List available MCP tools for LLM clients."""
-            return [
-                Tool(
-                    name="list_database_schema",
-                    description="Get the structure and schema of the log analysis database including tables, columns, and relationships",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False
-                    }
-                ),
-                Tool(
-                    name="execute_sql_query", 
-                    description="Execute a SELECT SQL query against the log database. Only SELECT queries are allowed for security.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "SQL SELECT query to execute against the log database"
-                            }
-                        },
-                        "required": ["query"],
-                        "additionalProperties": False
-                    }
-                ),
-                Tool(
-                    name="get_table_sample",
-                    description="Get a sample of data from a specific table in the log database",
-                    inputSchema={
-                        "type": "object", 
-                        "properties": {
-                            "table_name": {
-                                "type": "string",
-                                "description": "Name of the table to sample (nginx_logs or nexus_logs)"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of rows to return (default: 10, max: 100)",
-                                "minimum": 1,
-                                "maximum": 100,
-                                "default": 10
-                            }
-                        },
-                        "required": ["table_name"],
-                        "additionalProperties": False
-                    }
-                )
-            ]
+            return _TOOLS
+        
+        handlers = self._tool_handlers()
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -144,50 +199,47 @@ class LogAnalysisMCPServer:
             Returns:
                 List of TextContent responses formatted for LLM consumption
             """
+            handler = handlers.get(name)
+            if handler is None:
+                return [TextContent(
+                    type="text",
+                    text=f"Error: Unknown tool '{name}'"
+                )]
+            
             try:
-                if name == "list_database_schema":
-                    result = self.tools.list_database_schema()
-                    return [TextContent(
-                        type="text",
-                        text=f"Database Schema:\n{result}"
-                    )]
-                
-                elif name == "execute_sql_query":
-                    query = arguments.get("query", "")
-                    result = self.tools.execute_sql_query(query)
-                    return [TextContent(
-                        type="text", 
-                        text=f"Query Results:\n{result}"
-                    )]
-                
-                elif name == "get_table_sample":
-                    table_name = arguments.get("table_name", "")
-                    limit = arguments.get("limit", 10)
-                    result = self.tools.get_table_sample(table_name, limit)
-                    return [TextContent(
-                        type="text",
-                        text=f"Table Sample ({table_name}):\n{result}"
-                    )]
-                
-                else:
-                    return [TextContent(
-                        type="text",
-                        text=f"Error: Unknown tool '{name}'"
-                    )]
-                    
+                # Handlers block on SQLite: run them off the event loop so
+                # list_tools and other requests are served meanwhile
+                loop = asyncio.get_running_loop()
+                text = await loop.run_in_executor(self._db_executor, handler, arguments)
+                return [TextContent(type="text", text=text)]
             except Exception as e:
                 return [TextContent(
                     type="text",
                     text=f"Error executing tool '{name}': {str(e)}"
                 )]
-            finally:
-                # Cleanup database connection if needed
-                try:
-                    if hasattr(self, 'tools') and hasattr(self.tools, 'db_ops'):
-                        # Database connections are managed by the parent application
-                        pass
-                except:
-                    pass
+    
+    def _tool_handlers(self) -> Dict[str, Callable[[Dict[str, Any]], str]]:
+        """
+        AI: Map tool names to handlers returning the response text.
+        
+        Each response is a title line followed by the tool result as JSON.
+        
+        Returns:
+            Dictionary of tool name to handler taking the tool arguments
+        """
+        return {
+            "list_database_schema": lambda arguments: (
+                f"Database Schema:\n{self._format_json_response(self.tools.list_database_schema())}"
+            ),
+            "execute_sql_query": lambda arguments: (
+                f"Query Results:\n"
+                f"{self._format_json_response(self.tools.execute_sql_query(arguments.get('query', ''), columnar=arguments.get('columnar', False)))}"
+            ),
+            "get_table_sample": lambda arguments: (
+                f"Table Sample ({arguments.get('table_name', '')}):\n"
+                f"{self._format_json_response(self.tools.get_table_sample(arguments.get('table_name', ''), arguments.get('limit', 10)))}"
+            ),
+        }
     
     def start(self) -> None:
         """
@@ -207,14 +259,16 @@ class LogAnalysisMCPServer:
     
     def _start_stdio_server(self) -> None:
         """AI: Start MCP server in stdio mode for VS Code Copilot."""
-        logger.info("🚀 Starting Log Analysis MCP Server for VS Code Copilot...")
-        logger.info("📁 Using database: %s", self.db_ops.db_connection.db_path)
-        logger.info("📊 Available tools:")
-        logger.info("   - list_database_schema: Inspect database structure")
-        logger.info("   - execute_sql_query: Run SELECT queries on log data")
-        logger.info("   - get_table_sample: Get sample data from tables")
-        logger.info("")
-        logger.info("🔌 MCP server ready for VS Code Copilot connection...")
+        logger.info_lines(
+            "🚀 Starting Log Analysis MCP Server for VS Code Copilot...",
+            f"📁 Using database: {self.db_ops.db_connection.db_path}",
+            "📊 Available tools:",
+            "   - list_database_schema: Inspect database structure",
+            "   - execute_sql_query: Run SELECT queries on log data",
+            "   - get_table_sample: Get sample data from tables",
+            "",
+            "🔌 MCP server ready for VS Code Copilot connection...",
+        )
 
         # Run stdio server synchronously
         asyncio.run(self._run_stdio_server())
@@ -227,7 +281,7 @@ class LogAnalysisMCPServer:
                 await self.server.run(
                     streams[0],
                     streams[1],
-                    self.server.create_initialization_options()
+                    self._init_opts
                 )
         except Exception as e:
             logger.error("❌ MCP stdio server error: %s", e)
@@ -243,8 +297,10 @@ class LogAnalysisMCPServer:
             """AI: Server thread function."""
             try:
                 # Create new event loop for this thread
-                loop = asyncio.new_event_loop()
+                loop = _new_event_loop()
                 asyncio.set_event_loop(loop)
+                self._loop = loop
+                self._stop_event = asyncio.Event()
 
                 # Run the MCP server
                 self._running = True
@@ -254,14 +310,16 @@ class LogAnalysisMCPServer:
                 logger.error("ERROR: MCP server failed: %s", e)
                 self._running = False
             finally:
+                self._started.set()  # Never leave start() waiting on a dead thread
                 loop.close()
 
         # Start server in background thread
+        self._started.clear()
         self._server_thread = threading.Thread(target=run_server, daemon=True)
         self._server_thread.start()
 
-        # Give server time to start
-        time.sleep(1)
+        # Wait until the server is listening or has failed
+        self._started.wait(timeout=MCP_STARTUP_TIMEOUT)
 
         if self._running:
             logger.info("✓ MCP server started on %s:%d", self.host, self.port)
@@ -272,11 +330,14 @@ class LogAnalysisMCPServer:
         """AI: Run network server for general MCP clients."""
         try:
             logger.info("MCP server listening on %s:%d", self.host, self.port)
+            self._started.set()
 
             # Keep server running - actual network implementation would go here
-            # For now, this maintains the server lifecycle
-            while self._running:
-                await asyncio.sleep(1)
+            # For now, this maintains the server lifecycle until stop()
+            stop_event = self._stop_event
+            if stop_event is None:  # Not started through start()
+                stop_event = self._stop_event = asyncio.Event()
+            await stop_event.wait()
 
         except Exception as e:
             logger.error("MCP server error: %s", e)
@@ -291,9 +352,19 @@ class LogAnalysisMCPServer:
         logger.info("Stopping MCP server...")
         self._running = False
 
+        if self._loop is not None and self._stop_event is not None:
+            # asyncio.Event is not thread-safe: set it from its own loop
+            try:
+                self._loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
         if self._server_thread and self._server_thread.is_alive():
             self._server_thread.join(timeout=5)
 
+        # Drop queued tool calls; running queries finish on their own
+        self._db_executor.shutdown(wait=False, cancel_futures=True)
+
         logger.info("✓ MCP server stopped")
     
     def _format_json_response(self, data: Any) -> str:
@@ -306,10 +377,15 @@ class LogAnalysisMCPServer:
         Returns:
             JSON string representation of data or error message
         """
-        import json
+        try:
+            # orjson handles wide result sets far faster; NaN/Infinity become null
+            return orjson.dumps(
+                data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits or nesting too deep for orjson
         
         try:
-            # Try to serialize with default JSON encoder
             return json.dumps(data, indent=2, default=str)
         except (TypeError, ValueError) as e:
             # If serialization fails, return error message
@@ -331,8 +407,8 @@ class LogAnalysisMCPServer:
             "transport_mode": self.transport_mode.value,
             "host": self.host if self.transport_mode == TransportMode.NETWORK else "stdio",
             "port": self.port if self.transport_mode == TransportMode.NETWORK else None,
-            "tools_registered": 3,
-            "tools": ["list_database_schema", "execute_sql_query", "get_table_sample"],
+            "tools_registered": len(_TOOL_NAMES),
+            "tools": list(_TOOL_NAMES),
             "database_path": str(self.db_ops.db_connection.db_path) if self.db_ops else None
         }
 
@@ -10,19 +10,168 @@ Each tool includes proper error handling, security validation,
 and JSON formatting for LLM consumption.
 """
 
+import copy
+import re
+import threading
 import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
 import sqlparse
-from typing import Dict, Any, List, Optional
 
+from ..database.base import LOG_TABLES
 from ..database.operations import DatabaseOperations
 from .schemas import (
     DatabaseSchemaResponse, TableSchema,
-    ExecuteSQLResponse, ExecuteSQLRequest,
+    ExecuteSQLResponse, ExecuteSQLColumnarResponse, ExecuteSQLRequest,
     TableSampleResponse, TableSampleRequest,
     MCPErrorResponse
 )
 
 
+# Per-table query text is fixed (the limit is bound), so SQLite's statement
+# cache on the read-only connections serves every sample request. The table's
+# row count rides along as an extra column of every sample row (the
+# uncorrelated subquery runs once), saving a second round-trip; like
+# _ROW_ESTIMATES_QUERY below it is MAX(rowid), read from the end of the rowid
+# B-tree rather than a COUNT(*) scan. Rows are appended in created_at order,
+# so the newest rows are read backwards from the same B-tree instead of
+# sorting the table by created_at
+_SAMPLE_QUERIES = {
+    table: (
+        f"SELECT *, (SELECT COALESCE(MAX(rowid), 0) FROM {table}) AS _total_rows "
+        f"FROM {table} ORDER BY id DESC LIMIT :limit"
+    )
+    for table in LOG_TABLES
+}
+# Row counts of every log table in one statement (one round-trip in total)
+_ROW_COUNTS_QUERY = " UNION ALL ".join(
+    f"SELECT '{table}' AS table_name, COUNT(*) AS count FROM {table}" for table in _SAMPLE_QUERIES
+)
+# Display row counts: the tables' INTEGER PRIMARY KEY aliases rowid and rows
+# are only appended, so MAX(rowid) matches COUNT(*) but is read from the end
+# of the table B-tree instead of scanning it
+_ROW_ESTIMATES_QUERY = " UNION ALL ".join(
+    f"SELECT '{table}' AS table_name, COALESCE(MAX(rowid), 0) AS count FROM {table}"
+    for table in _SAMPLE_QUERIES
+)
+
+# Cheap pre-check: the first statement must start with the SELECT keyword
+_SELECT_PREFIX = re.compile(r'\s*select\b', re.IGNORECASE)
+
+# Query result cache: entries per MCPTools instance, and the age after which a
+# result is recomputed even though the data is unchanged (queries relative to
+# datetime('now') drift with the clock)
+_QUERY_CACHE_SIZE = 256
+_QUERY_CACHE_TTL = 30.0
+# Whitespace is only insignificant outside literals, quoted identifiers and
+# comments (a '--' comment ends at the newline)
+_WHITESPACE_UNSAFE = re.compile(r"['\"`\[]|--|/\*")
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=256)
+def _is_select_only(query: str) -> bool:
+    """
+    AI: Validate that query contains only SELECT statements.
+    
+    A query starting with SELECT that holds no statement separator is a
+    single SELECT and is accepted without parsing. Anything containing a
+    further ';' (possibly inside a literal or comment) is analyzed with
+    sqlparse, rejecting any non-SELECT statement for security. Cached on
+    the query text: LLM clients often repeat or retry the same query.
+    
+    Args:
+        query: SQL query string to validate
+        
+    Returns:
+        True if query contains only SELECT statements, False otherwise
+    """
+    try:
+        # Handle empty or whitespace-only queries; anything not starting
+        # with SELECT fails the first-statement check below anyway
+        if not query or not _SELECT_PREFIX.match(query):
+            return False
+        
+        # Fast path: one statement (an optional trailing ';' ends it)
+        body = query.rstrip()
+        if body.endswith(';'):
+            body = body[:-1]
+        if ';' not in body:
+            return True
+        
+        # Parse the SQL query
+        parsed = sqlparse.parse(query)
+        
+        for statement in parsed:
+            # Skip empty statements
+            if not statement.tokens:
+                continue
+            
+            # Get the first meaningful token
+            first_token = None
+            for token in statement.tokens:
+                if not token.is_whitespace:
+                    first_token = token
+                    break
+            
+            if first_token is None:
+                continue
+            
+            # Check if it's a SELECT statement
+            if (first_token.ttype is sqlparse.tokens.Keyword.DML and 
+                first_token.value.upper() == 'SELECT'):
+                continue
+            elif (hasattr(first_token, 'tokens') and first_token.tokens and
+                  first_token.tokens[0].ttype is sqlparse.tokens.Keyword.DML and
+                  first_token.tokens[0].value.upper() == 'SELECT'):
+                continue
+            else:
+                return False
+        
+        return True
+        
+    except Exception:
+        # If parsing fails, err on the side of caution
+        return False
+
+
+def _copy_query_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    AI: Shallow copy of an execute_sql_query response for the query cache.
+
+    The response dict and its row list are copied so callers that modify
+    what they got (e.g. append or pop rows) never change the cached entry;
+    the rows themselves are shared.
+    """
+    copied = dict(result)
+    for key in ('results', 'rows'):
+        if isinstance(copied.get(key), list):
+            copied[key] = list(copied[key])
+    return copied
+
+
+def _query_cache_key(query: str) -> str:
+    """
+    AI: Normalize query text for the result cache.
+    
+    Whitespace runs collapse to one space, so reformatted repeats of a query
+    share an entry. Queries holding quotes or comments are only stripped,
+    since whitespace inside those is part of their meaning.
+    
+    Args:
+        query: SQL query string
+        
+    Returns:
+        Cache key text for the query
+    """
+    query = query.strip()
+    if _WHITESPACE_UNSAFE.search(query):
+        return query
+    return _WHITESPACE_RUN.sub(' ', query)
+
+
 class MCPTools:
     """
     AI: MCP tool implementations for database operations.
@@ -39,13 +188,25 @@ class MCPTools:
             db_ops: Database operations instance for query execution
         """
         self.db_ops = db_ops
+        # fast_count -> (data_version, response) of the last successful list_database_schema
+        self._schema_cache: Dict[bool, Tuple[int, Dict[str, Any]]] = {}
+        # (query key, limit, columnar) -> (data_version, monotonic time, response),
+        # least recently used first; tool calls run on a thread pool
+        self._query_cache: OrderedDict = OrderedDict()
+        self._query_cache_lock = threading.Lock()
     
-    def list_database_schema(self) -> Dict[str, Any]:
+    def list_database_schema(self, fast_count: bool = True) -> Dict[str, Any]:
         """
         AI: List all database tables and their complete schemas.
         
         Returns comprehensive schema information including column types,
-        indexes, and row counts for all tables in the database.
+        indexes, and row counts for all tables in the database. The response
+        is reused until the database changes, since clients ask for the
+        schema before most queries.
+        
+        Args:
+            fast_count: Report the highest rowid as row count (exact for the
+                append-only log tables) instead of scanning with COUNT(*)
         
         Returns:
             Dictionary containing database schema information
@@ -54,22 +215,30 @@ class MCPTools:
             Exception: When database access fails
         """
         try:
-            # Use the new get_database_schema method
-            schema_info = self.db_ops.get_database_schema()
+            data_version = self.db_ops.data_version()
+            cached = self._schema_cache.get(fast_count)
+            if cached is not None and cached[0] == data_version:
+                # Small nested response: copy fully so callers cannot alter the cache
+                return copy.deepcopy(cached[1])
+            
+            # Structure only: the statistics would scan every table
+            schema_info = self.db_ops.get_database_schema(include_statistics=False)
             
             tables = []
             
+            try:
+                row_counts = {
+                    row['table_name']: row['count']
+                    for row in self.db_ops.execute_query(
+                        _ROW_ESTIMATES_QUERY if fast_count else _ROW_COUNTS_QUERY
+                    )
+                }
+            except Exception:
+                row_counts = {}
+            
             # Convert schema info to the expected format
             for table_name, table_info in schema_info.get('tables', {}).items():
-                # Get row count from execute_query
-                try:
-                    row_count_result = self.db_ops.execute_query(
-                        f"SELECT COUNT(*) as count FROM {table_name}",
-                        limit=1
-                    )
-                    row_count = row_count_result[0]['count'] if row_count_result else 0
-                except Exception:
-                    row_count = 0
+                row_count = row_counts.get(table_name, 0)
                 
                 # Convert column format for compatibility
                 columns = []
@@ -78,7 +247,8 @@ class MCPTools:
                         'name': col['name'],
                         'type': col['type'],
                         'notnull': int(col['not_null']),
-                        'pk': int(col['primary_key'])
+                        'pk': int(col['primary_key']),
+                        'description': col.get('description')
                     })
                 
                 table_schema = TableSchema(
@@ -95,7 +265,9 @@ class MCPTools:
                 total_tables=len(tables)
             )
             
-            return response.model_dump()
+            result = response.model_dump()
+            self._schema_cache[fast_count] = (data_version, copy.deepcopy(result))
+            return result
             
         except Exception as e:
             error_response = MCPErrorResponse(
@@ -105,23 +277,30 @@ class MCPTools:
             )
             return error_response.model_dump()
     
-    def execute_sql_query(self, query: str, limit: Optional[int] = 100) -> Dict[str, Any]:
+    def execute_sql_query(
+        self, query: str, limit: Optional[int] = 100, columnar: bool = False
+    ) -> Dict[str, Any]:
         """
         AI: Execute a SELECT SQL query against the database.
         
         Only SELECT statements are allowed for security. Results are
         limited to prevent memory issues and include execution timing.
+        LLM clients repeat queries often, so a response is reused for the
+        same normalized query while the database is unchanged, for up to
+        _QUERY_CACHE_TTL seconds.
         
         Args:
             query: SQL SELECT query to execute
             limit: Maximum number of rows to return (default: 100)
+            columnar: Return "columns" plus "rows" as value lists instead of
+                one object per row ("results"); smaller for wide results
             
         Returns:
             Dictionary containing query results and metadata
         """
         try:
             # Validate request
-            request = ExecuteSQLRequest(query=query, limit=limit)
+            request = ExecuteSQLRequest(query=query, limit=limit, columnar=columnar)
             
             # Security validation - only allow SELECT statements
             if not self._is_select_query(request.query):
@@ -132,6 +311,27 @@ class MCPTools:
                 )
                 return error_response.model_dump()
             
+            cache_key = (_query_cache_key(request.query), request.limit, request.columnar)
+            data_version = self.db_ops.data_version()
+            cached = self._cached_query_result(cache_key, data_version)
+            if cached is not None:
+                return cached
+            
+            if request.columnar:
+                start_time = time.time()
+                columns, rows = self.db_ops.execute_query_columnar(
+                    request.query, limit=request.limit
+                )
+                result = ExecuteSQLColumnarResponse(
+                    columns=columns,
+                    rows=rows,
+                    row_count=len(rows),
+                    execution_time=round(time.time() - start_time, 4),
+                    query_text=request.query
+                ).model_dump()
+                self._store_query_result(cache_key, data_version, result)
+                return result
+            
             # Execute query with timing
             start_time = time.time()
             results = self.db_ops.execute_query(request.query, limit=request.limit)
@@ -148,7 +348,9 @@ class MCPTools:
                 query_text=request.query
             )
             
-            return response.model_dump()
+            result = response.model_dump()
+            self._store_query_result(cache_key, data_version, result)
+            return result
             
         except Exception as e:
             error_response = MCPErrorResponse(
@@ -180,7 +382,7 @@ class MCPTools:
             request = TableSampleRequest(table_name=table_name, limit=limit)
             
             # Validate table name for security
-            allowed_tables = ["nginx_logs", "nexus_logs"]
+            allowed_tables = list(_SAMPLE_QUERIES)
             if request.table_name not in allowed_tables:
                 error_response = MCPErrorResponse(
                     error="invalid_table",
@@ -189,14 +391,13 @@ class MCPTools:
                 )
                 return error_response.model_dump()
             
-            # Get sample data
-            query = f"SELECT * FROM {request.table_name} ORDER BY created_at DESC LIMIT {request.limit}"
-            sample_data = self.db_ops.execute_query(query, limit=request.limit)
-            
-            # Get total row count
-            count_query = f"SELECT COUNT(*) as total FROM {request.table_name}"
-            count_result = self.db_ops.execute_query(count_query, limit=1)
-            total_rows = count_result[0]['total'] if count_result else 0
+            # Get sample data and the total row count in one query
+            sample_data = self.db_ops.execute_query(
+                _SAMPLE_QUERIES[request.table_name], limit=request.limit, params={"limit": request.limit}
+            )
+            total_rows = 0  # No sample rows: the table is empty
+            for row in sample_data:
+                total_rows = row.pop('_total_rows')
             
             # Extract column names
             columns = list(sample_data[0].keys()) if sample_data else []
@@ -222,55 +423,52 @@ class MCPTools:
             )
             return error_response.model_dump()
     
+    def _cached_query_result(self, key: Tuple[str, Optional[int], bool], data_version: int) -> Optional[Dict[str, Any]]:
+        """
+        AI: Look up a cached execute_sql_query response.
+        
+        Args:
+            key: Normalized query, limit and columnar flag
+            data_version: Current database data_version
+            
+        Returns:
+            Copy of the cached response, or None when missing, stale or expired
+        """
+        with self._query_cache_lock:
+            entry = self._query_cache.get(key)
+            if entry is None:
+                return None
+            version, stored_at, result = entry
+            if version != data_version or time.monotonic() - stored_at > _QUERY_CACHE_TTL:
+                del self._query_cache[key]
+                return None
+            self._query_cache.move_to_end(key)
+        return _copy_query_result(result)
+    
+    def _store_query_result(self, key: Tuple[str, Optional[int], bool], data_version: int,
+                            result: Dict[str, Any]) -> None:
+        """
+        AI: Cache an execute_sql_query response, evicting the least recently used.
+        
+        Args:
+            key: Normalized query, limit and columnar flag
+            data_version: Database data_version the query ran against
+            result: Response dictionary
+        """
+        with self._query_cache_lock:
+            self._query_cache[key] = (data_version, time.monotonic(), _copy_query_result(result))
+            self._query_cache.move_to_end(key)
+            if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+    
     def _is_select_query(self, query: str) -> bool:
         """
         AI: Validate that query contains only SELECT statements.
         
-        Uses sqlparse to analyze SQL structure and reject any
-        non-SELECT operations for security.
-        
         Args:
             query: SQL query string to validate
             
         Returns:
             True if query contains only SELECT statements, False otherwise
         """
-        try:
-            # Handle empty or whitespace-only queries
-            if not query or not query.strip():
-                return False
-            
-            # Parse the SQL query
-            parsed = sqlparse.parse(query)
-            
-            for statement in parsed:
-                # Skip empty statements
-                if not statement.tokens:
-                    continue
-                
-                # Get the first meaningful token
-                first_token = None
-                for token in statement.tokens:
-                    if not token.is_whitespace:
-                        first_token = token
-                        break
-                
-                if first_token is None:
-                    continue
-                
-                # Check if it's a SELECT statement
-                if (first_token.ttype is sqlparse.tokens.Keyword.DML and 
-                    first_token.value.upper() == 'SELECT'):
-                    continue
-                elif (hasattr(first_token, 'tokens') and first_token.tokens and
-                      first_token.tokens[0].ttype is sqlparse.tokens.Keyword.DML and
-                      first_token.tokens[0].value.upper() == 'SELECT'):
-                    continue
-                else:
-                    return False
-            
-            return True
-            
-        except Exception:
-            # If parsing fails, err on the side of caution
-            return False
+        return _is_select_only(query)
@@ -18,7 +18,7 @@ from ..database.operations import DatabaseOperations
 from ..file_discovery import LogFileDiscovery, create_file_iterator_from_path
 from ..processors.nginx_processor import NginxLogProcessor
 from ..processors.nexus_processor import NexusLogProcessor
-from ..utils.logger import logger
+from ..utils.logger import LogLevel, logger
 
 
 class ProcessingStatistics:
@@ -93,7 +93,7 @@ class LogProcessingOrchestrator:
         """
         self.settings = settings
         self.db_ops = db_ops
-        self.file_discovery = LogFileDiscovery(settings)
+        self.file_discovery = LogFileDiscovery(settings, cache_dir=settings.archive_cache_dir)
         self.statistics = ProcessingStatistics()
         
         # Initialize processors with settings dependency injection
@@ -199,18 +199,13 @@ class LogProcessingOrchestrator:
         }
 
         start_time = time.time()
+        files_found = 0
 
         try:
-            # Discover files
-            log_files = list(discovery_method())
-            logger.info("Found %d %s log files/archives", len(log_files), log_type)
-
-            if not log_files:
-                logger.info("No %s log files found", log_type)
-                return stats
-
-            # Process each discovered file
-            for file_path, source_description in log_files:
+            # Process each file as discovery yields it, so parsing starts
+            # while the rest of the tree is still being scanned
+            for file_path, source_description in discovery_method():
+                files_found += 1
                 logger.info("Processing %s file: %s", log_type, source_description)
 
                 try:
@@ -236,6 +231,11 @@ class LogProcessingOrchestrator:
         except Exception as e:
             logger.error("ERROR: %s log discovery failed: %s", log_type, e)
 
+        if files_found:
+            logger.info("Found %d %s log files/archives", files_found, log_type)
+        else:
+            logger.info("No %s log files found", log_type)
+
         stats['processing_time'] = time.time() - start_time
         logger.info("%s processing completed in %.2f seconds", log_type, stats['processing_time'])
 
@@ -281,46 +281,48 @@ class LogProcessingOrchestrator:
         return file_stats
     
     def _print_processing_summary(self):
-        """AI: Print comprehensive processing summary."""
-        summary = self.statistics.get_summary()
+        """AI: Print comprehensive processing summary (one write for the whole block)."""
+        if not logger.is_enabled(LogLevel.INFO):
+            return
 
-        logger.info("\n" + "=" * 80)
-        logger.info("PHASE 2: Processing Summary")
-        logger.info("=" * 80)
+        summary = self.statistics.get_summary()
 
-        # Overall statistics
-        logger.info("Total files processed: %d", summary['total_files'])
-        logger.info("Total lines processed: %s", f"{summary['total_lines']:,}")
-        logger.info("Total entries parsed: %s", f"{summary['total_entries']:,}")
-        logger.info("Total parse errors: %s", f"{summary['total_errors']:,}")
-        logger.info("Total processing time: %.2f seconds", summary['total_processing_time'])
+        lines = [
+            "\n" + "=" * 80,
+            "PHASE 2: Processing Summary",
+            "=" * 80,
+            # Overall statistics
+            f"Total files processed: {summary['total_files']}",
+            f"Total lines processed: {summary['total_lines']:,}",
+            f"Total entries parsed: {summary['total_entries']:,}",
+            f"Total parse errors: {summary['total_errors']:,}",
+            f"Total processing time: {summary['total_processing_time']:.2f} seconds",
+        ]
 
         if summary['total_lines'] > 0:
             success_rate = (summary['total_entries'] / summary['total_lines']) * 100
-            logger.info("Overall success rate: %.1f%%", success_rate)
-
-        # nginx statistics
-        logger.info("\nnginx logs:")
-        logger.info("  Files: %d", summary['nginx']['files_processed'])
-        logger.info("  Lines: %s", f"{summary['nginx']['lines_processed']:,}")
-        logger.info("  Parsed: %s", f"{summary['nginx']['entries_parsed']:,}")
-        logger.info("  Errors: %s", f"{summary['nginx']['parse_errors']:,}")
-        logger.info("  Time: %.2fs", summary['nginx']['processing_time'])
-
-        # Nexus statistics
-        logger.info("\nNexus logs:")
-        logger.info("  Files: %d", summary['nexus']['files_processed'])
-        logger.info("  Lines: %s", f"{summary['nexus']['lines_processed']:,}")
-        logger.info("  Parsed: %s", f"{summary['nexus']['entries_parsed']:,}")
-        logger.info("  Errors: %s", f"{summary['nexus']['parse_errors']:,}")
-        logger.info("  Time: %.2fs", summary['nexus']['processing_time'])
+            lines.append(f"Overall success rate: {success_rate:.1f}%")
+
+        # Per log type statistics
+        for title, stats in (("nginx logs", summary['nginx']), ("Nexus logs", summary['nexus'])):
+            lines += [
+                f"\n{title}:",
+                f"  Files: {stats['files_processed']}",
+                f"  Lines: {stats['lines_processed']:,}",
+                f"  Parsed: {stats['entries_parsed']:,}",
+                f"  Errors: {stats['parse_errors']:,}",
+                f"  Time: {stats['processing_time']:.2f}s",
+            ]
 
         # Performance metrics
         if summary['total_processing_time'] > 0:
             lines_per_second = summary['total_lines'] / summary['total_processing_time']
             entries_per_second = summary['total_entries'] / summary['total_processing_time']
-            logger.info("\nPerformance:")
-            logger.info("  Lines/second: %s", f"{lines_per_second:,.0f}")
-            logger.info("  Entries/second: %s", f"{entries_per_second:,.0f}")
-
-        logger.info("=" * 80)
+            lines += [
+                "\nPerformance:",
+                f"  Lines/second: {lines_per_second:,.0f}",
+                f"  Entries/second: {entries_per_second:,.0f}",
+            ]
+
+        lines.append("=" * 80)
+        logger.info_lines(*lines)
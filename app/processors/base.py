@@ -242,7 +242,7 @@ class BaseLogProcessor(ABC):
                     stats['entries_inserted'] += len(entries_batch)
                 
         except Exception as e:
-            logger.error(f"Error processing file {source_description}: {e}")
+            logger.error("Error processing file %s: %s", source_description, e)
             # Database errors should be tracked as general processing errors, not parse errors
             # The parse errors are already tracked by the processor's error_count
         
@@ -310,7 +310,7 @@ class BaseLogProcessor(ABC):
         try:
             return int(status_str)
         except ValueError:
-            logger.error("PARSE_ERROR: %s:%d - Invalid status code: {status_str}", source_file, line_number)
+            logger.error("PARSE_ERROR: %s:%d - Invalid status code: %s", source_file, line_number, status_str)
             return None
 
     def _clean_optional_field(self, field_value: str, default_marker: str = '-') -> Optional[str]:
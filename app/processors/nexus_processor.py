@@ -9,6 +9,7 @@ Implements Nexus-specific log parsing following coding guidelines:
 """
 
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -130,15 +131,16 @@ class NexusLogProcessor(BaseLogProcessor):
             thread_info = groups.get('thread_info')
             
             # Extract HTTP version if present
-            http_version = groups.get('http_version', 'HTTP/1.1')
+            http_version = groups.get('http_version') or 'HTTP/1.1'
             
             return {
                 'ip_address': groups['ip'],
                 'remote_user': remote_user,
                 'timestamp': timestamp,
-                'method': groups['method'],
+                # Low-cardinality values: share one string object across rows
+                'method': sys.intern(groups['method']),
                 'path': groups['path'],
-                'http_version': http_version,
+                'http_version': sys.intern(http_version),
                 'status_code': status_code,
                 'response_size': response_size,
                 'request_size': request_size,
@@ -150,7 +152,7 @@ class NexusLogProcessor(BaseLogProcessor):
             }
             
         except Exception as e:
-            logger.error("UNEXPECTED_ERROR: {source_file}:{line_number} - %s", e)
+            logger.error("UNEXPECTED_ERROR: %s:%d - %s", source_file, line_number, e)
             return None
     
     def _parse_timestamp(self, timestamp_str: str) -> Optional[datetime]:
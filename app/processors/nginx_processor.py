@@ -9,6 +9,7 @@ Implements nginx-specific log parsing following coding guidelines:
 """
 
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -141,7 +142,7 @@ class NginxLogProcessor(BaseLogProcessor):
             }
             
         except Exception as e:
-            logger.error("UNEXPECTED_ERROR: {source_file}:{line_number} - %s", e)
+            logger.error("UNEXPECTED_ERROR: %s:%d - %s", source_file, line_number, e)
             return None
     
     def _parse_request_field(self, request_str: str) -> Tuple[str, str, str]:
@@ -167,7 +168,8 @@ class NginxLogProcessor(BaseLogProcessor):
                 method, path, version = parts
                 # Validate this looks like HTTP
                 if version.startswith('HTTP/'):
-                    return method, path, version
+                    # Low-cardinality values: share one string object across rows
+                    return sys.intern(method), path, sys.intern(version)
             
             # Handle malformed requests (SSH, binary data, JSON, etc.)
             # These are legitimate log entries but not HTTP requests
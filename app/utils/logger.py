@@ -67,6 +67,15 @@ class Logger:
             return LogLevel.WARN  # Suppress TRACE, DEBUG, INFO in tests
         return self.current_level
 
+    def is_enabled(self, level: LogLevel) -> bool:
+        """
+        AI: Check whether messages at level would be written.
+
+        Lets callers skip computing expensive log arguments (syscalls,
+        aggregations) when the message would be suppressed anyway.
+        """
+        return level >= self._get_effective_level()
+
     def _write(self, level: LogLevel, prefix: str, message: str, *args: Any) -> None:
         """
         AI: Write log message to stderr if level is enabled.
@@ -104,6 +113,18 @@ class Logger:
         """AI: INFO level - normal operational messages."""
         self._write(LogLevel.INFO, "ℹ️  INFO:", message, *args)
 
+    def info_lines(self, *lines: str) -> None:
+        """
+        AI: INFO level - several pre-formatted lines in one write.
+
+        For multi-line banners: the block is written and flushed once instead
+        of once per line, and cannot interleave with other threads' output.
+        """
+        if LogLevel.INFO < self._get_effective_level():
+            return
+        sys.stderr.write("".join(f"ℹ️  INFO: {line}\n" for line in lines))
+        sys.stderr.flush()
+
     def warn(self, message: str, *args: Any) -> None:
         """AI: WARN level - warning conditions."""
         self._write(LogLevel.WARN, "⚠️  WARN:", message, *args)
@@ -76,7 +76,7 @@ def create_web_app(settings: Settings) -> FastAPI:
         """
         # Startup: Create database connection
         db_connection = DatabaseConnection(settings.db_name, fresh_start=False)
-        db_operations = DatabaseOperations(db_connection)
+        db_operations = DatabaseOperations(db_connection, parquet_dir=settings.parquet_dir)
         app.state.db_operations = db_operations
         app.state.db_connection = db_connection
 
@@ -113,7 +113,7 @@ def create_web_app(settings: Settings) -> FastAPI:
         try:
             return templates.TemplateResponse(request, "index.html")
         except Exception as e:
-            logger.error(f"Failed to render index template: {e}")
+            logger.error("Failed to render index template: %s", e)
             raise HTTPException(status_code=500, detail="Failed to load page")
     
     @app.get("/api/nginx-preview")
@@ -128,10 +128,10 @@ def create_web_app(settings: Settings) -> FastAPI:
         """
         try:
             results = db.get_nginx_preview(limit)
-            logger.info(f"Retrieved {len(results)} nginx preview entries")
+            logger.info("Retrieved %d nginx preview entries", len(results))
             return results
         except Exception as e:
-            logger.error(f"Failed to get nginx preview: {e}")
+            logger.error("Failed to get nginx preview: %s", e)
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     
     @app.get("/api/nexus-preview")
@@ -146,10 +146,10 @@ def create_web_app(settings: Settings) -> FastAPI:
         """
         try:
             results = db.get_nexus_preview(limit)
-            logger.info(f"Retrieved {len(results)} nexus preview entries")
+            logger.info("Retrieved %d nexus preview entries", len(results))
             return results
         except Exception as e:
-            logger.error(f"Failed to get nexus preview: {e}")
+            logger.error("Failed to get nexus preview: %s", e)
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     
     @app.post("/api/execute-query")
@@ -193,7 +193,7 @@ def create_web_app(settings: Settings) -> FastAPI:
             # Extract column names from first row
             columns = list(results[0].keys()) if results else []
             
-            logger.info(f"Executed query returning {len(results)} rows in {execution_time:.3f}s")
+            logger.info("Executed query returning %d rows in %.3fs", len(results), execution_time)
             
             return QueryResponse(
                 results=results,
@@ -205,7 +205,7 @@ def create_web_app(settings: Settings) -> FastAPI:
         except HTTPException:
             raise  # Re-raise validation errors
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
             raise HTTPException(status_code=500, detail=f"Query execution failed: {str(e)}")
     
     @app.get("/api/table-info")
@@ -238,11 +238,11 @@ def create_web_app(settings: Settings) -> FastAPI:
                 row_count=nexus_count
             ))
             
-            logger.info(f"Retrieved schema info for {len(tables)} tables")
+            logger.info("Retrieved schema info for %d tables", len(tables))
             return SchemaResponse(tables=tables)
             
         except Exception as e:
-            logger.error(f"Failed to get table info: {e}")
+            logger.error("Failed to get table info: %s", e)
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     
     @app.get("/health")
@@ -266,7 +266,7 @@ def create_web_app(settings: Settings) -> FastAPI:
                 "total_entries": nginx_count + nexus_count
             }
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return {
                 "status": "unhealthy",
                 "error": str(e)
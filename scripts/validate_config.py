@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+AI: Static consistency check for the Settings schema in app/config.py.
+
+Runs at pre-commit time (hook id: validate-settings) whenever app/config.py
+changes, so schema mistakes are caught before commit instead of at
+application startup. Checks that:
+- Every field has a default unless it is explicitly listed as required
+- Every field carries a description (used in docs and error messages)
+- Every field expected to be validated has a field_validator attached
+- Default values pass the pure (non-filesystem) validators
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.config import Settings
+
+# Fields that must be supplied by CLI/environment and have no default
+REQUIRED_FIELDS = {"nexus_dir", "nginx_dir"}
+
+# Field name -> validator method expected to guard it
+EXPECTED_VALIDATORS = {
+    "nexus_dir": "validate_directories",
+    "nginx_dir": "validate_directories",
+    "db_name": "validate_db_path",
+    "mcp_port": "validate_ports",
+    "web_port": "validate_ports",
+    "max_archive_depth": "validate_archive_depth",
+}
+
+# Validators without filesystem side effects that defaults must satisfy
+PURE_VALIDATORS = {"validate_ports", "validate_archive_depth"}
+
+
+def validate_settings_schema() -> list:
+    """
+    AI: Inspect Settings.model_fields and validators without instantiating Settings.
+
+    Returns:
+        List of human-readable problems (empty when the schema is consistent)
+    """
+    problems = []
+    fields = Settings.model_fields
+
+    for name, field_info in fields.items():
+        if field_info.is_required() and name not in REQUIRED_FIELDS:
+            problems.append(f"{name}: no default and not listed in REQUIRED_FIELDS")
+        if not field_info.is_required() and name in REQUIRED_FIELDS:
+            problems.append(f"{name}: listed in REQUIRED_FIELDS but has a default")
+        if not field_info.description:
+            problems.append(f"{name}: missing description")
+
+    for name in REQUIRED_FIELDS - fields.keys():
+        problems.append(f"{name}: listed in REQUIRED_FIELDS but not defined on Settings")
+
+    # Map each validated field to the validator methods attached to it
+    attached = {}
+    for decorator in Settings.__pydantic_decorators__.field_validators.values():
+        for field_name in decorator.info.fields:
+            attached.setdefault(field_name, set()).add(decorator.cls_var_name)
+
+    for name, validator_name in EXPECTED_VALIDATORS.items():
+        if name not in fields:
+            problems.append(f"{name}: expected validator target not defined on Settings")
+            continue
+        if validator_name not in attached.get(name, set()):
+            problems.append(f"{name}: missing field_validator '{validator_name}'")
+            continue
+        if validator_name in PURE_VALIDATORS and not fields[name].is_required():
+            try:
+                getattr(Settings, validator_name)(fields[name].default)
+            except ValueError as e:
+                problems.append(f"{name}: default {fields[name].default!r} fails validation: {e}")
+
+    return problems
+
+
+def main():
+    """AI: Run schema checks and exit non-zero on any problem."""
+    problems = validate_settings_schema()
+    if problems:
+        print("❌ Settings schema validation failed:")
+        for problem in problems:
+            print(f"   - {problem}")
+        sys.exit(1)
+
+    print(f"✅ Settings schema is consistent ({len(Settings.model_fields)} fields checked)")
+
+
+if __name__ == "__main__":
+    main()
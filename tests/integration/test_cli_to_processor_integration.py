@@ -199,7 +199,7 @@ class TestCLIIntegrationWithMocks:
         self.nexus_dir.mkdir()
         self.nginx_dir.mkdir()
 
-    @patch('app.main.LogProcessingOrchestrator')
+    @patch('app.processing.LogProcessingOrchestrator')
     @patch('app.main.DatabaseOperations')
     @patch('app.main.DatabaseConnection')
     def test_cli_creates_orchestrator_with_correct_settings(
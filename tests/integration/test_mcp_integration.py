@@ -193,6 +193,7 @@ class TestMCPServerIntegration:
         assert "error" in security_violation_result
         assert security_violation_result["error"] == "security_violation"
     
+    @patch('app.mcp.server.MCP_STARTUP_TIMEOUT', 0.01)
     @patch('threading.Thread')
     def test_mcp_server_startup_with_database(self, mock_thread, temp_db):
         """AI: Test MCP server startup process with real database."""
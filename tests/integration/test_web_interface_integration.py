@@ -29,13 +29,13 @@ class TestWebInterfaceIntegration:
     """AI: Integration tests for web interface endpoints."""
     
     @pytest.fixture
-    def mock_settings(self, tmp_dirs):
+    def mock_settings(self, tmp_dirs, tmp_path):
         """AI: Create mock settings for testing."""
         nexus_dir, nginx_dir = tmp_dirs
         return Settings(
             nexus_dir=str(nexus_dir),
             nginx_dir=str(nginx_dir),
-            db_name="test.db",
+            db_name=str(tmp_path / "test.db"),
             nexus_pattern="*.log",
             nginx_pattern="*.log",
             web_port=8000,
@@ -335,13 +335,13 @@ class TestWebInterfaceIntegration:
 class TestWebInterfaceConfigurationConsistency:
     """AI: Test that web interface follows ADR_20250728_04 dependency injection patterns."""
     
-    def test_database_dependency_injection_pattern(self, tmp_dirs):
+    def test_database_dependency_injection_pattern(self, tmp_dirs, tmp_path):
         """AI: Verify web routes follow consistent dependency injection pattern."""
         nexus_dir, nginx_dir = tmp_dirs
         mock_settings = Settings(
             nexus_dir=str(nexus_dir), 
             nginx_dir=str(nginx_dir), 
-            db_name="test.db",
+            db_name=str(tmp_path / "test.db"),
             nexus_pattern="*.log", 
             nginx_pattern="*.log"
         )
@@ -360,13 +360,13 @@ class TestWebInterfaceConfigurationConsistency:
         for expected_path in expected_paths:
             assert expected_path in route_paths, f"Missing route: {expected_path}"
     
-    def test_settings_integration_consistency(self, tmp_dirs):
+    def test_settings_integration_consistency(self, tmp_dirs, tmp_path):
         """AI: Verify Settings integration follows established patterns."""
         nexus_dir, nginx_dir = tmp_dirs
         settings = Settings(
             nexus_dir=str(nexus_dir),
             nginx_dir=str(nginx_dir),
-            db_name="web_test.db",
+            db_name=str(tmp_path / "web_test.db"),
             nexus_pattern="request.log*",
             nginx_pattern="access.log*",
             web_port=9000,
@@ -11,11 +11,11 @@ Tests Phase 1 requirements:
 import os
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
-from app.config import Settings, load_settings, validate_configuration
+from app.config import Settings, clear_settings_cache, load_settings, validate_configuration
 
 
 class TestSettings:
@@ -72,6 +72,38 @@ class TestSettings:
         expected = ["access.log*", "old.log.gz"]
         assert settings.nginx_patterns == expected
     
+    def test_patterns_parsed_once_per_instance(self, tmp_path):
+        """AI: Test pattern lists are memoized rather than re-split on each access."""
+        nexus_dir = tmp_path / "nexus"
+        nginx_dir = tmp_path / "nginx"
+        nexus_dir.mkdir()
+        nginx_dir.mkdir()
+        
+        settings = Settings(
+            nexus_dir=str(nexus_dir),
+            nginx_dir=str(nginx_dir)
+        )
+        
+        assert settings.nexus_patterns is settings.nexus_patterns
+        assert settings.nginx_patterns is settings.nginx_patterns
+        assert "nexus_patterns" not in settings.model_dump()
+    
+    def test_patterns_follow_reassigned_pattern_string(self, tmp_path):
+        """AI: Test pattern lists are not stale after the pattern string changes."""
+        nexus_dir = tmp_path / "nexus"
+        nginx_dir = tmp_path / "nginx"
+        nexus_dir.mkdir()
+        nginx_dir.mkdir()
+        
+        settings = Settings(nexus_dir=str(nexus_dir), nginx_dir=str(nginx_dir))
+        assert settings.nginx_patterns == ["access.log*"]
+        
+        settings.nginx_pattern = "custom*.log, other*.log"
+        copy = settings.model_copy(update={'nexus_pattern': "nexus*.log"})
+        
+        assert settings.nginx_patterns == ["custom*.log", "other*.log"]
+        assert copy.nexus_patterns == ["nexus*.log"]
+    
     def test_directory_validation_nonexistent(self):
         """AI: Test validation fails for non-existent directories."""
         with pytest.raises(ValueError, match="Directory does not exist"):
@@ -181,6 +213,83 @@ class TestLoadSettings:
                 nginx_dir="/another/nonexistent"
             )
 
+    def test_load_settings_reuses_validated_instance(self, tmp_path):
+        """AI: Test identical arguments reuse one validation but return private copies."""
+        nexus_dir = tmp_path / "nexus"
+        nginx_dir = tmp_path / "nginx"
+        nexus_dir.mkdir()
+        nginx_dir.mkdir()
+
+        with patch('app.config.Settings', wraps=Settings) as settings_class:
+            first = load_settings(nexus_dir=str(nexus_dir), nginx_dir=str(nginx_dir), web_port=9000)
+            second = load_settings(web_port=9000, nginx_dir=str(nginx_dir), nexus_dir=str(nexus_dir))
+            different = load_settings(nexus_dir=str(nexus_dir), nginx_dir=str(nginx_dir), web_port=9001)
+
+        assert settings_class.call_count == 2
+        assert first == second
+        assert first is not second
+        assert different.web_port == 9001
+
+    def test_load_settings_copies_are_independent(self, tmp_path):
+        """AI: Test state attached to one loaded Settings does not leak into the next."""
+        nexus_dir = tmp_path / "nexus"
+        nginx_dir = tmp_path / "nginx"
+        nexus_dir.mkdir()
+        nginx_dir.mkdir()
+
+        first = load_settings(nexus_dir=str(nexus_dir), nginx_dir=str(nginx_dir))
+        first.chunk_size = 7
+        first._mcp_server = Mock()
+
+        second = load_settings(nexus_dir=str(nexus_dir), nginx_dir=str(nginx_dir))
+        assert second.chunk_size != 7
+        assert not hasattr(second, '_mcp_server')
+
+    def test_directory_check_sees_changes_immediately(self, tmp_path):
+        """AI: Test a removed directory is reported at once, not after a grace period."""
+        nexus_dir = tmp_path / "nexus"
+        nginx_dir = tmp_path / "nginx"
+        nexus_dir.mkdir()
+        nginx_dir.mkdir()
+
+        Settings(nexus_dir=str(nexus_dir), nginx_dir=str(nginx_dir))
+        nexus_dir.rmdir()
+
+        with pytest.raises(ValueError, match="Directory does not exist"):
+            Settings(nexus_dir=str(nexus_dir), nginx_dir=str(nginx_dir))
+
+    def test_clear_settings_cache_revalidates(self, tmp_path):
+        """AI: Test clearing the cache forces validation against the filesystem."""
+        nexus_dir = tmp_path / "nexus"
+        nginx_dir = tmp_path / "nginx"
+        nexus_dir.mkdir()
+        nginx_dir.mkdir()
+
+        first = load_settings(nexus_dir=str(nexus_dir), nginx_dir=str(nginx_dir))
+        nexus_dir.rmdir()
+        clear_settings_cache()
+
+        with pytest.raises(ValueError, match="Directory does not exist"):
+            load_settings(nexus_dir=str(nexus_dir), nginx_dir=str(nginx_dir))
+        assert first.nexus_dir == str(nexus_dir.absolute())
+
+    def test_load_settings_bypass_validators(self):
+        """AI: Test bypass_validators skips validation and fills defaults."""
+        settings = load_settings(
+            nexus_dir="/nonexistent/nexus",
+            nginx_dir="/nonexistent/nginx",
+            web_port=9000,
+            bypass_validators=True
+        )
+
+        # No "Directory does not exist" error and values are taken verbatim
+        assert settings.nexus_dir == "/nonexistent/nexus"
+        assert settings.nginx_dir == "/nonexistent/nginx"
+        assert settings.web_port == 9000
+        assert settings.db_name == "log_analysis.db"
+        assert settings.max_archive_depth == 3
+        assert settings.nginx_patterns == ["access.log*"]
+
 
 class TestValidateConfiguration:
     """AI: Test validate_configuration function."""
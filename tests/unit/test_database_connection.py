@@ -5,13 +5,22 @@ Tests database initialization, session handling, raw SQL execution,
 and error handling scenarios.
 """
 
+import os
+import sqlite3
+import threading
 import tempfile
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 
-from app.database.connection import DatabaseConnection
+from app.database.connection import (
+    INSERTMANYVALUES_PAGE_SIZE,
+    POOL_SIZE,
+    DatabaseConnection,
+    schema_checksum,
+)
 from app.database.models import Base, NginxLog, NexusLog
 
 
@@ -230,6 +239,19 @@ class TestDatabaseConnection:
         
         db_conn.close()
 
+    def test_get_size_bytes_caches_recent_measurement(self):
+        """AI: Test database size is stat'ed once within the cache TTL."""
+        db_conn = DatabaseConnection(self.db_path)
+
+        with patch('app.database.connection.os.stat', wraps=os.stat) as mock_stat:
+            first = db_conn.get_size_bytes()
+            second = db_conn.get_size_bytes()
+
+        assert first == second == Path(self.db_path).stat().st_size
+        mock_stat.assert_called_once()
+
+        db_conn.close()
+
     def test_close_disposes_engine(self):
         """AI: Test that close method properly disposes of engine."""
         db_conn = DatabaseConnection(self.db_path)
@@ -256,6 +278,42 @@ class TestDatabaseConnection:
         
         db_conn.close()
 
+    def test_insertmanyvalues_page_size_is_configurable(self):
+        """AI: Test the batch INSERT page size is passed through to the engine."""
+        default_conn = DatabaseConnection(self.db_path)
+        assert default_conn.engine.dialect.insertmanyvalues_page_size == INSERTMANYVALUES_PAGE_SIZE
+        default_conn.close()
+        
+        tuned_conn = DatabaseConnection(self.db_path, insertmanyvalues_page_size=250)
+        assert tuned_conn.engine.dialect.insertmanyvalues_page_size == 250
+        tuned_conn.close()
+
+    def test_concurrent_sessions_use_pooled_connections(self):
+        """AI: Test parallel writers each get a pooled connection and all commit."""
+        db_conn = DatabaseConnection(self.db_path)
+        assert db_conn.engine.pool.size() == POOL_SIZE
+        
+        def insert_rows(worker):
+            with db_conn.get_session() as session:
+                for i in range(25):
+                    session.add(NginxLog(
+                        ip_address=f"10.0.{worker}.{i}",
+                        timestamp=datetime(2025, 1, 1),
+                        method="GET",
+                        path="/",
+                        http_version="HTTP/1.1",
+                        status_code=200,
+                        raw_log="line",
+                        file_source="access.log",
+                    ))
+        
+        with ThreadPoolExecutor(max_workers=POOL_SIZE) as executor:
+            list(executor.map(insert_rows, range(POOL_SIZE)))
+        
+        count = db_conn.execute_raw_sql("SELECT COUNT(*) AS count FROM nginx_logs")[0]['count']
+        assert count == 25 * POOL_SIZE
+        db_conn.close()
+
 
 class TestDatabaseConnectionErrorHandling:
     """AI: Test error handling scenarios for database connection."""
@@ -272,6 +330,160 @@ class TestDatabaseConnectionErrorHandling:
         if db_path.exists():
             db_path.unlink()
 
+    def test_connections_apply_sqlite_pragmas(self):
+        """AI: Test pooled connections are tuned for WAL bulk ingest."""
+        db_conn = DatabaseConnection(self.db_path)
+
+        assert db_conn.execute_raw_sql("PRAGMA journal_mode")[0]['journal_mode'] == 'wal'
+        assert db_conn.execute_raw_sql("PRAGMA synchronous")[0]['synchronous'] == 1  # NORMAL
+        assert db_conn.execute_raw_sql("PRAGMA temp_store")[0]['temp_store'] == 2  # MEMORY
+        assert db_conn.execute_raw_sql("PRAGMA journal_size_limit")[0]['journal_size_limit'] == 67108864
+
+        db_conn.close()
+
+    def test_readonly_connection_is_shared_and_rejects_writes(self):
+        """AI: Test the analytics connection is reused, sees new data, and is read-only."""
+        db_conn = DatabaseConnection(self.db_path)
+
+        with db_conn.readonly_connection() as first:
+            assert first.exec_driver_sql("SELECT COUNT(*) FROM nginx_logs").scalar() == 0
+
+        with db_conn.get_session() as session:
+            session.add(NginxLog(
+                ip_address='127.0.0.1',
+                timestamp=datetime(2025, 1, 1, 12, 0, 0),
+                method='GET',
+                path='/test',
+                http_version='HTTP/1.1',
+                status_code=200,
+                raw_log='test log line',
+                file_source='test.log'
+            ))
+
+        with db_conn.readonly_connection() as second:
+            assert second is first
+            assert second.exec_driver_sql("SELECT COUNT(*) FROM nginx_logs").scalar() == 1
+            with pytest.raises(Exception, match="readonly"):
+                second.exec_driver_sql("DELETE FROM nginx_logs")
+
+        db_conn.close()
+        assert first.closed
+
+    def test_readonly_connections_serve_threads_concurrently(self):
+        """AI: Test threads hold separate read-only connections at the same time."""
+        db_conn = DatabaseConnection(self.db_path, readonly_pool_size=2)
+        barrier = threading.Barrier(2, timeout=5)
+        held = []
+
+        def query():
+            with db_conn.readonly_connection() as connection:
+                barrier.wait()  # Both threads are inside readonly_connection() at once
+                held.append(connection)
+                connection.exec_driver_sql("SELECT COUNT(*) FROM nginx_logs").scalar()
+
+        threads = [threading.Thread(target=query) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(held) == 2 and held[0] is not held[1]
+        with db_conn.readonly_connection() as outer:
+            with db_conn.readonly_connection() as inner:
+                assert inner is outer  # Nested use does not take a second slot
+
+        db_conn.close()
+        assert all(connection.closed for connection in held)
+
+    def test_data_version_changes_after_other_connection_commits(self):
+        """AI: Test data_version is stable while idle and moves on writes."""
+        db_conn = DatabaseConnection(self.db_path)
+
+        before = db_conn.data_version()
+        assert db_conn.data_version() == before
+
+        with db_conn.get_session() as session:
+            session.add(NginxLog(
+                ip_address='10.0.0.1',
+                timestamp=datetime(2025, 1, 1, 12, 0, 0),
+                method='GET',
+                path='/',
+                http_version='HTTP/1.1',
+                status_code=200,
+                raw_log='raw',
+                file_source='test.log'
+            ))
+
+        assert db_conn.data_version() != before
+
+        db_conn.close()
+
+    def test_reopen_with_matching_schema_checksum_skips_create_all(self):
+        """AI: Test existing databases with a current schema skip create_all."""
+        db_conn = DatabaseConnection(self.db_path)
+        assert db_conn.execute_raw_sql("PRAGMA user_version")[0]['user_version'] == schema_checksum()
+        db_conn.close()
+
+        with patch.object(Base.metadata, 'create_all') as mock_create_all:
+            reopened = DatabaseConnection(self.db_path, fresh_start=False)
+        mock_create_all.assert_not_called()
+        assert reopened.get_table_info('nginx_logs')['exists']
+        reopened.close()
+
+    def test_reopen_with_stale_schema_checksum_runs_create_all(self):
+        """AI: Test databases without a matching checksum are (re)checked and stamped."""
+        db_conn = DatabaseConnection(self.db_path)
+        with db_conn.engine.begin() as connection:
+            connection.exec_driver_sql("PRAGMA user_version = 0")
+        db_conn.close()
+
+        with patch.object(Base.metadata, 'create_all', wraps=Base.metadata.create_all) as mock_create_all:
+            reopened = DatabaseConnection(self.db_path, fresh_start=False)
+        mock_create_all.assert_called_once()
+        assert reopened.execute_raw_sql("PRAGMA user_version")[0]['user_version'] == schema_checksum()
+        reopened.close()
+
+    def test_reopen_with_changed_columns_refuses_database(self):
+        """AI: Test a table with outdated columns is neither migrated nor re-stamped."""
+        db_conn = DatabaseConnection(self.db_path)
+        with db_conn.engine.begin() as connection:
+            connection.exec_driver_sql("ALTER TABLE nginx_logs ADD COLUMN legacy TEXT")
+            connection.exec_driver_sql("PRAGMA user_version = 0")
+        db_conn.close()
+
+        with pytest.raises(RuntimeError, match="outdated nginx_logs table"):
+            DatabaseConnection(self.db_path, fresh_start=False)
+
+        with sqlite3.connect(self.db_path) as raw:
+            assert raw.execute("PRAGMA user_version").fetchone()[0] == 0
+
+    def test_reopen_with_stale_schema_drops_superseded_indexes(self):
+        """AI: Test indexes no longer declared by the models are dropped on upgrade."""
+        db_conn = DatabaseConnection(self.db_path)
+        with db_conn.engine.begin() as connection:
+            connection.exec_driver_sql("CREATE INDEX idx_nginx_timestamp ON nginx_logs(timestamp)")
+            connection.exec_driver_sql("PRAGMA user_version = 0")
+        db_conn.close()
+
+        reopened = DatabaseConnection(self.db_path, fresh_start=False)
+        indexes = {row['name'] for row in reopened.get_table_info('nginx_logs')['indexes']}
+        assert 'idx_nginx_timestamp' not in indexes
+        assert 'idx_nginx_timestamp_id' in indexes
+        reopened.close()
+
+    def test_reopen_with_stale_schema_keeps_user_indexes(self):
+        """AI: Test indexes created by users survive the upgrade."""
+        db_conn = DatabaseConnection(self.db_path)
+        with db_conn.engine.begin() as connection:
+            connection.exec_driver_sql("CREATE INDEX my_user_agent ON nginx_logs(user_agent)")
+            connection.exec_driver_sql("PRAGMA user_version = 0")
+        db_conn.close()
+
+        reopened = DatabaseConnection(self.db_path, fresh_start=False)
+        indexes = {row['name'] for row in reopened.get_table_info('nginx_logs')['indexes']}
+        assert 'my_user_agent' in indexes
+        reopened.close()
+
     def test_get_table_info_handles_sql_errors(self):
         """AI: Test table info gracefully handles SQL errors."""
         db_conn = DatabaseConnection(self.db_path)
@@ -178,6 +178,49 @@ class TestDatabaseOperations:
         assert results[0]['ip_address'] == '127.0.0.1'
         assert results[0]['method'] == 'GET'
     
+    def test_execute_query_columnar_returns_value_lists(self):
+        """AI: Test execute_query_columnar returns column names and decoded value lists."""
+        log_data = [{
+            'ip_address': '127.0.0.1',
+            'timestamp': datetime(2025, 1, 1, 12, 0, 0),
+            'method': 'GET',
+            'path': '/test',
+            'http_version': 'HTTP/1.1',
+            'status_code': 200,
+            'raw_log': 'test log line',
+            'file_source': 'test.log'
+        }]
+        self.db_ops.batch_insert_nginx_logs(log_data)
+        
+        columns, rows = self.db_ops.execute_query_columnar(
+            "SELECT method, status_code, raw_log FROM nginx_logs"
+        )
+        
+        assert columns == ['method', 'status_code', 'raw_log']
+        assert rows == [['GET', 200, 'test log line']]
+        
+        # Column names are reported even without matching rows
+        assert self.db_ops.execute_query_columnar(
+            "SELECT method FROM nginx_logs WHERE 1 = 0"
+        ) == (['method'], [])
+
+    def test_execute_query_decodes_blobs_by_type(self):
+        """AI: Test BLOB values are JSON-safe whatever their column is called."""
+        self.db_ops.batch_insert_nginx_logs([{
+            'ip_address': '127.0.0.1',
+            'timestamp': datetime(2025, 1, 1, 12, 0, 0),
+            'method': 'GET',
+            'path': '/test',
+            'http_version': 'HTTP/1.1',
+            'status_code': 200,
+            'raw_log': 'test log line',
+            'file_source': 'test.log'
+        }])
+        query = "SELECT raw_log AS compressed, X'00FF' AS other FROM nginx_logs"
+
+        assert self.db_ops.execute_query(query) == [{'compressed': 'test log line', 'other': '00ff'}]
+        assert self.db_ops.execute_query_columnar(query)[1] == [['test log line', '00ff']]
+    
     def test_execute_query_rejects_non_select(self):
         """AI: Test that non-SELECT queries are rejected for security."""
         with pytest.raises(ValueError, match="Only SELECT queries are allowed"):
@@ -375,6 +418,15 @@ class TestDatabaseOperations:
         assert 'exists' in nginx_info
         assert 'columns' in nginx_info
     
+    def test_get_database_schema_without_statistics(self):
+        """AI: Test the structure-only schema skips the statistics aggregation."""
+        with patch.object(self.db_ops.common, 'get_processing_stats') as mock_stats:
+            schema = self.db_ops.get_database_schema(include_statistics=False)
+        
+        mock_stats.assert_not_called()
+        assert schema['statistics'] == {}
+        assert 'nginx_logs' in schema['tables']
+    
     def test_get_processing_stats(self):
         """AI: Test processing statistics retrieval."""
         # Insert test data
@@ -422,6 +474,19 @@ class TestDatabaseOperations:
         assert nexus_stats['unique_ips'] == 1
         assert nexus_stats['unique_days'] == 1
     
+    def test_get_processing_stats_uses_single_query(self):
+        """AI: Test stats for both tables are fetched in one query."""
+        with patch.object(
+            self.db_ops.common, 'execute_query', wraps=self.db_ops.common.execute_query
+        ) as mock_query:
+            stats = self.db_ops.get_processing_stats()
+
+        mock_query.assert_called_once()
+        assert stats['nginx']['total_entries'] == 0
+        assert stats['nexus']['total_entries'] == 0
+        assert 'src' not in stats['nginx']
+        assert stats['database']['total_entries'] == 0
+    
     def test_get_processing_stats_handles_errors(self):
         """AI: Test processing stats handles SQL errors gracefully."""
         with patch.object(self.db_ops.common, 'execute_query', side_effect=Exception("Stats Error")):
@@ -435,3 +500,68 @@ class TestDatabaseOperations:
         with patch.object(self.db_connection, 'close') as mock_close:
             self.db_ops.close()
             mock_close.assert_called_once()
+    
+    def _nginx_entry(self, path, **overrides):
+        """AI: Build one valid nginx entry for bulk ingest tests."""
+        entry = {
+            'ip_address': '192.168.1.1',
+            'timestamp': datetime(2025, 1, 1, 12, 0, 0),
+            'method': 'GET',
+            'path': path,
+            'http_version': 'HTTP/1.1',
+            'status_code': 200,
+            'raw_log': 'test log line',
+            'file_source': 'test.log'
+        }
+        entry.update(overrides)
+        return entry
+    
+    def _nginx_count(self):
+        """AI: Count committed nginx rows through a separate connection."""
+        return self.db_connection.execute_raw_sql("SELECT COUNT(*) AS count FROM nginx_logs")[0]['count']
+    
+    def test_bulk_ingest_commits_every_n_rows_and_on_exit(self):
+        """AI: Test batch inserts share one transaction committed in commit_every steps."""
+        with self.db_ops.bulk_ingest(commit_every=3):
+            self.db_ops.batch_insert_nginx_logs([self._nginx_entry('/a'), self._nginx_entry('/b')])
+            assert self._nginx_count() == 0  # Still pending in the shared transaction
+            
+            self.db_ops.batch_insert_nginx_logs([self._nginx_entry('/c')])
+            assert self._nginx_count() == 3
+            
+            self.db_ops.batch_insert_nexus_logs([])
+            self.db_ops.batch_insert_nginx_logs([self._nginx_entry('/d')])
+            assert self._nginx_count() == 3
+        
+        assert self._nginx_count() == 4
+    
+    def test_bulk_ingest_failed_batch_only_discards_its_own_rows(self):
+        """AI: Test a failing batch rolls back to its savepoint, keeping earlier batches."""
+        with self.db_ops.bulk_ingest():
+            self.db_ops.batch_insert_nginx_logs([self._nginx_entry('/a')])
+            with pytest.raises(Exception):
+                self.db_ops.batch_insert_nginx_logs(
+                    [self._nginx_entry('/b'), self._nginx_entry('/c', timestamp=None)]
+                )
+            self.db_ops.batch_insert_nginx_logs([self._nginx_entry('/d')])
+        
+        paths = self.db_connection.execute_raw_sql("SELECT path FROM nginx_logs ORDER BY id")
+        assert [row['path'] for row in paths] == ['/a', '/d']
+    
+    def test_bulk_ingest_archives_each_commit_with_one_flush(self):
+        """AI: Test all batches of a bulk commit reach the Parquet sink in one flush."""
+        sink = MagicMock()
+        self.db_ops.nginx.parquet_sink = sink
+        with self.db_ops.bulk_ingest(commit_every=3):
+            self.db_ops.batch_insert_nginx_logs([self._nginx_entry('/a')])
+            self.db_ops.batch_insert_nginx_logs([self._nginx_entry('/b')])
+            assert sink.flush.call_count == 0  # Not committed yet
+            
+            self.db_ops.batch_insert_nginx_logs([self._nginx_entry('/c')])
+            assert sink.flush.call_count == 1
+            
+            self.db_ops.batch_insert_nginx_logs([self._nginx_entry('/d')])
+        
+        assert sink.flush.call_count == 2
+        archived = [row['path'] for call in sink.append.call_args_list for row in call.args[0]]
+        assert archived == ['/a', '/b', '/c', '/d']
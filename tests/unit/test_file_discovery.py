@@ -8,6 +8,8 @@ Tests file discovery functionality:
 - Memory-efficient iteration
 """
 
+import fnmatch
+import os
 import pytest
 import tempfile
 import tarfile
@@ -15,7 +17,7 @@ import zipfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from app.file_discovery.discovery import LogFileDiscovery, create_file_iterator_from_path
+from app.file_discovery.discovery import LogFileDiscovery, _compile_patterns, create_file_iterator_from_path
 from app.config import Settings
 
 
@@ -33,17 +35,25 @@ class TestLogFileDiscovery:
         
         self.discovery = LogFileDiscovery(self.mock_settings)
     
-    def test_get_nginx_patterns(self):
-        """AI: Test nginx pattern extraction from configuration."""
-        patterns = self.discovery._get_nginx_patterns()
+    def test_nginx_matcher(self):
+        """AI: Test nginx patterns are compiled from configuration."""
+        matcher = self.discovery._nginx_matcher()
         
-        assert patterns == ["access.log*", "*.log"]
+        assert matcher is _compile_patterns(("access.log*", "*.log"))
+        assert matcher is self.discovery._nginx_matcher()  # Compiled once
     
-    def test_get_nexus_patterns(self):
-        """AI: Test Nexus pattern extraction from configuration."""
-        patterns = self.discovery._get_nexus_patterns()
+    def test_nexus_matcher(self):
+        """AI: Test Nexus patterns are compiled from configuration."""
+        matcher = self.discovery._nexus_matcher()
         
-        assert patterns == ["request.log*", "nexus_logs_*.tar"]
+        assert matcher.prefixes == ("request.log",)
+        assert matcher.regex.match("nexus_logs_2025.tar")
+    
+    def test_matcher_follows_changed_setting(self):
+        """AI: Test a changed pattern setting is picked up on the next discovery."""
+        self.mock_settings.nginx_pattern = "error.log"
+        
+        assert self.discovery._nginx_matcher().exacts == {"error.log"}
     
     def test_matches_patterns(self):
         """AI: Test filename pattern matching."""
@@ -59,6 +69,29 @@ class TestLogFileDiscovery:
         assert not self.discovery._matches_patterns("error.log", patterns)
         assert not self.discovery._matches_patterns("random.txt", patterns)
         assert not self.discovery._matches_patterns("access.txt", patterns)
+
+    def test_matches_patterns_agrees_with_fnmatch(self):
+        """AI: Test the combined compiled regex matches exactly like fnmatch per pattern."""
+        patterns = ["access.log*", "request.log.[0-9]", "nexus_?.tar", "*.GZ", "exact.log"]
+        names = [
+            "access.log", "ACCESS.LOG.2", "request.log.1", "request.log.x",
+            "nexus_a.tar", "nexus_ab.tar", "logs.gz", "exact.log", "exact.log.1", "other"
+        ]
+
+        for name in names:
+            expected = any(fnmatch.fnmatch(name.lower(), p.lower()) for p in patterns)
+            assert self.discovery._matches_patterns(name, patterns) == expected, name
+    
+    def test_compile_patterns_buckets_simple_globs(self):
+        """AI: Test literal, prefix* and *suffix globs bypass the regex."""
+        compiled = _compile_patterns(("Access.log", "request.log*", "*.tar", "*_[0-9].log", "a*b"))
+        
+        assert compiled.exacts == {"access.log"}
+        assert compiled.prefixes == ("request.log",)
+        assert compiled.suffixes == (".tar",)
+        assert compiled.regex.match("nexus_1.log")
+        assert compiled.regex.match("axxb")
+        assert not compiled.regex.match("access.log")
     
     def test_is_archive_file(self):
         """AI: Test archive file detection."""
@@ -68,6 +101,7 @@ class TestLogFileDiscovery:
         assert self.discovery._is_archive_file(Path("logs.tar.bz2"))
         assert self.discovery._is_archive_file(Path("logs.zip"))
         assert self.discovery._is_archive_file(Path("archive.gz"))  # Single .gz
+        assert self.discovery._is_archive_file(Path("LOGS.2025.05.TAR.BZ2"))  # Dotted, upper case
         
         # Should not detect as archives
         assert not self.discovery._is_archive_file(Path("access.log"))
@@ -204,6 +238,23 @@ class TestCreateFileIterator:
         finally:
             temp_path.unlink()
     
+    @pytest.mark.skipif(not hasattr(os, 'posix_fadvise'), reason="posix_fadvise not available")
+    def test_create_file_iterator_advises_sequential_then_dontneed(self):
+        """AI: Test the file is advised sequential while read and dropped from cache afterwards."""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
+            temp_file.write("line\n")
+            temp_path = Path(temp_file.name)
+        
+        try:
+            with patch('os.posix_fadvise') as mock_fadvise:
+                for _, file_handle in create_file_iterator_from_path(temp_path, "advised"):
+                    fd = file_handle.fileno()
+                    assert [c.args for c in mock_fadvise.call_args_list] == [(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)]
+            
+            assert mock_fadvise.call_args.args == (fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            temp_path.unlink()
+    
     def test_create_file_iterator_file_not_found(self):
         """AI: Test file iterator with non-existent file."""
         non_existent = Path("/non/existent/file.log")
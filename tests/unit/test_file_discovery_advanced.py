@@ -5,16 +5,21 @@ Tests advanced functionality, error scenarios, and edge cases to improve coverag
 from 72% to 85%+. Focuses on untested paths and error handling scenarios.
 """
 
+import os
 import pytest
 import tempfile
+import time
 import tarfile
 import zipfile
 import gzip
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, mock_open
 
-from app.file_discovery.discovery import LogFileDiscovery, create_file_iterator_from_path
+from app.file_discovery.discovery import (
+    ARCHIVE_CACHE_MAX_AGE, LogFileDiscovery, _compile_patterns, create_file_iterator_from_path
+)
 from app.config import Settings
 
 
@@ -61,25 +66,84 @@ class TestFileDiscoveryAdvanced:
             test_file = temp_path / "access.log"
             test_file.write_text("test log line\n")
             
-            # Mock os.walk to return the same file multiple times (simulating symlinks)
-            mock_walk_data = [
-                (str(temp_path), [], ["access.log"]),
-                (str(temp_path), [], ["access.log"]),  # Duplicate
-            ]
+            # Symlink to the same file also matches the pattern
+            (temp_path / "access.log.1").symlink_to(test_file)
             
             self.mock_settings.nginx_dir = str(temp_path)
             self.mock_settings.nginx_pattern = "access.log*"
             
-            with patch('os.walk', return_value=mock_walk_data):
+            files = list(self.discovery.discover_nginx_files())
+            
+            # Should only process file once despite the symlink
+            assert len(files) == 1
+    
+    def test_discover_files_links_to_outside_file_yielded_once(self):
+        """AI: Test several symlinks to one file outside the tree yield it once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            outside = temp_path / "rotated.txt"
+            outside.write_text("test log line\n")
+            nginx_dir = temp_path / "nginx"
+            nginx_dir.mkdir()
+            (nginx_dir / "access.log.1").symlink_to(outside)
+            (nginx_dir / "access.log.2").symlink_to(outside)
+            
+            self.mock_settings.nginx_dir = str(nginx_dir)
+            self.mock_settings.nginx_pattern = "access.log*"
+            
+            files = list(self.discovery.discover_nginx_files())
+            
+            assert len(files) == 1
+    
+    def test_discover_files_yields_batches(self):
+        """AI: Test matches are emitted in DISCOVERY_BATCH_SIZE lists and flattened by discover_*."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for index in range(3):
+                (temp_path / f"access.log.{index}").write_text("line\n")
+            
+            with patch('app.file_discovery.discovery.DISCOVERY_BATCH_SIZE', 2):
+                batches = list(self.discovery._discover_files_by_patterns(temp_path, _compile_patterns(("access.log*",)), "nginx"))
+                
+                self.mock_settings.nginx_dir = str(temp_path)
+                self.mock_settings.nginx_pattern = "access.log*"
                 files = list(self.discovery.discover_nginx_files())
+            
+            assert [len(batch) for batch in batches] == [2, 1]
+            assert sorted(files) == sorted(batches[0] + batches[1])
+    
+    def test_discover_files_yields_archive_members_before_next_extraction(self):
+        """AI: Test members of one archive are handed out before the next archive is extracted."""
+        extracted = []
+        
+        def extract(archive_path, patterns, log_type, depth):
+            extracted.append(archive_path.name)
+            yield archive_path.with_suffix(".log"), f"{log_type}:{archive_path.name}->member.log"
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            for name in ("first.tar", "second.tar"):
+                (temp_path / name).write_bytes(b"")
+            
+            with patch.object(self.discovery, '_process_archive_recursive', side_effect=extract):
+                batches = self.discovery._discover_files_by_patterns(
+                    temp_path, _compile_patterns(("*.tar",)), "nexus"
+                )
+                first = next(batches)
+                assert len(extracted) == 1
+                assert first == [(
+                    (temp_path / extracted[0]).with_suffix(".log"), f"nexus:{extracted[0]}->member.log"
+                )]
                 
-                # Should only process file once despite duplicate in walk
-                assert len(files) == 1
+                rest = list(batches)
+            
+            assert len(extracted) == 2
+            assert [len(batch) for batch in rest] == [1]
     
     def test_process_archive_max_depth_reached(self):
         """AI: Test archive processing stops at max depth - covers lines 180-181."""
         archive_path = Path("/test/nested.tar")
-        patterns = ["*.log"]
+        patterns = _compile_patterns(("*.log",))
         
         with patch('app.file_discovery.discovery.logger.warn') as mock_logger_warn:
             # Test with depth at maximum
@@ -100,7 +164,7 @@ class TestFileDiscoveryAdvanced:
             fake_archive = temp_path / "fake.tar"
             fake_archive.write_text("not a real archive")
             
-            patterns = ["*.log"]
+            patterns = _compile_patterns(("*.log",))
             
             with patch('app.file_discovery.discovery.logger.error') as mock_logger_error:
                 results = list(self.discovery._process_archive_recursive(
@@ -140,13 +204,14 @@ class TestFileDiscoveryAdvanced:
             
             # Create tar with unsafe member
             archive_path = temp_path / "unsafe.tar"
+            archive_path.write_bytes(b"")
             
             # Mock tarfile member with unsafe path
             mock_member = Mock()
             mock_member.name = "../../../etc/passwd"  # Directory traversal
             
-            mock_tar = Mock()
-            mock_tar.getmembers.return_value = [mock_member]
+            mock_tar = MagicMock()
+            mock_tar.__iter__.return_value = iter([mock_member])
             mock_tar.__enter__ = Mock(return_value=mock_tar)
             mock_tar.__exit__ = Mock(return_value=None)
             
@@ -173,8 +238,11 @@ class TestFileDiscoveryAdvanced:
             archive_path = temp_path / "unsafe.zip"
             
             # Mock zipfile with unsafe member
+            mock_member = Mock()
+            mock_member.filename = "../../../etc/passwd"  # Directory traversal
+            
             mock_zip = Mock()
-            mock_zip.namelist.return_value = ["../../../etc/passwd"]  # Directory traversal
+            mock_zip.infolist.return_value = [mock_member]
             mock_zip.__enter__ = Mock(return_value=mock_zip)
             mock_zip.__exit__ = Mock(return_value=None)
             
@@ -185,12 +253,31 @@ class TestFileDiscoveryAdvanced:
 
                 assert result is True
                 # Should not extract unsafe member
-                mock_zip.extract.assert_not_called()
+                mock_zip.open.assert_not_called()
                 # Should print warning
                 warning_calls = [call for call in mock_logger_warn.call_args_list
                                if "Unsafe path" in str(call)]
                 assert len(warning_calls) > 0
     
+    def test_extract_archive_zip_members_concurrently(self):
+        """AI: Test deflated and stored zip members, including subdirectories, are all extracted."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            extract_to = temp_path / "extract"
+            extract_to.mkdir()
+            
+            archive_path = temp_path / "logs.zip"
+            with zipfile.ZipFile(archive_path, 'w') as zip_file:
+                for index in range(4):
+                    zip_file.writestr(f"day{index}/access.log", f"deflated {index}", zipfile.ZIP_DEFLATED)
+                zip_file.writestr("stored.log", "stored", zipfile.ZIP_STORED)
+            
+            assert self.discovery._extract_archive(archive_path, extract_to) is True
+            
+            for index in range(4):
+                assert (extract_to / f"day{index}" / "access.log").read_text() == f"deflated {index}"
+            assert (extract_to / "stored.log").read_text() == "stored"
+    
     def test_extract_archive_gzip_single_file(self):
         """AI: Test gzip single file extraction - covers lines 247-256."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -218,6 +305,22 @@ class TestFileDiscoveryAdvanced:
                 content = f.read()
             assert content == test_content
     
+    def test_extract_archive_dotted_tar_gz_name(self):
+        """AI: Test a .tar.gz whose name contains further dots is extracted as tar."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            extract_to = temp_path / "extract"
+            extract_to.mkdir()
+            
+            log_file = temp_path / "request.log"
+            log_file.write_text("dotted content")
+            archive_path = temp_path / "nexus_logs_2025.05.29.tar.gz"
+            with tarfile.open(archive_path, 'w:gz') as tar:
+                tar.add(log_file, arcname="request.log")
+            
+            assert self.discovery._extract_archive(archive_path, extract_to) is True
+            assert (extract_to / "request.log").read_text() == "dotted content"
+    
     def test_extract_archive_exception_handling(self):
         """AI: Test extraction exception handling - covers lines 299-300."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -241,7 +344,7 @@ class TestFileDiscoveryAdvanced:
         """AI: Test processing nested archives in extracted content - covers lines 322-323."""
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
-            patterns = ["*.log", "*.tar"]
+            patterns = _compile_patterns(("*.log", "*.tar"))
             
             # Create nested structure with archive
             subdir = temp_path / "subdir"
@@ -271,6 +374,96 @@ class TestFileDiscoveryAdvanced:
                 assert call_args[2] == "test"
                 assert call_args[3] == 1  # depth + 1
 
+    
+    def test_process_extracted_contents_sibling_archives_in_parallel(self):
+        """AI: Test several nested archives are extracted concurrently."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            extract_path = temp_path / "extract"
+            extract_path.mkdir()
+            
+            for name in ("a", "b", "c"):
+                log_file = temp_path / f"{name}.log"
+                log_file.write_text(f"{name} content")
+                with tarfile.open(extract_path / f"nested_{name}.tar", 'w') as tar:
+                    tar.add(log_file, arcname=f"{name}.log")
+            
+            with patch('app.file_discovery.discovery.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+                results = list(self.discovery._process_extracted_contents(
+                    extract_path, _compile_patterns(("*.log", "*.tar")), "test", "parent.tar", 0
+                ))
+            
+            mock_executor.assert_called_once()
+            assert sorted(path.read_text() for path, _ in results) == ["a content", "b content", "c content"]
+            assert sorted(desc for _, desc in results) == [
+                "test:nested_a.tar->a.log", "test:nested_b.tar->b.log", "test:nested_c.tar->c.log"
+            ]
+            self.discovery.cleanup_temp_dirs()
+    
+    def test_process_archive_reuses_cached_extraction(self):
+        """AI: Test an unchanged archive is extracted once into cache_dir and reused."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            log_file = temp_path / "request.log"
+            log_file.write_text("cached content")
+            archive_path = temp_path / "logs.tar"
+            with tarfile.open(archive_path, 'w') as tar:
+                tar.add(log_file, arcname="request.log")
+            
+            discovery = LogFileDiscovery(self.mock_settings, cache_dir=str(temp_path / "cache"))
+            first = list(discovery._process_archive_recursive(archive_path, _compile_patterns(("*.log",)), "test", depth=0))
+            
+            with patch.object(discovery, '_extract_archive') as mock_extract:
+                second = list(discovery._process_archive_recursive(archive_path, _compile_patterns(("*.log",)), "test", depth=0))
+                mock_extract.assert_not_called()
+            
+            assert first == second
+            assert first[0][0].read_text() == "cached content"
+            assert discovery._temp_dirs == []  # Cached extractions survive cleanup
+    
+    def test_cached_extraction_distinguishes_same_named_archives(self):
+        """AI: Test archives sharing name, size and mtime in different directories get their own entries."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            archives = []
+            for node in ("node1", "node2"):
+                node_dir = temp_path / node
+                node_dir.mkdir()
+                log_file = node_dir / "request.log"
+                log_file.write_text(f"{node} line")  # Same length for both nodes
+                archive_path = node_dir / "logs.tar"
+                with tarfile.open(archive_path, 'w') as tar:
+                    tar.add(log_file, arcname="request.log")
+                os.utime(archive_path, ns=(1_700_000_000_000_000_000,) * 2)
+                archives.append(archive_path)
+            assert archives[0].stat().st_size == archives[1].stat().st_size
+            
+            discovery = LogFileDiscovery(self.mock_settings, cache_dir=str(temp_path / "cache"))
+            contents = [
+                [path.read_text() for path, _ in discovery._process_archive_recursive(
+                    archive_path, _compile_patterns(("*.log",)), "test", depth=0
+                )]
+                for archive_path in archives
+            ]
+            
+            assert contents == [["node1 line"], ["node2 line"]]
+    
+    def test_cleanup_evicts_unused_cached_extractions(self):
+        """AI: Test cache entries unused for ARCHIVE_CACHE_MAX_AGE are removed on cleanup."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = Path(temp_dir) / "cache"
+            stale = cache_dir / "stale"
+            fresh = cache_dir / "fresh"
+            stale.mkdir(parents=True)
+            fresh.mkdir()
+            old = time.time() - ARCHIVE_CACHE_MAX_AGE - 60
+            os.utime(stale, (old, old))
+            
+            discovery = LogFileDiscovery(self.mock_settings, cache_dir=str(cache_dir))
+            discovery.cleanup_temp_dirs()
+            
+            assert not stale.exists()
+            assert fresh.is_dir()
 
 class TestLogFileDiscoveryErrorHandling:
     """AI: Test error handling and edge cases in file discovery."""
@@ -312,10 +505,12 @@ class TestLogFileDiscoveryErrorHandling:
             # Should not attempt to remove non-existent directory
             mock_rmtree.assert_not_called()
     
-    def test_destructor_calls_cleanup(self):
-        """AI: Test that __del__ calls cleanup_temp_dirs."""
+    def test_context_manager_calls_cleanup(self):
+        """AI: Test that leaving the with block calls cleanup_temp_dirs."""
         with patch.object(self.discovery, 'cleanup_temp_dirs') as mock_cleanup:
-            self.discovery.__del__()
+            with self.discovery as discovery:
+                assert discovery is self.discovery
+                mock_cleanup.assert_not_called()
             mock_cleanup.assert_called_once()
     
     def test_case_insensitive_pattern_matching(self):
@@ -346,6 +541,11 @@ class TestLogFileDiscoveryErrorHandling:
         # Test absolute paths
         assert not self.discovery._is_safe_path("/etc/passwd")
         assert not self.discovery._is_safe_path("C:\\Windows\\System32")
+        
+        # ".." only matters as a whole path component
+        assert self.discovery._is_safe_path("access..log")
+        assert self.discovery._is_safe_path("logs/..hidden/access.log")
+        assert not self.discovery._is_safe_path("logs/..")
 
 
 class TestCreateFileIteratorAdvanced:
@@ -77,6 +77,18 @@ class TestLogLevelFiltering:
         assert "Warning message" in captured.err
         assert "Error message" in captured.err
 
+    def test_is_enabled_matches_effective_level(self):
+        """AI: Test is_enabled reports whether a level would be written."""
+        original_is_test = self.logger._is_test_environment
+        self.logger._is_test_environment = lambda: False
+        try:
+            self.logger.set_level(LogLevel.INFO)
+            assert not self.logger.is_enabled(LogLevel.DEBUG)
+            assert self.logger.is_enabled(LogLevel.INFO)
+            assert self.logger.is_enabled(LogLevel.ERROR)
+        finally:
+            self.logger._is_test_environment = original_is_test
+
 
 class TestStderrOutput:
     """AI: Test that logger outputs to stderr, not stdout."""
@@ -113,6 +125,28 @@ class TestStderrOutput:
         assert captured.out == ""
 
 
+    def test_info_lines_single_write(self, capsys):
+        """AI: Test info_lines writes all lines with INFO prefixes in one write."""
+        test_logger = Logger()
+        original_is_test = test_logger._is_test_environment
+        test_logger._is_test_environment = lambda: False
+        try:
+            with pytest.MonkeyPatch.context() as mp:
+                writes = []
+                mp.setattr(sys.stderr, "write", writes.append)
+                test_logger.info_lines("first", "second")
+        finally:
+            test_logger._is_test_environment = original_is_test
+
+        assert writes == ["ℹ️  INFO: first\nℹ️  INFO: second\n"]
+
+    def test_info_lines_suppressed_in_test_mode(self, capsys):
+        """AI: Test info_lines follows the INFO level filtering."""
+        Logger().info_lines("hidden line")
+
+        captured = capsys.readouterr()
+        assert "hidden line" not in captured.err
+
 class TestMessageFormatting:
     """AI: Test message formatting with arguments."""
 
@@ -198,3 +232,39 @@ class TestTestModeDetection:
         # WARN and ERROR should show
         assert "Warning message" in captured.err
         assert "Error message" in captured.err
+
+
+class TestConfigureLogging:
+    """AI: Test stdlib logging configuration from app/__init__.py."""
+
+    def setup_method(self):
+        """AI: Save root handlers so each test starts from a known state."""
+        import logging
+        self.root = logging.getLogger()
+        self.original_handlers = self.root.handlers[:]
+
+    def teardown_method(self):
+        """AI: Restore original root handlers."""
+        self.root.handlers[:] = self.original_handlers
+
+    def test_replaces_stdout_handlers_with_stderr(self):
+        """AI: Test non-stderr handlers are swapped for a single stderr handler."""
+        import logging
+        from app import configure_logging
+
+        self.root.handlers[:] = [logging.StreamHandler(sys.stdout)]
+        configure_logging()
+
+        assert len(self.root.handlers) == 1
+        assert self.root.handlers[0].stream is sys.stderr
+
+    def test_repeated_calls_keep_existing_stderr_handler(self):
+        """AI: Test configure_logging is idempotent once stderr is configured."""
+        from app import configure_logging
+
+        self.root.handlers[:] = []
+        configure_logging()
+        handler = self.root.handlers[0]
+        configure_logging()
+
+        assert self.root.handlers == [handler]
@@ -10,7 +10,10 @@ Tests target missing coverage areas in app/main.py:
 - Server startup and error handling
 """
 
+import os
 import pytest
+import signal
+import subprocess
 import sys
 import threading
 import time
@@ -18,7 +21,8 @@ from unittest.mock import patch, MagicMock, mock_open
 from pathlib import Path
 from click.testing import CliRunner
 
-from app.main import cli, start_web_server, start_mcp_server
+from app.__main__ import _stdio_db_name, main
+from app.main import cli, start_web_server, start_mcp_server, wait_for_shutdown
 from app.config import Settings
 
 
@@ -47,7 +51,7 @@ class TestMainCLI:
              patch('app.main.DatabaseConnection') as mock_db_conn, \
              patch('app.main.DatabaseOperations') as mock_db_ops, \
              patch('app.main.start_web_server') as mock_web, \
-             patch('time.sleep', side_effect=KeyboardInterrupt):  # Immediately interrupt the loop
+             patch('app.main.wait_for_shutdown'):  # Return as if Ctrl+C was pressed
             
             mock_settings = MagicMock()
             mock_settings.enable_mcp_server = False
@@ -153,9 +157,9 @@ class TestMainCLI:
              patch('app.main.validate_configuration'), \
              patch('app.main.DatabaseConnection'), \
              patch('app.main.DatabaseOperations') as mock_db_ops, \
-             patch('app.main.LogProcessingOrchestrator') as mock_orchestrator, \
+             patch('app.processing.LogProcessingOrchestrator') as mock_orchestrator, \
              patch('app.main.start_web_server'), \
-             patch('time.sleep', side_effect=KeyboardInterrupt):  # Immediately interrupt the loop
+             patch('app.main.wait_for_shutdown'):  # Return as if Ctrl+C was pressed
             
             mock_settings = MagicMock()
             mock_settings.enable_mcp_server = False
@@ -185,7 +189,7 @@ class TestMainCLI:
              patch('app.main.validate_configuration'), \
              patch('app.main.DatabaseConnection'), \
              patch('app.main.DatabaseOperations') as mock_db_ops, \
-             patch('app.main.LogProcessingOrchestrator') as mock_orchestrator:
+             patch('app.processing.LogProcessingOrchestrator') as mock_orchestrator:
             
             mock_settings = MagicMock()
             mock_settings.process_only = True
@@ -217,7 +221,7 @@ class TestMainCLI:
              patch('app.main.DatabaseConnection'), \
              patch('app.main.DatabaseOperations'), \
              patch('app.main.start_web_server') as mock_web_server, \
-             patch('time.sleep', side_effect=KeyboardInterrupt):  # Immediately interrupt the loop
+             patch('app.main.wait_for_shutdown'):  # Return as if Ctrl+C was pressed
             
             mock_settings = MagicMock()
             mock_settings.enable_mcp_server = False
@@ -241,7 +245,7 @@ class TestMainCLI:
              patch('app.main.DatabaseOperations'), \
              patch('app.main.start_web_server'), \
              patch('app.main.start_mcp_server') as mock_mcp_server, \
-             patch('time.sleep', side_effect=KeyboardInterrupt):  # Immediately interrupt the loop
+             patch('app.main.wait_for_shutdown'):  # Return as if Ctrl+C was pressed
             
             mock_settings = MagicMock()
             mock_settings.enable_mcp_server = True
@@ -266,7 +270,7 @@ class TestMainCLI:
              patch('app.main.DatabaseOperations'), \
              patch('app.main.start_web_server'), \
              patch('app.main.start_mcp_server'), \
-             patch('time.sleep', side_effect=KeyboardInterrupt):  # Immediately interrupt the loop
+             patch('app.main.wait_for_shutdown'):  # Return as if Ctrl+C was pressed
             
             mock_settings = MagicMock()
             mock_settings.enable_mcp_server = True
@@ -294,7 +298,7 @@ class TestMainCLI:
              patch('app.main.DatabaseConnection'), \
              patch('app.main.DatabaseOperations') as mock_db_ops, \
              patch('app.main.start_web_server'), \
-             patch('time.sleep', side_effect=KeyboardInterrupt):  # Trigger KeyboardInterrupt immediately
+             patch('app.main.wait_for_shutdown'):  # Return as if Ctrl+C was pressed
             
             mock_settings = MagicMock()
             mock_settings.enable_mcp_server = False
@@ -327,15 +331,37 @@ class TestMainCLI:
             assert result.exit_code == 1
             assert "ERROR: Application startup failed: Configuration error" in result.output
 
+    
+    def test_wait_for_shutdown_returns_on_signal(self):
+        """AI: Test the idle wait ends on SIGTERM and restores the previous handler."""
+        previous = signal.getsignal(signal.SIGTERM)
+        timer = threading.Timer(0.1, os.kill, args=(os.getpid(), signal.SIGTERM))
+        timer.start()
+        
+        wait_for_shutdown()
+        
+        timer.join()
+        assert signal.getsignal(signal.SIGTERM) is previous
+    
+    def test_import_skips_web_and_processing_modules(self):
+        """AI: Test importing the CLI does not load uvicorn/FastAPI or the processing pipeline."""
+        code = (
+            "import sys, app.main; "
+            "print(sorted(m for m in ('uvicorn', 'fastapi', 'app.processing', 'app.web.routes') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        
+        assert result.stdout.strip() == "[]"
+
 
 class TestWebServerStartup:
     """AI: Test web server startup functionality."""
     
     def test_start_web_server_success(self):
         """AI: Test successful web server startup."""
-        with patch('app.main.create_web_app') as mock_create_app, \
-             patch('app.main.uvicorn.Config') as mock_config, \
-             patch('app.main.uvicorn.Server') as mock_server, \
+        with patch('app.web.routes.create_web_app') as mock_create_app, \
+             patch('uvicorn.Config') as mock_config, \
+             patch('uvicorn.Server') as mock_server, \
              patch('app.main.threading.Thread') as mock_thread, \
              patch('time.sleep'):
             
@@ -366,9 +392,25 @@ class TestWebServerStartup:
             assert mock_thread.called
             assert mock_thread_instance.start.called
     
+    def test_start_web_server_thread_exits_before_ready(self):
+        """AI: Test startup fails fast when the server thread dies before uvicorn is started."""
+        with patch('app.web.routes.create_web_app'), \
+             patch('uvicorn.Config'), \
+             patch('uvicorn.Server') as mock_server, \
+             patch('app.main.threading.Thread') as mock_thread:
+            
+            mock_server.return_value.started = False
+            mock_thread.return_value.is_alive.return_value = False
+            
+            mock_settings = MagicMock()
+            mock_settings.web_port = 8000
+            
+            with pytest.raises(RuntimeError, match="did not start on port 8000"):
+                start_web_server(mock_settings, MagicMock())
+    
     def test_start_web_server_exception_handling(self):
         """AI: Test web server startup exception handling."""
-        with patch('app.main.create_web_app', side_effect=Exception("App creation failed")):
+        with patch('app.web.routes.create_web_app', side_effect=Exception("App creation failed")):
             
             mock_settings = MagicMock()
             mock_settings.web_port = 8000
@@ -449,7 +491,7 @@ class TestCLIConfigurationConsistency:
              patch('app.main.DatabaseConnection'), \
              patch('app.main.DatabaseOperations'), \
              patch('app.main.start_web_server'), \
-             patch('time.sleep', side_effect=KeyboardInterrupt):  # Immediately interrupt the loop
+             patch('app.main.wait_for_shutdown'):  # Return as if Ctrl+C was pressed
             
             mock_settings = MagicMock()
             mock_settings.enable_mcp_server = True
@@ -481,7 +523,7 @@ class TestCLIConfigurationConsistency:
              patch('app.main.DatabaseConnection'), \
              patch('app.main.DatabaseOperations'), \
              patch('app.main.start_web_server'), \
-             patch('time.sleep', side_effect=KeyboardInterrupt):  # Immediately interrupt the loop
+             patch('app.main.wait_for_shutdown'):  # Return as if Ctrl+C was pressed
             
             mock_settings = MagicMock()
             mock_settings.enable_mcp_server = False
@@ -504,7 +546,7 @@ class TestCLIConfigurationConsistency:
              patch('app.main.DatabaseConnection'), \
              patch('app.main.DatabaseOperations'), \
              patch('app.main.start_web_server'), \
-             patch('time.sleep', side_effect=KeyboardInterrupt):  # Immediately interrupt the loop
+             patch('app.main.wait_for_shutdown'):  # Return as if Ctrl+C was pressed
             
             mock_settings = MagicMock()
             mock_settings.enable_mcp_server = False
@@ -530,3 +572,79 @@ class TestCLIConfigurationConsistency:
             assert "- nginx: /custom/nginx (patterns: ['access.log*', 'error.log*'])" in result.output
             assert "✓ Database: custom.db" in result.output
             assert "✓ Web server will start on port 7000" in result.output
+
+
+class TestEntryPoint:
+    """AI: Test the console entry point and its --mcp-stdio fast path."""
+
+    def test_stdio_db_name_parsing(self):
+        """AI: Test only plain stdio launches take the fast path."""
+        assert _stdio_db_name(["--mcp-stdio"]) == "log_analysis.db"
+        assert _stdio_db_name(["--db-name", "a.db", "--mcp-stdio"]) == "a.db"
+        assert _stdio_db_name(["--mcp-stdio", "--db-name=b.db"]) == "b.db"
+
+        assert _stdio_db_name([]) is None
+        assert _stdio_db_name(["--db-name", "a.db"]) is None
+        assert _stdio_db_name(["--mcp-stdio", "--db-name"]) is None
+        assert _stdio_db_name(["--mcp-stdio", "--help"]) is None
+        assert _stdio_db_name(["--mcp-stdio", "--nexus-dir", "/logs"]) is None
+
+    def test_main_stdio_fast_path(self, tmp_path):
+        """AI: Test a stdio launch starts the server without the Click CLI."""
+        db_path = tmp_path / "fast.db"
+        db_path.touch()
+
+        with patch.object(sys, 'argv', ['logminer', '--db-name', str(db_path), '--mcp-stdio']), \
+             patch('app.database.connection.DatabaseConnection') as mock_conn, \
+             patch('app.database.operations.DatabaseOperations') as mock_ops, \
+             patch('app.mcp.server.create_stdio_server') as mock_create, \
+             patch('app.main.cli') as mock_cli:
+            main()
+
+        mock_conn.assert_called_once_with(str(db_path), fresh_start=False)
+        mock_ops.assert_called_once_with(mock_conn.return_value)
+        mock_create.assert_called_once_with(mock_ops.return_value)
+        mock_create.return_value.start.assert_called_once()
+        mock_cli.assert_not_called()
+
+    def test_main_stdio_fast_path_database_not_found(self, tmp_path):
+        """AI: Test the fast path exits with an error for a missing database."""
+        with patch.object(sys, 'argv', ['logminer', '--db-name', str(tmp_path / "missing.db"), '--mcp-stdio']), \
+             patch('app.mcp.server.create_stdio_server') as mock_create:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        mock_create.assert_not_called()
+
+    def test_main_stdio_fast_path_outdated_database(self, tmp_path):
+        """AI: Test the fast path exits with an error when the schema is outdated."""
+        db_path = tmp_path / "old.db"
+        db_path.touch()
+
+        with patch.object(sys, 'argv', ['logminer', '--db-name', str(db_path), '--mcp-stdio']), \
+             patch('app.database.connection.DatabaseConnection', side_effect=RuntimeError("outdated")), \
+             patch('app.mcp.server.create_stdio_server') as mock_create:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        mock_create.assert_not_called()
+
+    def test_main_delegates_other_arguments_to_cli(self):
+        """AI: Test any other command line is handled by the Click CLI."""
+        with patch.object(sys, 'argv', ['logminer', '--process-only']), \
+             patch('app.main.cli') as mock_cli:
+            main()
+
+        mock_cli.assert_called_once_with()
+
+    def test_stdio_launch_skips_click_and_settings(self):
+        """AI: Test the fast path module does not import Click or the settings module."""
+        code = (
+            "import sys, app.__main__; "
+            "print(sorted(m for m in ('click', 'app.config', 'pydantic_settings') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "[]"
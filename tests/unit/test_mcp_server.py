@@ -70,6 +70,7 @@ class TestLogAnalysisMCPServer:
         assert "get_table_sample" in status["tools"]
         assert status["database_path"] == "/test/mock.db"
     
+    @patch('app.mcp.server.MCP_STARTUP_TIMEOUT', 0.01)
     @patch('threading.Thread')
     def test_server_start(self, mock_thread):
         """AI: Test MCP server startup process."""
@@ -119,6 +120,8 @@ class TestLogAnalysisMCPServer:
         # Verify server stopped
         assert not self.server._running
         mock_thread.join.assert_called_once_with(timeout=5)
+        with pytest.raises(RuntimeError):
+            self.server._db_executor.submit(print)  # Worker pool shut down
 
         captured = capsys.readouterr()
         # Logger outputs to stderr, not stdout
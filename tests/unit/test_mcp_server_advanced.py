@@ -16,15 +16,22 @@ import asyncio
 import json
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 
-from app.mcp.server import LogAnalysisMCPServer, TransportMode, create_stdio_server, create_network_server
+from app.mcp.server import (
+    LogAnalysisMCPServer, TransportMode, _new_event_loop, create_stdio_server, create_network_server
+)
 from app.database.operations import DatabaseOperations
 
+# Real coroutines, for tests that run the server transports end to end
+_RUN_NETWORK_SERVER = LogAnalysisMCPServer._run_network_server
+_RUN_STDIO_SERVER = LogAnalysisMCPServer._run_stdio_server
+
 
 @pytest.fixture(autouse=True)
 def patch_async_methods():
     """AI: Globally patch async methods to prevent coroutine warnings."""
     with patch.object(LogAnalysisMCPServer, '_run_stdio_server', new=Mock(return_value=None)) as mock_stdio, \
-         patch.object(LogAnalysisMCPServer, '_run_network_server', new=Mock(return_value=None)) as mock_network:
+         patch.object(LogAnalysisMCPServer, '_run_network_server', new=Mock(return_value=None)) as mock_network, \
+         patch('app.mcp.server.MCP_STARTUP_TIMEOUT', 0.01):  # Mocked threads never report readiness
         yield mock_stdio, mock_network
 
 
@@ -44,7 +51,8 @@ from app.database.operations import DatabaseOperations
 def patch_async_methods():
     """AI: Globally patch async methods to prevent coroutine warnings."""
     with patch.object(LogAnalysisMCPServer, '_run_stdio_server', new=Mock(return_value=None)) as mock_stdio, \
-         patch.object(LogAnalysisMCPServer, '_run_network_server', new=Mock(return_value=None)) as mock_network:
+         patch.object(LogAnalysisMCPServer, '_run_network_server', new=Mock(return_value=None)) as mock_network, \
+         patch('app.mcp.server.MCP_STARTUP_TIMEOUT', 0.01):  # Mocked threads never report readiness
         yield mock_stdio, mock_network
 
 
@@ -116,6 +124,21 @@ class TestMCPServerToolRegistration:
         assert "Table Sample (nginx_logs):" in formatted_result
         self.server.tools.get_table_sample.assert_called_once_with("nginx_logs", 10)
 
+    def test_tool_handlers_return_json(self):
+        """AI: Test handler responses are a title line followed by the result as JSON."""
+        self.server.tools.execute_sql_query = Mock(
+            return_value={'success': True, 'results': [{'path': '/a', 'hits': 2}]}
+        )
+        handlers = self.server._tool_handlers()
+        
+        text = handlers["execute_sql_query"]({'query': 'SELECT 1', 'columnar': True})
+        
+        title, body = text.split("\n", 1)
+        assert title == "Query Results:"
+        assert json.loads(body) == {'success': True, 'results': [{'path': '/a', 'hits': 2}]}
+        self.server.tools.execute_sql_query.assert_called_once_with('SELECT 1', columnar=True)
+        assert set(handlers) == set(self.server.get_status()["tools"])
+
     def test_call_tool_unknown_tool_error(self):
         """AI: Test call_tool handler for unknown tool name."""
         # Test error handling for unknown tool
@@ -229,8 +252,7 @@ class TestMCPServerTransport:
         mock_asyncio_run.assert_called_once()
 
     @patch('threading.Thread')
-    @patch('time.sleep')
-    def test_start_network_server(self, mock_sleep, mock_thread, capsys):
+    def test_start_network_server(self, mock_thread, capsys):
         """AI: Test starting server in network mode."""
         server = LogAnalysisMCPServer(
             db_ops=self.mock_db_ops,
@@ -246,6 +268,7 @@ class TestMCPServerTransport:
         # Mock server running state after thread start
         def set_running():
             server._running = True
+            server._started.set()
         
         mock_thread_instance.start.side_effect = set_running
         
@@ -260,11 +283,9 @@ class TestMCPServerTransport:
         # Verify thread creation and starting
         mock_thread.assert_called_once()
         mock_thread_instance.start.assert_called_once()
-        mock_sleep.assert_called_once_with(1)
 
     @patch('threading.Thread')
-    @patch('time.sleep')
-    def test_start_network_server_failure(self, mock_sleep, mock_thread, capsys):
+    def test_start_network_server_failure(self, mock_thread, capsys):
         """AI: Test network server startup failure."""
         server = LogAnalysisMCPServer(
             db_ops=self.mock_db_ops,
@@ -300,6 +321,24 @@ class TestMCPServerTransport:
         # Test error handling logic exists (covered in actual implementation)
         assert hasattr(server, '_running')
 
+    def test_run_stdio_server_reuses_initialization_options(self):
+        """AI: Test the stdio server runs with the options built at construction."""
+        server = LogAnalysisMCPServer(
+            db_ops=self.mock_db_ops,
+            transport_mode=TransportMode.STDIO
+        )
+        streams = MagicMock()
+        streams.__aenter__.return_value = ("read", "write")
+        
+        with patch('app.mcp.server.stdio_server', return_value=streams), \
+             patch.object(server.server, 'create_initialization_options') as mock_create, \
+             patch.object(server.server, 'run', new=AsyncMock()) as mock_run:
+            asyncio.run(_RUN_STDIO_SERVER(server))
+        
+        mock_create.assert_not_called()
+        mock_run.assert_awaited_once_with("read", "write", server._init_opts)
+        assert not server._running
+
     def test_run_network_server_lifecycle(self):
         """AI: Test network server lifecycle management."""
         server = LogAnalysisMCPServer(
@@ -366,10 +405,8 @@ class TestMCPServerErrors:
         test_data = {"value": float('nan')}
         
         result = self.server._format_json_response(test_data)
-        # JSON should handle this with default=str, so check if it works or errors
-        assert isinstance(result, str)
-        # Either succeeds or shows error message
-        assert "nan" in result.lower() or "error formatting response" in result.lower()
+        # NaN is not valid JSON; orjson encodes it as null
+        assert json.loads(result) == {"value": None}
 
     def test_get_status_with_missing_db_connection(self):
         """AI: Test status when database connection is missing."""
@@ -420,6 +457,28 @@ class TestMCPServerErrors:
         assert "Stopping MCP server" in captured.err
         assert "✓ MCP server stopped" in captured.err
 
+    def test_network_server_stop_wakes_server_thread(self):
+        """AI: Test stop() ends the network server loop immediately via its stop event."""
+        server = LogAnalysisMCPServer(db_ops=self.mock_db_ops)
+        with patch.object(LogAnalysisMCPServer, '_run_network_server', new=_RUN_NETWORK_SERVER), \
+             patch('app.mcp.server.MCP_STARTUP_TIMEOUT', 5.0):
+            server.start()
+            assert server._running
+            
+            server.stop()
+        
+        assert not server._server_thread.is_alive()
+
+
+    def test_new_event_loop_falls_back_to_asyncio(self):
+        """AI: Test the network server loop is a plain asyncio loop without uvloop."""
+        with patch('app.mcp.server.uvloop', None):
+            loop = _new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.AbstractEventLoop)
+            assert type(loop).__module__.startswith("asyncio")
+        finally:
+            loop.close()
 
 class TestMCPServerFactory:
     """AI: Test MCP server factory functions."""
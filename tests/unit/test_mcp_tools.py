@@ -10,6 +10,7 @@ Includes comprehensive error handling and security validation tests.
 """
 
 import pytest
+import sqlparse
 from unittest.mock import Mock, patch
 
 from app.mcp.tools import MCPTools
@@ -64,7 +65,10 @@ class TestMCPTools:
             'statistics': {}
         }
         self.mock_db_ops.get_database_schema.return_value = mock_schema
-        self.mock_db_ops.execute_query.return_value = [{"count": 100}]
+        self.mock_db_ops.execute_query.return_value = [
+            {"table_name": "nginx_logs", "count": 100},
+            {"table_name": "nexus_logs", "count": 40}
+        ]
         
         result = self.tools.list_database_schema()
         
@@ -85,6 +89,26 @@ class TestMCPTools:
         assert "columns" in table
         assert "indexes" in table
         assert "row_count" in table
+        assert [t["row_count"] for t in tables] == [100, 40]
+        
+        # Structure only, and both tables are counted by a single rowid probe
+        self.mock_db_ops.get_database_schema.assert_called_once_with(include_statistics=False)
+        self.mock_db_ops.execute_query.assert_called_once()
+        count_sql = self.mock_db_ops.execute_query.call_args.args[0]
+        assert "UNION ALL" in count_sql
+        assert "MAX(rowid)" in count_sql
+    
+    def test_list_database_schema_exact_counts(self):
+        """AI: Test fast_count=False counts rows and is cached separately."""
+        self.mock_db_ops.get_database_schema.return_value = {'database': '/test/mock.db', 'tables': {}}
+        self.mock_db_ops.execute_query.return_value = []
+        self.mock_db_ops.data_version.return_value = 1
+        
+        self.tools.list_database_schema()
+        self.tools.list_database_schema(fast_count=False)
+        
+        assert self.mock_db_ops.execute_query.call_count == 2
+        assert "COUNT(*)" in self.mock_db_ops.execute_query.call_args.args[0]
     
     def test_list_database_schema_error_handling(self):
         """AI: Test database schema listing error handling."""
@@ -99,6 +123,40 @@ class TestMCPTools:
         assert "Failed to retrieve database schema" in result["message"]
         assert "operation" in result["details"]
     
+    def test_list_database_schema_reused_until_data_changes(self):
+        """AI: Test the schema response is cached per database data_version."""
+        self.mock_db_ops.get_database_schema.return_value = {
+            'database': '/test/mock.db',
+            'tables': {'nginx_logs': {'columns': []}}
+        }
+        self.mock_db_ops.execute_query.return_value = [{"table_name": "nginx_logs", "count": 5}]
+        self.mock_db_ops.data_version.return_value = 1
+        
+        first = self.tools.list_database_schema()
+        first["tables"][0]["row_count"] = 0  # Caller changes must not reach the cache
+        second = self.tools.list_database_schema()
+        assert second is not first
+        assert second["tables"][0]["row_count"] == 5
+        assert self.mock_db_ops.get_database_schema.call_count == 1
+        
+        # Another connection committed: counts are recomputed
+        self.mock_db_ops.data_version.return_value = 2
+        self.mock_db_ops.execute_query.return_value = [{"table_name": "nginx_logs", "count": 7}]
+        
+        assert self.tools.list_database_schema()["tables"][0]["row_count"] == 7
+        assert self.mock_db_ops.get_database_schema.call_count == 2
+    
+    def test_list_database_schema_errors_not_cached(self):
+        """AI: Test a failed schema lookup is retried on the next call."""
+        self.mock_db_ops.data_version.return_value = 1
+        self.mock_db_ops.get_database_schema.side_effect = [
+            Exception("database is locked"),
+            {'database': '/test/mock.db', 'tables': {}}
+        ]
+        
+        assert self.tools.list_database_schema()["error"] == "database_access_error"
+        assert self.tools.list_database_schema()["total_tables"] == 0
+    
     def test_execute_sql_query_valid_select(self):
         """AI: Test valid SELECT query execution."""
         # Mock successful query execution
@@ -122,7 +180,99 @@ class TestMCPTools:
         assert result["columns"] == ["id", "ip_address", "method"]
         assert result["query_text"] == "SELECT * FROM nginx_logs LIMIT 2"
         assert isinstance(result["execution_time"], float)
+        
+        # Result rows are handed through, not copied per row
+        assert result["results"] is self.mock_db_ops.execute_query.return_value
+    
+    def test_execute_sql_query_columnar(self):
+        """AI: Test columnar results carry column names once and rows as value lists."""
+        self.mock_db_ops.execute_query_columnar.return_value = (["id", "method"], [[1, "GET"], [2, "POST"]])
+        
+        result = self.tools.execute_sql_query("SELECT id, method FROM nginx_logs", 100, columnar=True)
+        
+        self.mock_db_ops.execute_query_columnar.assert_called_once_with(
+            "SELECT id, method FROM nginx_logs", limit=100
+        )
+        self.mock_db_ops.execute_query.assert_not_called()
+        assert "results" not in result
+        assert result["columns"] == ["id", "method"]
+        assert result["rows"] == [[1, "GET"], [2, "POST"]]
+        assert result["row_count"] == 2
+        assert result["query_text"] == "SELECT id, method FROM nginx_logs"
     
+    def test_execute_sql_query_reused_until_data_changes(self):
+        """AI: Test repeated queries are answered from the cache until data_version changes."""
+        self.mock_db_ops.data_version.return_value = 1
+        self.mock_db_ops.execute_query.return_value = [{"count": 5}]
+
+        first = self.tools.execute_sql_query("SELECT COUNT(*) AS count FROM nginx_logs", 100)
+        # Reformatted repeat shares the entry
+        assert self.tools.execute_sql_query("SELECT COUNT(*) AS count\n  FROM nginx_logs ", 100) == first
+        assert self.mock_db_ops.execute_query.call_count == 1
+
+        # Different limit or result shape is a separate entry
+        self.tools.execute_sql_query("SELECT COUNT(*) AS count FROM nginx_logs", 10)
+        assert self.mock_db_ops.execute_query.call_count == 2
+
+        # Another connection committed: the query runs again
+        self.mock_db_ops.data_version.return_value = 2
+        self.mock_db_ops.execute_query.return_value = [{"count": 7}]
+
+        assert self.tools.execute_sql_query("SELECT COUNT(*) AS count FROM nginx_logs", 100)["results"] == [{"count": 7}]
+        assert self.mock_db_ops.execute_query.call_count == 3
+
+    def test_execute_sql_query_cache_hits_are_copies(self):
+        """AI: Test modifying a returned result leaves the cached entry intact."""
+        self.mock_db_ops.data_version.return_value = 1
+        self.mock_db_ops.execute_query.return_value = [{"count": 5}]
+
+        first = self.tools.execute_sql_query("SELECT COUNT(*) AS count FROM nginx_logs", 100)
+        first["results"].append({"count": 6})
+        first["row_count"] = 2
+        second = self.tools.execute_sql_query("SELECT COUNT(*) AS count FROM nginx_logs", 100)
+        second["results"].clear()
+
+        third = self.tools.execute_sql_query("SELECT COUNT(*) AS count FROM nginx_logs", 100)
+        assert third["results"] == [{"count": 5}]
+        assert third["row_count"] == 1
+        assert self.mock_db_ops.execute_query.call_count == 1
+
+    def test_execute_sql_query_cache_expires(self):
+        """AI: Test cached results are recomputed after the TTL."""
+        self.mock_db_ops.data_version.return_value = 1
+        self.mock_db_ops.execute_query.return_value = [{"count": 5}]
+
+        with patch('app.mcp.tools.time.monotonic', side_effect=[0.0, 10.0, 100.0, 100.0]):
+            self.tools.execute_sql_query("SELECT 1", 100)
+            self.tools.execute_sql_query("SELECT 1", 100)
+            assert self.mock_db_ops.execute_query.call_count == 1
+
+            self.tools.execute_sql_query("SELECT 1", 100)
+            assert self.mock_db_ops.execute_query.call_count == 2
+
+    def test_execute_sql_query_cache_keeps_literal_whitespace(self):
+        """AI: Test queries differing only inside a string literal are not merged."""
+        self.mock_db_ops.data_version.return_value = 1
+        self.mock_db_ops.execute_query.return_value = []
+
+        self.tools.execute_sql_query("SELECT * FROM nginx_logs WHERE path = 'a  b'", 100)
+        self.tools.execute_sql_query("SELECT * FROM nginx_logs WHERE path = 'a b'", 100)
+
+        assert self.mock_db_ops.execute_query.call_count == 2
+
+    def test_execute_sql_query_cache_evicts_least_recently_used(self):
+        """AI: Test the cache is bounded and drops the least recently used entry."""
+        self.mock_db_ops.data_version.return_value = 1
+        self.mock_db_ops.execute_query.return_value = []
+
+        with patch('app.mcp.tools._QUERY_CACHE_SIZE', 2):
+            self.tools.execute_sql_query("SELECT 1", 100)
+            self.tools.execute_sql_query("SELECT 2", 100)
+            self.tools.execute_sql_query("SELECT 1", 100)  # Refreshes SELECT 1
+            self.tools.execute_sql_query("SELECT 3", 100)  # Evicts SELECT 2
+
+        assert [key[0] for key in self.tools._query_cache] == ["SELECT 1", "SELECT 3"]
+
     def test_execute_sql_query_security_violation(self):
         """AI: Test SQL query security validation."""
         # Test non-SELECT queries
@@ -158,14 +308,9 @@ class TestMCPTools:
     def test_get_table_sample_valid_table(self):
         """AI: Test valid table sampling."""
         # Mock successful sampling
-        self.mock_db_ops.execute_query.side_effect = [
-            # Sample data query
-            [
-                {"id": 1, "ip_address": "192.168.1.1", "method": "GET"},
-                {"id": 2, "ip_address": "192.168.1.2", "method": "POST"}
-            ],
-            # Count query
-            [{"total": 150}]
+        self.mock_db_ops.execute_query.return_value = [
+            {"id": 2, "ip_address": "192.168.1.2", "method": "POST", "_total_rows": 150},
+            {"id": 1, "ip_address": "192.168.1.1", "method": "GET", "_total_rows": 150}
         ]
         
         result = self.tools.get_table_sample("nginx_logs", 10)
@@ -183,6 +328,12 @@ class TestMCPTools:
         assert result["sample_size"] == 2
         assert result["total_rows"] == 150
         assert result["columns"] == ["id", "ip_address", "method"]
+        
+        # One query; the limit is bound, not interpolated, so the statement text is reusable
+        self.mock_db_ops.execute_query.assert_called_once()
+        sample_call = self.mock_db_ops.execute_query.call_args
+        assert sample_call.args[0].endswith("ORDER BY id DESC LIMIT :limit")
+        assert sample_call.kwargs["params"] == {"limit": 10}
     
     def test_get_table_sample_invalid_table(self):
         """AI: Test table sampling with invalid table name."""
@@ -238,6 +389,30 @@ class TestMCPTools:
         for query in invalid_queries:
             assert not self.tools._is_select_query(query), f"Query should be invalid: {query}"
     
+    def test_is_select_query_caches_parse_result(self):
+        """AI: Test repeated validation of the same query reuses the cached result."""
+        query = "SELECT status_code, COUNT(*) FROM nginx_logs GROUP BY status_code"
+        
+        with patch('app.mcp.tools.sqlparse.parse', wraps=sqlparse.parse) as mock_parse:
+            assert self.tools._is_select_query(query)
+            assert self.tools._is_select_query(query)
+            assert not self.tools._is_select_query("PRAGMA table_info(nginx_logs)")
+        
+        # Cached or rejected by the SELECT prefix check without parsing
+        assert mock_parse.call_count <= 1
+    
+    def test_is_select_query_parses_only_multi_statement_queries(self):
+        """AI: Test single SELECT statements skip sqlparse and separators do not."""
+        with patch('app.mcp.tools.sqlparse.parse', wraps=sqlparse.parse) as mock_parse:
+            assert self.tools._is_select_query("SELECT method FROM nginx_logs WHERE path = '/fast'")
+            assert self.tools._is_select_query("SELECT method FROM nginx_logs WHERE path = '/fast/end';  ")
+            assert mock_parse.call_count == 0
+            
+            assert self.tools._is_select_query("SELECT path FROM nginx_logs WHERE path = 'a;b'")
+            assert not self.tools._is_select_query("SELECT 1;; DELETE FROM nginx_logs")
+            assert not self.tools._is_select_query("SELECT 1 -- ;\nFROM x; ATTACH 'other.db' AS o")
+            assert mock_parse.call_count == 3
+    
     def test_is_select_query_malformed_sql(self):
         """AI: Test SELECT query validation with malformed SQL."""
         definitely_invalid_queries = [
@@ -280,10 +455,7 @@ class TestMCPTools:
     def test_get_table_sample_empty_table(self):
         """AI: Test table sampling with empty table."""
         # Mock empty table responses
-        self.mock_db_ops.execute_query.side_effect = [
-            [],  # Empty sample data
-            [{"total": 0}]  # Zero count
-        ]
+        self.mock_db_ops.execute_query.return_value = []  # Empty sample data
         
         result = self.tools.get_table_sample("nginx_logs", 10)
         
@@ -7,6 +7,10 @@ providing comprehensive coverage of database operations.
 
 import pytest
 from datetime import datetime
+from unittest.mock import patch
+
+from sqlalchemy.orm import Session
+
 from app.database.nexus_database import NexusLogDatabase
 from app.database.connection import DatabaseConnection
 
@@ -79,6 +83,28 @@ class TestNexusDatabase:
         count = temp_db.batch_insert(sample_nexus_data)
         assert count == 2
     
+    def test_batch_insert_fills_omitted_fields(self, temp_db, sample_nexus_data):
+        """AI: Test rows with differing keys insert with defaults and created_at set."""
+        temp_db.batch_insert(sample_nexus_data)
+        
+        preview = {row['ip_address']: row for row in temp_db.get_preview()}
+        assert preview['192.168.1.101']['thread_info'] is None
+        assert preview['192.168.1.101']['remote_user'] is None
+        assert preview['192.168.1.100']['thread_info'] == 'qtp1234567890-45'
+        assert all(row['created_at'] is not None for row in preview.values())
+    
+    def test_batch_insert_consumes_generator_in_chunks(self, temp_db, sample_nexus_data):
+        """AI: Test generator input is inserted in BATCH_SIZE chunks."""
+        temp_db.BATCH_SIZE = 3
+        entries = (dict(sample_nexus_data[i % 2], file_source=f'nexus{i}.log') for i in range(7))
+        
+        with patch.object(Session, 'execute', autospec=True, side_effect=Session.execute) as execute:
+            count = temp_db.batch_insert(entries)
+        
+        assert count == 7
+        assert [len(call.args[2]) for call in execute.call_args_list] == [3, 3, 1]
+        assert len(temp_db.get_preview(limit=10)) == 7
+    
     def test_batch_insert_empty_list(self, temp_db):
         """AI: Test batch insert with empty list."""
         count = temp_db.batch_insert([])
@@ -119,6 +145,38 @@ class TestNexusDatabase:
         assert 'timestamp' in preview[0]
         assert 'id' in preview[0]
     
+    def test_get_logs_by_timerange(self, temp_db, sample_nexus_data):
+        """AI: Test time-range query returns newest first with ISO timestamps."""
+        temp_db.batch_insert(sample_nexus_data)
+        
+        logs = temp_db.get_logs_by_timerange(
+            datetime(2024, 1, 15, 10, 0, 0), datetime(2024, 1, 15, 11, 0, 0)
+        )
+        
+        assert [log['ip_address'] for log in logs] == ['192.168.1.101', '192.168.1.100']
+        assert logs[0]['timestamp'] == '2024-01-15T10:31:15'
+        assert temp_db.get_logs_by_timerange(
+            datetime(2023, 1, 1), datetime(2023, 12, 31)
+        ) == []
+    
+    def test_aggregations_derive_repository_user_and_action(self, temp_db, sample_nexus_data):
+        """AI: Test repository/user/action aggregations map onto existing columns."""
+        extra = dict(
+            sample_nexus_data[0],
+            remote_user='admin',
+            path='/repository/maven-public/other.pom',
+        )
+        temp_db.batch_insert(sample_nexus_data + [extra])
+        
+        assert temp_db.get_top_repositories() == [
+            {'repository': 'maven-public', 'activity_count': 1}
+        ]
+        assert temp_db.get_user_activity() == [{'username': 'admin', 'activity_count': 1}]
+        assert temp_db.get_action_distribution() == [
+            {'action': 'GET', 'count': 2},
+            {'action': 'POST', 'count': 1},
+        ]
+    
     def test_get_preview_limit_parameter(self, temp_db, sample_nexus_data):
         """AI: Test that preview respects the limit parameter."""
         # Insert data
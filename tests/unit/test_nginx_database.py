@@ -5,10 +5,15 @@ Tests the main methods that exist and work with the current model,
 providing comprehensive coverage of database operations.
 """
 
+import sqlite3
+
 import pytest
 from datetime import datetime
+from sqlalchemy import event
+from app.database.base import CommonLogDatabase
 from app.database.nginx_database import NginxLogDatabase
 from app.database.connection import DatabaseConnection
+from app.database.models import NginxLog
 
 
 class TestNginxDatabase:
@@ -127,6 +132,122 @@ class TestNginxDatabase:
         preview = temp_db.get_preview(limit=1)
         assert len(preview) == 1
     
+    def test_aggregations_return_grouped_counts(self, temp_db, sample_nginx_data):
+        """AI: Test top paths and status distribution queries."""
+        temp_db.batch_insert(sample_nginx_data + sample_nginx_data[:1])
+        
+        assert temp_db.get_top_paths(limit=1) == [{'path': '/api/v1/users', 'hits': 2}]
+        assert temp_db.get_status_code_distribution() == [
+            {'status_code': 200, 'count': 2},
+            {'status_code': 201, 'count': 1},
+        ]
+    
+    def test_raw_log_is_stored_compressed(self, temp_db, sample_nginx_data):
+        """AI: Test raw_log is a compressed BLOB decoded by the ORM and raw_log_text()."""
+        temp_db.batch_insert(sample_nginx_data)
+        connection = temp_db.db_connection
+        
+        stored = connection.execute_raw_sql(
+            "SELECT raw_log, raw_log_text(raw_log) AS text FROM nginx_logs ORDER BY id"
+        )
+        assert isinstance(stored[0]['raw_log'], bytes)
+        assert len(stored[0]['raw_log']) < len(sample_nginx_data[0]['raw_log'])
+        assert stored[0]['text'] == sample_nginx_data[0]['raw_log']
+        
+        with temp_db.get_session() as session:
+            assert session.query(NginxLog.raw_log).first()[0] == sample_nginx_data[0]['raw_log']
+    
+    def test_raw_log_is_returned_as_text_by_execute_query(self, temp_db, sample_nginx_data):
+        """AI: Test raw SQL results carry decoded text, also under an alias, and filter via raw_log_text()."""
+        temp_db.batch_insert(sample_nginx_data)
+        common = CommonLogDatabase(temp_db.db_connection)
+        
+        matches = common.execute_query(
+            "SELECT raw_log AS r FROM nginx_logs WHERE raw_log_text(raw_log) LIKE :pattern",
+            params={'pattern': f"%{sample_nginx_data[0]['path']}%"}
+        )
+        
+        assert matches == [{'r': sample_nginx_data[0]['raw_log']}]
+        
+        columns = common.get_database_schema(include_statistics=False)['tables']['nginx_logs']['columns']
+        raw_log = next(column for column in columns if column['name'] == 'raw_log')
+        assert raw_log['type'] == 'BLOB'
+        assert 'raw_log_text(raw_log)' in raw_log['description']
+    
+    def test_schema_needs_no_application_functions(self, temp_db, sample_nginx_data):
+        """AI: Test a plain sqlite3 connection (no registered functions) can read the table."""
+        temp_db.batch_insert(sample_nginx_data)
+        
+        plain = sqlite3.connect(temp_db.db_connection.db_path)
+        try:
+            plain.execute("PRAGMA trusted_schema=OFF")
+            rows = plain.execute("SELECT * FROM nginx_logs").fetchall()
+        finally:
+            plain.close()
+        assert len(rows) == 2
+    
+    def test_raw_log_capture_disabled_stores_null(self, temp_db, sample_nginx_data):
+        """AI: Test raw_log is left NULL when capture_raw_log is off."""
+        temp_db.capture_raw_log = False
+        assert temp_db.batch_insert(sample_nginx_data) == 2
+        
+        stored = temp_db.db_connection.execute_raw_sql("SELECT raw_log, path FROM nginx_logs ORDER BY id")
+        assert [row['raw_log'] for row in stored] == [None, None]
+        assert stored[0]['path'] == sample_nginx_data[0]['path']
+    
+    def test_batch_insert_does_not_fetch_generated_ids(self, temp_db, sample_nginx_data):
+        """AI: Test batch insert is one executemany without RETURNING or a flush."""
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, executemany))
+        
+        engine = temp_db.db_connection.engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            temp_db.batch_insert(sample_nginx_data)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        
+        inserts = [(sql, many) for sql, many in statements if sql.startswith("INSERT")]
+        assert len(inserts) == 1
+        assert inserts[0][1] is True
+        assert "RETURNING" not in inserts[0][0]
+    
+    def test_timerange_query_is_an_index_range_scan(self, temp_db):
+        """AI: Test get_logs_by_timerange is answered from the timestamp index."""
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "FROM nginx_logs" in statement:
+                statements.append((statement, parameters))
+        
+        engine = temp_db.db_connection.engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            temp_db.get_logs_by_timerange(datetime(2024, 1, 15), datetime(2024, 1, 16), limit=10)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        
+        assert len(statements) == 1
+        sql, parameters = statements[0]
+        with temp_db.db_connection.readonly_connection() as connection:
+            plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+        assert any("USING INDEX idx_nginx_timestamp_id" in row[-1] for row in plan)
+    
+    def test_preview_datetimes_match_isoformat(self, temp_db, sample_nginx_data):
+        """AI: Test SQL-side datetime formatting matches datetime.isoformat()."""
+        precise = datetime(2024, 1, 15, 10, 32, 0, 123000)
+        temp_db.batch_insert(sample_nginx_data + [dict(sample_nginx_data[0], timestamp=precise)])
+        
+        timestamps = [row['timestamp'] for row in temp_db.get_preview()]
+        assert timestamps == [
+            precise.isoformat(),
+            sample_nginx_data[1]['timestamp'].isoformat(),
+            sample_nginx_data[0]['timestamp'].isoformat(),
+        ]
+        assert datetime.fromisoformat(temp_db.get_preview(limit=1)[0]['created_at'])
+    
     def test_database_error_handling(self, temp_db):
         """AI: Test that database errors are handled gracefully."""
         # Test with invalid data that should cause database error
@@ -61,6 +61,18 @@ class TestNginxLogProcessor:
         assert result['user_agent'] == 'Mozilla/5.0 (compatible)'
         assert result['file_source'] == 'test.log'
 
+    def test_parsed_method_and_version_are_interned(self):
+        """AI: Test low-cardinality fields share one string object across rows."""
+        first = self.processor.parse_log_line(
+            '127.0.0.1 - - [29/May/2025:14:30:45 -0400] "PATCH /a HTTP/2.0" 200 1 "-" "-"', 1, "test.log"
+        )
+        second = self.processor.parse_log_line(
+            '127.0.0.2 - - [29/May/2025:14:30:46 -0400] "PATCH /b HTTP/2.0" 200 1 "-" "-"', 2, "test.log"
+        )
+
+        assert first['method'] is second['method']
+        assert first['http_version'] is second['http_version']
+
     def test_parse_nginx_log_with_dash_response_size(self):
         """AI: Test parsing nginx log with dash for response size."""
         log_line = '192.168.1.100 - - [01/Jan/2025:00:00:00 +0000] "HEAD /health HTTP/1.1" 204 - "-" "HealthCheck/1.0"'
@@ -104,6 +104,7 @@ class TestLogProcessingOrchestrator:
         self.mock_settings.nginx_dir = "/test/nginx"
         self.mock_settings.nexus_dir = "/test/nexus"
         self.mock_settings.chunk_size = 100
+        self.mock_settings.archive_cache_dir = None
         
         # Create mock database operations
         self.mock_db_ops = Mock(spec=DatabaseOperations)
@@ -217,7 +218,29 @@ class TestLogProcessingOrchestrator:
             assert stats['entries_parsed'] == 90   # 45 * 2
             assert stats['parse_errors'] == 10     # 5 * 2
             assert mock_process.call_count == 2
-    
+
+    def test_process_logs_by_type_consumes_discovery_lazily(self):
+        """AI: Test each file is processed before discovery yields the next one."""
+        events = []
+
+        def discover():
+            for name in ("access.log", "access.log.1"):
+                events.append(f"found {name}")
+                yield Path(f"/test/{name}"), f"nginx:{name}"
+
+        def process(file_path, source_description, processor, log_type):
+            events.append(f"processed {file_path.name}")
+            return {'lines_processed': 1, 'entries_parsed': 1, 'parse_errors': 0}
+
+        with patch.object(self.orchestrator, '_process_single_file', side_effect=process):
+            stats = self.orchestrator._process_logs_by_type("nginx", discover, Mock())
+
+        assert events == [
+            "found access.log", "processed access.log",
+            "found access.log.1", "processed access.log.1"
+        ]
+        assert stats['files_processed'] == 2
+
     @patch('app.processing.orchestrator.LogFileDiscovery')
     def test_process_all_logs_integration(self, mock_discovery_class):
         """AI: Test complete processing workflow integration."""
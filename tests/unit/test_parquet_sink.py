@@ -0,0 +1,114 @@
+"""
+AI: Tests for the optional Parquet analytics archive.
+
+Skipped unless the 'analytics' extra (pyarrow, duckdb) is installed.
+"""
+
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("duckdb")
+
+from app.database.connection import DatabaseConnection
+from app.database.operations import DatabaseOperations
+
+
+class TestParquetSink:
+    """AI: Test batch inserts are archived and analytics read from Parquet."""
+
+    @pytest.fixture
+    def make_ops(self, tmp_path):
+        """AI: Factory for operations with a Parquet archive below tmp_path."""
+        connections = []
+        
+        def factory():
+            db_connection = DatabaseConnection(str(tmp_path / "test.db"), fresh_start=True)
+            connections.append(db_connection)
+            return DatabaseOperations(db_connection, parquet_dir=str(tmp_path / "parquet"))
+        
+        yield factory
+        
+        for db_connection in connections:
+            db_connection.close()
+
+    def _entries(self, paths):
+        """AI: Build nginx entries for the given request paths."""
+        return [
+            {
+                'ip_address': '10.0.0.1',
+                'timestamp': datetime(2025, 1, 1 + i % 2, 12, 0, 0),
+                'method': 'GET',
+                'path': path,
+                'http_version': 'HTTP/1.1',
+                'status_code': 200,
+                'raw_log': 'line',
+                'file_source': 'logs/access.log',
+            }
+            for i, path in enumerate(paths)
+        ]
+
+    def test_batch_insert_is_archived_and_queried_with_duckdb(self, make_ops, tmp_path):
+        """AI: Test committed rows are written to Parquet and used for top paths."""
+        db_ops = make_ops()
+        db_ops.batch_insert_nginx_logs(self._entries(['/a', '/b', '/a']))
+
+        assert db_ops.get_nginx_top_paths(limit=1) == [{'path': '/a', 'hits': 2}]
+        assert list((tmp_path / "parquet" / "nginx_logs").rglob("*.parquet"))
+        assert db_ops.get_nginx_status_distribution() == [{'status_code': 200, 'count': 3}]
+
+    def test_failed_insert_is_not_archived(self, make_ops):
+        """AI: Test rows of a rolled-back batch never reach the archive."""
+        db_ops = make_ops()
+        invalid = self._entries(['/a'])
+        invalid[0]['timestamp'] = None  # NOT NULL violation
+
+        with pytest.raises(Exception):
+            db_ops.batch_insert_nginx_logs(invalid)
+
+        assert db_ops.nginx.parquet_sink.archived_rows() == 0
+        assert db_ops.nginx._parquet_complete() is False
+
+    def test_fresh_start_discards_previous_dataset(self, make_ops):
+        """AI: Test the archive is reset together with a fresh database."""
+        db_ops = make_ops()
+        db_ops.batch_insert_nginx_logs(self._entries(['/a']))
+        db_ops.close()
+
+        db_ops = make_ops()
+        assert db_ops.nginx.parquet_sink.archived_rows() == 0
+        assert db_ops.nginx._parquet_complete() is False
+
+    def test_committed_rows_are_visible_to_another_reader(self, make_ops, tmp_path):
+        """AI: Test a second sink (e.g. the web process) sees rows flushed on commit."""
+        db_ops = make_ops()
+        db_ops.batch_insert_nginx_logs(self._entries(['/a', '/b']))
+
+        reader = DatabaseOperations(
+            DatabaseConnection(str(tmp_path / "test.db"), fresh_start=False),
+            parquet_dir=str(tmp_path / "parquet")
+        )
+        try:
+            assert reader.nginx._parquet_complete() is True
+            assert reader.get_nginx_status_distribution() == [{'status_code': 200, 'count': 2}]
+        finally:
+            reader.db_connection.close()
+
+    def test_incomplete_archive_falls_back_to_sqlite(self, make_ops):
+        """AI: Test rows missing from the archive are still counted via SQLite."""
+        db_ops = make_ops()
+        db_ops.batch_insert_nginx_logs(self._entries(['/a']))
+        sink, db_ops.nginx.parquet_sink = db_ops.nginx.parquet_sink, None
+        db_ops.batch_insert_nginx_logs(self._entries(['/a']))  # Not archived
+        db_ops.nginx.parquet_sink = sink
+
+        assert db_ops.nginx._parquet_complete() is False
+        assert db_ops.get_nginx_top_paths(limit=1) == [{'path': '/a', 'hits': 2}]
+
+    def test_nexus_rows_are_not_archived(self, make_ops, tmp_path):
+        """AI: Test only the nginx table, whose aggregations read it, is archived."""
+        db_ops = make_ops()
+
+        assert db_ops.nexus.parquet_sink is None
+        assert not (tmp_path / "parquet" / "nexus_logs").exists()
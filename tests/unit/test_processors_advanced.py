@@ -77,8 +77,9 @@ class TestProcessorsAdvanced:
                 # Should print unexpected error
                 mock_logger_error.assert_called_once()
                 assert "UNEXPECTED_ERROR" in mock_logger_error.call_args[0][0]
-                # Check that the error message is in the arguments (not the format string)
-                assert "Unexpected error" in str(mock_logger_error.call_args[0][1])
+                # Source location and error are passed as arguments (not in the format string)
+                message, *args = mock_logger_error.call_args[0]
+                assert message % tuple(args) == "UNEXPECTED_ERROR: test.log:1 - Unexpected error"
     
     def test_parse_timestamp_apache_style_format(self):
         """AI: Test timestamp parsing for Apache-style format - covers lines 177-179."""
@@ -204,8 +205,9 @@ class TestNginxProcessorAdvanced:
                 # Should print unexpected error
                 mock_logger_error.assert_called_once()
                 assert "UNEXPECTED_ERROR" in mock_logger_error.call_args[0][0]
-                # Check that the error message is in the arguments (not the format string)
-                assert "Unexpected error" in str(mock_logger_error.call_args[0][1])
+                # Source location and error are passed as arguments (not in the format string)
+                message, *args = mock_logger_error.call_args[0]
+                assert message % tuple(args) == "UNEXPECTED_ERROR: test.log:1 - Unexpected error"
     
     def test_parse_request_field_json_rpc_request(self):
         """AI: Test parsing JSON-RPC style request - covers lines 179-180."""